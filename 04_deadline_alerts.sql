@@ -0,0 +1,107 @@
+-- ============================================================
+-- KeralaSeva AI – Scholarship Navigator
+-- FILE: 04_deadline_alerts.sql
+-- PURPOSE: Set-based deadline alert generation
+-- Run after 03_matching_and_rls.sql
+-- ============================================================
+
+-- ----------------------------------------------------------------
+-- FUNCTION: generate_deadline_alerts
+--
+-- Computes every (user, scholarship) pair where:
+--   - the user matches the scholarship (same rules as
+--     get_matching_scholarships – keep the two in sync)
+--   - the deadline falls in [p_today, p_today + alert_before_days]
+--     (alert_before_days from user_alert_preferences, default 7)
+-- and inserts one notification per pair in a single statement.
+-- Pairs that were already notified are skipped by the
+-- UNIQUE(user_id, scholarship_id) constraint (ON CONFLICT DO NOTHING).
+--
+-- Returns one row: users_processed, notifications_created
+-- ----------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.generate_deadline_alerts(p_today DATE DEFAULT CURRENT_DATE)
+RETURNS TABLE (
+    users_processed       INTEGER,
+    notifications_created INTEGER
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_users   INTEGER;
+    v_created INTEGER;
+BEGIN
+    -- Same population as the per-user job: every profile plus every
+    -- user that has an alert preference row
+    SELECT COUNT(*) INTO v_users
+    FROM (
+        SELECT id FROM public.profiles
+        UNION
+        SELECT user_id FROM public.user_alert_preferences
+    ) u;
+
+    WITH due AS (
+        SELECT DISTINCT
+            p.id       AS user_id,
+            s.id       AS scholarship_id,
+            s.name,
+            s.deadline
+        FROM
+            public.profiles p
+            LEFT JOIN public.user_alert_preferences uap ON uap.user_id = p.id
+            INNER JOIN public.scholarships s
+                ON  s.is_active = TRUE
+                AND s.deadline >= p_today
+                AND s.deadline <= p_today + COALESCE(uap.alert_before_days, 7)
+            INNER JOIN public.eligibility e ON e.scholarship_id = s.id
+        WHERE
+            -- ── Income Filter ──────────────────────────────────────
+            (s.income_limit = 0 OR s.income_limit >= p.income)
+
+            -- ── Community Filter ───────────────────────────────────
+            AND (
+                e.community = p.community
+                OR e.community = 'Any'
+                OR (p.community = 'Muslim' AND e.community = 'Minority')
+                OR (p.community = 'SC/ST'  AND e.community IN ('SC', 'ST'))
+                OR (p.community = 'SC'     AND e.community = 'SC/OBC')
+                OR (p.community = 'OBC'    AND e.community = 'SC/OBC')
+            )
+
+            -- ── Gender Filter ──────────────────────────────────────
+            AND (e.gender = p.gender OR e.gender = 'Any')
+
+            -- ── Education Filter ───────────────────────────────────
+            AND (
+                e.education_level = p.education_level
+                OR e.education_level = 'Any'
+                OR (
+                    e.education_level = 'PostMatric'
+                    AND p.education_level IN ('PostMatric','Diploma','Degree','PG','PhD','Technical','Engineering','Professional')
+                )
+            )
+    ),
+    inserted AS (
+        INSERT INTO public.notifications (user_id, scholarship_id, message, is_read)
+        SELECT
+            d.user_id,
+            d.scholarship_id,
+            format(
+                '⏰ Deadline Alert: ''%s'' deadline is on %s (%s days remaining). Apply now!',
+                d.name, d.deadline, d.deadline - p_today
+            ),
+            FALSE
+        FROM due d
+        ON CONFLICT (user_id, scholarship_id) DO NOTHING
+        RETURNING 1
+    )
+    SELECT COUNT(*) INTO v_created FROM inserted;
+
+    RETURN QUERY SELECT v_users, v_created;
+END;
+$$;
+
+-- Server-side job only: callable with the service role key, not by users
+REVOKE ALL ON FUNCTION public.generate_deadline_alerts(DATE) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.generate_deadline_alerts(DATE) TO service_role;
@@ -0,0 +1,233 @@
+-- ============================================================
+-- KeralaSeva AI – Scholarship Navigator
+-- FILE: 05_incremental_alerts.sql
+-- PURPOSE: Incremental deadline alerts driven by a persistent watermark
+-- Run after 04_deadline_alerts.sql
+-- ============================================================
+
+-- ----------------------------------------------------------------
+-- CHANGE TRACKING
+-- updated_at on preferences and scholarships; any eligibility change
+-- touches its scholarship's updated_at so it counts as a changed
+-- scholarship. profiles.updated_at already exists (01_schema.sql).
+-- ----------------------------------------------------------------
+ALTER TABLE public.user_alert_preferences
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW();
+ALTER TABLE public.scholarships
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW();
+
+DROP TRIGGER IF EXISTS trg_alert_prefs_updated_at ON public.user_alert_preferences;
+CREATE TRIGGER trg_alert_prefs_updated_at
+    BEFORE UPDATE ON public.user_alert_preferences
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS trg_scholarships_updated_at ON public.scholarships;
+CREATE TRIGGER trg_scholarships_updated_at
+    BEFORE UPDATE ON public.scholarships
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE OR REPLACE FUNCTION touch_scholarship_from_eligibility()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE public.scholarships
+    SET updated_at = NOW()
+    WHERE id = COALESCE(NEW.scholarship_id, OLD.scholarship_id);
+    IF TG_OP = 'UPDATE' AND NEW.scholarship_id IS DISTINCT FROM OLD.scholarship_id THEN
+        UPDATE public.scholarships SET updated_at = NOW() WHERE id = OLD.scholarship_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_eligibility_touch_scholarship ON public.eligibility;
+CREATE TRIGGER trg_eligibility_touch_scholarship
+    AFTER INSERT OR UPDATE OR DELETE ON public.eligibility
+    FOR EACH ROW EXECUTE FUNCTION touch_scholarship_from_eligibility();
+
+CREATE INDEX IF NOT EXISTS idx_profiles_updated_at       ON public.profiles(updated_at);
+CREATE INDEX IF NOT EXISTS idx_alert_prefs_updated_at    ON public.user_alert_preferences(updated_at);
+CREATE INDEX IF NOT EXISTS idx_alert_prefs_days          ON public.user_alert_preferences(alert_before_days);
+CREATE INDEX IF NOT EXISTS idx_scholarships_updated_at   ON public.scholarships(updated_at);
+
+-- ----------------------------------------------------------------
+-- TABLE: alert_job_state
+-- Watermark of the last successful alert run
+-- ----------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS public.alert_job_state (
+    job_name        TEXT PRIMARY KEY,
+    last_run_date   DATE NOT NULL,
+    watermark       TIMESTAMPTZ NOT NULL,
+    last_mode       TEXT NOT NULL,
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+ALTER TABLE public.alert_job_state ENABLE ROW LEVEL SECURITY;   -- no policies: service role only
+
+-- ----------------------------------------------------------------
+-- FUNCTION: generate_deadline_alerts_incremental
+--
+-- Full rescan (p_full, or no previous run): same as
+-- generate_deadline_alerts(p_today).
+--
+-- Incremental: only (user, scholarship) pairs that may have become due
+-- since the last run are evaluated:
+--   (a) the deadline newly entered the user's window:
+--       deadline - window_days in (last_run_date, p_today]
+--   (b) the user's profile or alert preference changed
+--   (c) the scholarship (or one of its eligibility rows) changed
+-- Candidates then go through the same matching rules and
+-- ON CONFLICT DO NOTHING insert as the full job.
+--
+-- The watermark is saved in the same transaction, so a failed run is
+-- simply retried from the previous watermark. It is set a few minutes
+-- behind NOW() so rows committed by transactions still in flight are
+-- picked up next time (re-processing is harmless).
+--
+-- Returns one row: users_processed, notifications_created, full_rescan
+-- ----------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.generate_deadline_alerts_incremental(
+    p_today DATE    DEFAULT CURRENT_DATE,
+    p_full  BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (
+    users_processed       INTEGER,
+    notifications_created INTEGER,
+    full_rescan           BOOLEAN
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_job       CONSTANT TEXT := 'deadline_alerts';
+    v_state     public.alert_job_state%ROWTYPE;
+    v_watermark TIMESTAMPTZ := NOW() - INTERVAL '5 minutes';
+    v_users     INTEGER;
+    v_created   INTEGER;
+BEGIN
+    -- Serialize runs on the state row
+    INSERT INTO public.alert_job_state (job_name, last_run_date, watermark, last_mode)
+    VALUES (v_job, p_today, '-infinity', 'none')
+    ON CONFLICT (job_name) DO NOTHING;
+
+    SELECT * INTO v_state
+    FROM public.alert_job_state
+    WHERE job_name = v_job
+    FOR UPDATE;
+
+    IF p_full OR v_state.last_mode = 'none' THEN
+        SELECT g.users_processed, g.notifications_created
+        INTO v_users, v_created
+        FROM public.generate_deadline_alerts(p_today) g;
+
+        UPDATE public.alert_job_state
+        SET last_run_date = p_today, watermark = v_watermark,
+            last_mode = 'full', updated_at = NOW()
+        WHERE job_name = v_job;
+
+        RETURN QUERY SELECT v_users, v_created, TRUE;
+        RETURN;
+    END IF;
+
+    CREATE TEMP TABLE tmp_alert_candidates (
+        user_id        UUID NOT NULL,
+        scholarship_id UUID NOT NULL
+    ) ON COMMIT DROP;
+
+    INSERT INTO tmp_alert_candidates (user_id, scholarship_id)
+    WITH upcoming AS (
+        SELECT s.id, s.deadline, s.updated_at
+        FROM public.scholarships s
+        WHERE s.is_active = TRUE AND s.deadline >= p_today
+    ),
+    changed_users AS (
+        SELECT p.id AS user_id FROM public.profiles p WHERE p.updated_at > v_state.watermark
+        UNION
+        SELECT uap.user_id FROM public.user_alert_preferences uap WHERE uap.updated_at > v_state.watermark
+    )
+    -- (a) deadline entered the window of users with an explicit preference
+    SELECT uap.user_id, up.id
+    FROM upcoming up
+    JOIN public.user_alert_preferences uap
+      ON  uap.alert_before_days >= up.deadline - p_today
+      AND uap.alert_before_days <  up.deadline - v_state.last_run_date
+    UNION
+    -- (a) ...and of users on the default 7-day window
+    SELECT p.id, up.id
+    FROM upcoming up CROSS JOIN public.profiles p
+    WHERE 7 >= up.deadline - p_today
+      AND 7 <  up.deadline - v_state.last_run_date
+      AND NOT EXISTS (SELECT 1 FROM public.user_alert_preferences uap WHERE uap.user_id = p.id)
+    UNION
+    -- (b) changed users against every upcoming scholarship
+    SELECT cu.user_id, up.id
+    FROM changed_users cu CROSS JOIN upcoming up
+    UNION
+    -- (c) changed scholarships against every user
+    SELECT p.id, up.id
+    FROM upcoming up CROSS JOIN public.profiles p
+    WHERE up.updated_at > v_state.watermark;
+
+    SELECT COUNT(DISTINCT c.user_id) INTO v_users FROM tmp_alert_candidates c;
+
+    WITH due AS (
+        SELECT DISTINCT
+            p.id AS user_id,
+            s.id AS scholarship_id,
+            s.name,
+            s.deadline
+        FROM
+            tmp_alert_candidates c
+            INNER JOIN public.profiles p ON p.id = c.user_id
+            LEFT JOIN public.user_alert_preferences uap ON uap.user_id = p.id
+            INNER JOIN public.scholarships s
+                ON  s.id = c.scholarship_id
+                AND s.deadline <= p_today + COALESCE(uap.alert_before_days, 7)
+            INNER JOIN public.eligibility e ON e.scholarship_id = s.id
+        WHERE
+            -- Same rules as generate_deadline_alerts / get_matching_scholarships
+            (s.income_limit = 0 OR s.income_limit >= p.income)
+            AND (
+                e.community = p.community
+                OR e.community = 'Any'
+                OR (p.community = 'Muslim' AND e.community = 'Minority')
+                OR (p.community = 'SC/ST'  AND e.community IN ('SC', 'ST'))
+                OR (p.community = 'SC'     AND e.community = 'SC/OBC')
+                OR (p.community = 'OBC'    AND e.community = 'SC/OBC')
+            )
+            AND (e.gender = p.gender OR e.gender = 'Any')
+            AND (
+                e.education_level = p.education_level
+                OR e.education_level = 'Any'
+                OR (
+                    e.education_level = 'PostMatric'
+                    AND p.education_level IN ('PostMatric','Diploma','Degree','PG','PhD','Technical','Engineering','Professional')
+                )
+            )
+    ),
+    inserted AS (
+        INSERT INTO public.notifications (user_id, scholarship_id, message, is_read)
+        SELECT
+            d.user_id,
+            d.scholarship_id,
+            format(
+                '⏰ Deadline Alert: ''%s'' deadline is on %s (%s days remaining). Apply now!',
+                d.name, d.deadline, d.deadline - p_today
+            ),
+            FALSE
+        FROM due d
+        ON CONFLICT (user_id, scholarship_id) DO NOTHING
+        RETURNING 1
+    )
+    SELECT COUNT(*) INTO v_created FROM inserted;
+
+    UPDATE public.alert_job_state
+    SET last_run_date = p_today, watermark = v_watermark,
+        last_mode = 'incremental', updated_at = NOW()
+    WHERE job_name = v_job;
+
+    RETURN QUERY SELECT v_users, v_created, FALSE;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.generate_deadline_alerts_incremental(DATE, BOOLEAN) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.generate_deadline_alerts_incremental(DATE, BOOLEAN) TO service_role;
@@ -0,0 +1,120 @@
+-- ============================================================
+-- KeralaSeva AI – Scholarship Navigator
+-- FILE: 06_job_leases.sql
+-- PURPOSE: Lease rows so exactly one app process runs each scheduled
+--          job, however many gunicorn workers start a scheduler
+-- Run after 05_incremental_alerts.sql
+-- ============================================================
+
+-- ----------------------------------------------------------------
+-- TABLE: job_leases
+-- One row per scheduled run (run_key, e.g. 'daily_deadline_alerts:2025-11-25').
+-- The holder keeps the lease alive while it works; a holder that
+-- crashes stops renewing, its lease expires and the next attempt by
+-- any worker takes the run over. completed_at marks the run as done.
+-- ----------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS public.job_leases (
+    run_key         TEXT PRIMARY KEY,
+    holder          TEXT NOT NULL,
+    acquired_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    lease_until     TIMESTAMPTZ NOT NULL,
+    completed_at    TIMESTAMPTZ
+);
+ALTER TABLE public.job_leases ENABLE ROW LEVEL SECURITY;   -- no policies: service role only
+
+-- ----------------------------------------------------------------
+-- FUNCTION: try_acquire_job_lease
+-- Takes the run if nobody has it yet, or if the previous holder's
+-- lease expired before it completed. Atomic: concurrent callers
+-- serialize on the row, so at most one of them gets acquired = TRUE.
+--
+-- Returns one row: acquired, current_holder, completed
+-- ----------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.try_acquire_job_lease(
+    p_run_key       TEXT,
+    p_holder        TEXT,
+    p_lease_seconds INTEGER
+)
+RETURNS TABLE (
+    acquired        BOOLEAN,
+    current_holder  TEXT,
+    completed       BOOLEAN
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    INSERT INTO public.job_leases AS l (run_key, holder, lease_until)
+    VALUES (p_run_key, p_holder, NOW() + make_interval(secs => p_lease_seconds))
+    ON CONFLICT (run_key) DO UPDATE
+        SET holder      = EXCLUDED.holder,
+            acquired_at = NOW(),
+            lease_until = EXCLUDED.lease_until
+        WHERE l.completed_at IS NULL
+          AND l.lease_until < NOW();
+
+    RETURN QUERY
+    SELECT l.holder = p_holder AND l.completed_at IS NULL,
+           l.holder,
+           l.completed_at IS NOT NULL
+    FROM public.job_leases l
+    WHERE l.run_key = p_run_key;
+END;
+$$;
+
+-- ----------------------------------------------------------------
+-- FUNCTION: renew_job_lease
+-- Extends a lease still held by p_holder. FALSE means the lease was
+-- lost (expired and taken over) – the caller should stop.
+-- ----------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.renew_job_lease(
+    p_run_key       TEXT,
+    p_holder        TEXT,
+    p_lease_seconds INTEGER
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    UPDATE public.job_leases
+    SET lease_until = NOW() + make_interval(secs => p_lease_seconds)
+    WHERE run_key = p_run_key
+      AND holder = p_holder
+      AND completed_at IS NULL;
+    RETURN FOUND;
+END;
+$$;
+
+-- ----------------------------------------------------------------
+-- FUNCTION: finish_job_lease
+-- p_completed = TRUE:  the run is done, nobody runs it again.
+-- p_completed = FALSE: the run failed, expire the lease now so the
+--                      next attempt can retry it.
+-- ----------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.finish_job_lease(
+    p_run_key   TEXT,
+    p_holder    TEXT,
+    p_completed BOOLEAN
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    UPDATE public.job_leases
+    SET lease_until  = NOW(),
+        completed_at = CASE WHEN p_completed THEN NOW() END
+    WHERE run_key = p_run_key
+      AND holder = p_holder
+      AND completed_at IS NULL;
+    RETURN FOUND;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.try_acquire_job_lease(TEXT, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION public.renew_job_lease(TEXT, TEXT, INTEGER)       FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION public.finish_job_lease(TEXT, TEXT, BOOLEAN)      FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.try_acquire_job_lease(TEXT, TEXT, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION public.renew_job_lease(TEXT, TEXT, INTEGER)       TO service_role;
+GRANT EXECUTE ON FUNCTION public.finish_job_lease(TEXT, TEXT, BOOLEAN)      TO service_role;
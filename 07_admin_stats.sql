@@ -0,0 +1,64 @@
+-- ============================================================
+-- KeralaSeva AI – Scholarship Navigator
+-- FILE: 07_admin_stats.sql
+-- PURPOSE: Admin dashboard totals computed inside Postgres
+-- Run after 06_job_leases.sql
+-- ============================================================
+
+-- ----------------------------------------------------------------
+-- FUNCTION: admin_overview_stats
+--
+-- One row of aggregate counts for GET /api/admin/overview, so the API
+-- never downloads table rows just to count them.
+--
+-- p_estimated = FALSE: exact COUNT(*)s (index-only scans on the PKs).
+-- p_estimated = TRUE:  users and notifications come from the planner's
+--                      row estimate (pg_class.reltuples, kept fresh by
+--                      autovacuum/ANALYZE) – constant time on any table
+--                      size. The scholarship catalog is small and is
+--                      always counted exactly.
+-- ----------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.admin_overview_stats(p_estimated BOOLEAN DEFAULT FALSE)
+RETURNS TABLE (
+    total_scholarships       BIGINT,
+    active_scholarships      BIGINT,
+    total_users              BIGINT,
+    total_notifications_sent BIGINT
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_total  BIGINT;
+    v_active BIGINT;
+    v_users  BIGINT;
+    v_notifs BIGINT;
+BEGIN
+    SELECT COUNT(*), COUNT(*) FILTER (WHERE s.is_active)
+    INTO v_total, v_active
+    FROM public.scholarships s;
+
+    IF p_estimated THEN
+        -- reltuples is -1 for a table that was never analyzed: count those exactly
+        SELECT GREATEST(c.reltuples, -1)::BIGINT INTO v_users
+        FROM pg_class c WHERE c.oid = 'public.profiles'::regclass;
+        SELECT GREATEST(c.reltuples, -1)::BIGINT INTO v_notifs
+        FROM pg_class c WHERE c.oid = 'public.notifications'::regclass;
+    END IF;
+
+    IF v_users IS NULL OR v_users < 0 THEN
+        SELECT COUNT(*) INTO v_users FROM public.profiles;
+    END IF;
+    IF v_notifs IS NULL OR v_notifs < 0 THEN
+        SELECT COUNT(*) INTO v_notifs FROM public.notifications;
+    END IF;
+
+    RETURN QUERY SELECT v_total, v_active, v_users, v_notifs;
+END;
+$$;
+
+-- Admin API only (called with the service role key)
+REVOKE ALL ON FUNCTION public.admin_overview_stats(BOOLEAN) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.admin_overview_stats(BOOLEAN) TO service_role;
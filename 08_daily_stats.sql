@@ -0,0 +1,171 @@
+-- ============================================================
+-- KeralaSeva AI – Scholarship Navigator
+-- FILE: 08_daily_stats.sql
+-- PURPOSE: Pre-aggregated daily buckets for the admin dashboard trends
+-- Run after 07_admin_stats.sql
+-- ============================================================
+
+-- ----------------------------------------------------------------
+-- TABLE: daily_stats
+-- One row per calendar day (Asia/Kolkata):
+--   signups                profiles created that day
+--   notifications_created  notifications created that day
+--   notifications_unread   of those, how many were still unread at
+--                          the last refresh of the day's bucket
+--   active_scholarships    active scholarships open on that day
+--                          (created on or before it, deadline not passed)
+-- Written only by refresh_daily_stats(); read by admin_stats_timeseries().
+-- ----------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS public.daily_stats (
+    day                     DATE PRIMARY KEY,
+    signups                 INTEGER NOT NULL DEFAULT 0,
+    notifications_created   INTEGER NOT NULL DEFAULT 0,
+    notifications_unread    INTEGER NOT NULL DEFAULT 0,
+    active_scholarships     INTEGER NOT NULL DEFAULT 0,
+    refreshed_at            TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+ALTER TABLE public.daily_stats ENABLE ROW LEVEL SECURITY;   -- no policies: service role only
+
+CREATE INDEX IF NOT EXISTS idx_profiles_created_at       ON public.profiles(created_at);
+CREATE INDEX IF NOT EXISTS idx_notifications_created_at  ON public.notifications(created_at);
+
+-- ----------------------------------------------------------------
+-- FUNCTION: refresh_daily_stats
+--
+-- Incremental: recomputes only the buckets from
+-- (latest stored day - p_lookback_days) up to p_today; older buckets are
+-- left as they are. The lookback re-counts recent days so the unread
+-- figures follow users reading their notifications. The first run
+-- backfills from the oldest profile / notification.
+-- Each bucket is computed from a created_at range scan, never a full
+-- table scan.
+--
+-- Returns the number of buckets written.
+-- ----------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.refresh_daily_stats(
+    p_today         DATE    DEFAULT (NOW() AT TIME ZONE 'Asia/Kolkata')::DATE,
+    p_lookback_days INTEGER DEFAULT 7
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_from    DATE;
+    v_since   TIMESTAMPTZ;
+    v_written INTEGER;
+BEGIN
+    SELECT MAX(day) - p_lookback_days INTO v_from FROM public.daily_stats;
+    IF v_from IS NULL THEN
+        SELECT LEAST(
+            (SELECT MIN(created_at) FROM public.profiles),
+            (SELECT MIN(created_at) FROM public.notifications)
+        ) AT TIME ZONE 'Asia/Kolkata'
+        INTO v_from;
+        v_from := COALESCE(v_from, p_today);
+    END IF;
+    v_since := v_from::TIMESTAMP AT TIME ZONE 'Asia/Kolkata';
+
+    WITH days AS (
+        SELECT d::DATE AS day
+        FROM generate_series(v_from, p_today, INTERVAL '1 day') d
+    ),
+    signups AS (
+        SELECT (p.created_at AT TIME ZONE 'Asia/Kolkata')::DATE AS day, COUNT(*) AS n
+        FROM public.profiles p
+        WHERE p.created_at >= v_since
+        GROUP BY 1
+    ),
+    notifs AS (
+        SELECT (n.created_at AT TIME ZONE 'Asia/Kolkata')::DATE AS day,
+               COUNT(*)                                 AS created,
+               COUNT(*) FILTER (WHERE NOT n.is_read)    AS unread
+        FROM public.notifications n
+        WHERE n.created_at >= v_since
+        GROUP BY 1
+    ),
+    active AS (
+        SELECT d.day, COUNT(s.id) AS n
+        FROM days d
+        LEFT JOIN public.scholarships s
+            ON  s.is_active = TRUE
+            AND (s.created_at AT TIME ZONE 'Asia/Kolkata')::DATE <= d.day
+            AND (s.deadline IS NULL OR s.deadline >= d.day)
+        GROUP BY d.day
+    ),
+    written AS (
+        INSERT INTO public.daily_stats AS ds (
+            day, signups, notifications_created, notifications_unread,
+            active_scholarships, refreshed_at
+        )
+        SELECT d.day,
+               COALESCE(su.n, 0),
+               COALESCE(nt.created, 0),
+               COALESCE(nt.unread, 0),
+               COALESCE(a.n, 0),
+               NOW()
+        FROM days d
+        LEFT JOIN signups su ON su.day = d.day
+        LEFT JOIN notifs  nt ON nt.day = d.day
+        LEFT JOIN active  a  ON a.day  = d.day
+        ON CONFLICT (day) DO UPDATE
+            SET signups               = EXCLUDED.signups,
+                notifications_created = EXCLUDED.notifications_created,
+                notifications_unread  = EXCLUDED.notifications_unread,
+                active_scholarships   = EXCLUDED.active_scholarships,
+                refreshed_at          = EXCLUDED.refreshed_at
+        RETURNING 1
+    )
+    SELECT COUNT(*) INTO v_written FROM written;
+
+    RETURN v_written;
+END;
+$$;
+
+-- ----------------------------------------------------------------
+-- FUNCTION: admin_stats_timeseries
+--
+-- Reads only daily_stats buckets in [p_from, p_to] and rolls them up to
+-- p_granularity ('day', 'week' or 'month'). Counters are summed;
+-- active_scholarships is the value on the bucket's last stored day;
+-- unread_ratio = unread / created for the bucket (0 when nothing was sent).
+-- ----------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.admin_stats_timeseries(
+    p_from        DATE,
+    p_to          DATE,
+    p_granularity TEXT DEFAULT 'day'
+)
+RETURNS TABLE (
+    bucket                  DATE,
+    signups                 BIGINT,
+    notifications_created   BIGINT,
+    notifications_unread    BIGINT,
+    unread_ratio            NUMERIC,
+    active_scholarships     INTEGER
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+AS $$
+    SELECT
+        date_trunc(p_granularity, ds.day::TIMESTAMP)::DATE               AS bucket,
+        SUM(ds.signups)                                                  AS signups,
+        SUM(ds.notifications_created)                                    AS notifications_created,
+        SUM(ds.notifications_unread)                                     AS notifications_unread,
+        COALESCE(ROUND(
+            SUM(ds.notifications_unread)::NUMERIC
+            / NULLIF(SUM(ds.notifications_created), 0), 4
+        ), 0)                                                            AS unread_ratio,
+        (ARRAY_AGG(ds.active_scholarships ORDER BY ds.day DESC))[1]      AS active_scholarships
+    FROM public.daily_stats ds
+    WHERE ds.day BETWEEN p_from AND p_to
+    GROUP BY 1
+    ORDER BY 1;
+$$;
+
+REVOKE ALL ON FUNCTION public.refresh_daily_stats(DATE, INTEGER)          FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION public.admin_stats_timeseries(DATE, DATE, TEXT)    FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.refresh_daily_stats(DATE, INTEGER)       TO service_role;
+GRANT EXECUTE ON FUNCTION public.admin_stats_timeseries(DATE, DATE, TEXT) TO service_role;
@@ -0,0 +1,16 @@
+-- ============================================================
+-- KeralaSeva AI – Scholarship Navigator
+-- FILE: 09_pagination_indexes.sql
+-- PURPOSE: Indexes matching the keyset pagination sort orders, so each
+--          page is one bounded index range scan at any depth
+-- Run after 08_daily_stats.sql
+-- ============================================================
+
+-- GET /api/scholarships/: active rows ordered by (deadline ASC NULLS LAST, id)
+CREATE INDEX IF NOT EXISTS idx_scholarships_active_deadline_id
+    ON public.scholarships (deadline, id)
+    WHERE is_active = TRUE;
+
+-- GET /api/scholarships/notifications: a user's rows ordered by (created_at DESC, id DESC)
+CREATE INDEX IF NOT EXISTS idx_notifications_user_created_id
+    ON public.notifications (user_id, created_at DESC, id DESC);
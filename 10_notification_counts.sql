@@ -0,0 +1,17 @@
+-- ============================================================
+-- KeralaSeva AI – Scholarship Navigator
+-- FILE: 10_notification_counts.sql
+-- PURPOSE: Indexes for unread counts and "since" delta polling
+-- Run after 09_pagination_indexes.sql
+-- ============================================================
+
+-- GET /api/scholarships/notifications/unread-count:
+-- COUNT(*) WHERE user_id = ? AND is_read = FALSE touches only the
+-- user's unread entries, however long their history is
+CREATE INDEX IF NOT EXISTS idx_notifications_user_unread
+    ON public.notifications (user_id)
+    WHERE is_read = FALSE;
+
+-- GET /api/scholarships/notifications?since=<id>: rows after the marker
+CREATE INDEX IF NOT EXISTS idx_notifications_user_id_id
+    ON public.notifications (user_id, id);
@@ -0,0 +1,144 @@
+-- ============================================================
+-- KeralaSeva AI – Scholarship Navigator
+-- FILE: 11_fulltext_search.sql
+-- PURPOSE: Ranked full-text search over scholarships with trigram
+--          typo tolerance
+-- Run after 10_notification_counts.sql
+-- ============================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+-- ----------------------------------------------------------------
+-- DENORMALIZED DOCUMENT NAMES
+-- A generated column can only read its own row, so the names from
+-- documents_required are copied onto the scholarship by a trigger.
+-- ----------------------------------------------------------------
+ALTER TABLE public.scholarships
+    ADD COLUMN IF NOT EXISTS document_names TEXT NOT NULL DEFAULT '';
+
+CREATE OR REPLACE FUNCTION refresh_scholarship_document_names(p_scholarship_id UUID)
+RETURNS VOID AS $$
+    UPDATE public.scholarships s
+    SET document_names = COALESCE((
+        SELECT string_agg(d.document_name, ' ' ORDER BY d.id)
+        FROM public.documents_required d
+        WHERE d.scholarship_id = p_scholarship_id
+    ), '')
+    WHERE s.id = p_scholarship_id;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION sync_scholarship_document_names()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM refresh_scholarship_document_names(NEW.scholarship_id);
+    END IF;
+    IF TG_OP = 'DELETE'
+       OR (TG_OP = 'UPDATE' AND NEW.scholarship_id IS DISTINCT FROM OLD.scholarship_id) THEN
+        PERFORM refresh_scholarship_document_names(OLD.scholarship_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_documents_sync_names ON public.documents_required;
+CREATE TRIGGER trg_documents_sync_names
+    AFTER INSERT OR UPDATE OR DELETE ON public.documents_required
+    FOR EACH ROW EXECUTE FUNCTION sync_scholarship_document_names();
+
+-- Backfill existing rows
+UPDATE public.scholarships s
+SET document_names = COALESCE((
+    SELECT string_agg(d.document_name, ' ' ORDER BY d.id)
+    FROM public.documents_required d
+    WHERE d.scholarship_id = s.id
+), '');
+
+-- ----------------------------------------------------------------
+-- SEARCH VECTOR + INDEXES
+-- Weights: name A, description B, document names C
+-- ----------------------------------------------------------------
+ALTER TABLE public.scholarships
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(name, '')), 'A')
+        || setweight(to_tsvector('english', COALESCE(description, '')), 'B')
+        || setweight(to_tsvector('english', COALESCE(document_names, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_scholarships_search_vector
+    ON public.scholarships USING GIN (search_vector);
+
+-- Typo tolerance on names ("scolarship", "kshec")
+CREATE INDEX IF NOT EXISTS idx_scholarships_name_trgm
+    ON public.scholarships USING GIN (name extensions.gin_trgm_ops);
+
+-- ----------------------------------------------------------------
+-- FUNCTION: search_scholarships
+--
+-- Active scholarships matching p_query, best first:
+--   full-text match (websearch syntax: words, "phrases", -exclusions)
+--   OR a close trigram match of the query inside the name.
+-- rank = ts_rank over the weighted vector + a smaller word-similarity
+-- bonus, so exact word matches beat fuzzy ones.
+-- Returns ids and ranks only – the API joins them to its cached catalog.
+-- ----------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION public.search_scholarships(
+    p_query TEXT,
+    p_limit INTEGER DEFAULT 20
+)
+RETURNS TABLE (
+    scholarship_id UUID,
+    rank           REAL
+)
+LANGUAGE sql
+STABLE
+SET search_path = public, extensions
+AS $$
+    WITH q AS (
+        SELECT websearch_to_tsquery('english', p_query) AS tsq
+    )
+    SELECT
+        s.id,
+        (ts_rank(s.search_vector, q.tsq) + 0.2 * word_similarity(p_query, s.name))::REAL AS rank
+    FROM public.scholarships s, q
+    WHERE s.is_active = TRUE
+      AND (s.search_vector @@ q.tsq OR p_query <% s.name)
+    ORDER BY rank DESC, s.deadline ASC NULLS LAST, s.id
+    LIMIT LEAST(GREATEST(p_limit, 1), 100);
+$$;
+
+-- Catalog data is public (same as the scholarships SELECT policy)
+GRANT EXECUTE ON FUNCTION public.search_scholarships(TEXT, INTEGER) TO anon, authenticated, service_role;
+
+-- ----------------------------------------------------------------
+-- CHECK: the search predicates are answerable from the indexes.
+-- Sequential scans are disabled for the check only (the catalog is
+-- small enough that the planner would otherwise prefer them); the
+-- migration fails if the plan does not use both indexes.
+-- ----------------------------------------------------------------
+DO $$
+DECLARE
+    v_line TEXT;
+    v_plan TEXT := '';
+BEGIN
+    PERFORM set_config('enable_seqscan', 'off', TRUE);
+    FOR v_line IN
+        EXPLAIN
+        SELECT s.id
+        FROM public.scholarships s
+        WHERE s.search_vector @@ websearch_to_tsquery('english', 'merit scholarship')
+           OR 'scolarship' OPERATOR(extensions.<%) s.name
+    LOOP
+        v_plan := v_plan || v_line || E'\n';
+    END LOOP;
+    PERFORM set_config('enable_seqscan', 'on', TRUE);
+
+    IF position('idx_scholarships_search_vector' IN v_plan) = 0
+       OR position('idx_scholarships_name_trgm' IN v_plan) = 0 THEN
+        RAISE EXCEPTION 'search_scholarships predicates do not use the search indexes:%', E'\n' || v_plan;
+    END IF;
+    RAISE NOTICE 'Search index check passed:%', E'\n' || v_plan;
+END;
+$$;
@@ -26,12 +26,97 @@ class Config:
     SUPABASE_KEY         = os.environ.get("SUPABASE_KEY", "")
     SUPABASE_SERVICE_KEY = os.environ.get("SUPABASE_SERVICE_KEY", "")
 
+    # ── Auth (JWT verification) ────────────────────────────────────
+    # SUPABASE_JWT_SECRET:   project JWT secret (Settings → API) for local
+    #                        HS256 verification; asymmetric keys use JWKS
+    # AUTH_REMOTE_FALLBACK:  ask Supabase Auth when a token cannot be
+    #                        verified locally
+    # AUTH_TOKEN_CACHE_SIZE: verified tokens kept in memory until expiry
+    SUPABASE_JWT_SECRET   = os.environ.get("SUPABASE_JWT_SECRET", "")
+    JWT_AUDIENCE          = os.environ.get("JWT_AUDIENCE", "authenticated")
+    AUTH_REMOTE_FALLBACK  = os.environ.get("AUTH_REMOTE_FALLBACK", "1") == "1"
+    AUTH_TOKEN_CACHE_SIZE = int(os.environ.get("AUTH_TOKEN_CACHE_SIZE", "1024"))
+    # How long a profiles.is_admin lookup is trusted (bounds demotion delay)
+    ADMIN_STATUS_TTL_SECONDS = int(os.environ.get("ADMIN_STATUS_TTL_SECONDS", "60"))
+    # Admin overview: "1" = estimated user/notification totals (07_admin_stats.sql)
+    ADMIN_STATS_ESTIMATED    = os.environ.get("ADMIN_STATS_ESTIMATED", "0") == "1"
+    # Hourly stats rollup (08_daily_stats.sql): recent days re-counted each run
+    STATS_LOOKBACK_DAYS      = int(os.environ.get("STATS_LOOKBACK_DAYS", "7"))
+
+    # ── Deadline alert job ─────────────────────────────────────────
+    # "sql":      one generate_deadline_alerts() call (04_deadline_alerts.sql)
+    # "per_user": one matching RPC per user (legacy)
+    # "cohort":   users grouped by matching attributes, matched in-process
+    ALERT_JOB_STRATEGY = os.environ.get("ALERT_JOB_STRATEGY", "sql")
+    # sql strategy only: evaluate just what changed since the last run's
+    # watermark (05_incremental_alerts.sql) instead of a full rescan
+    ALERT_JOB_INCREMENTAL = os.environ.get("ALERT_JOB_INCREMENTAL", "1") == "1"
+    # per_user strategy only: thread pool size, cap on Supabase calls per
+    # second (0 = no cap) and how often progress is logged
+    ALERT_JOB_WORKERS          = int(os.environ.get("ALERT_JOB_WORKERS", "8"))
+    ALERT_JOB_MAX_RPS          = float(os.environ.get("ALERT_JOB_MAX_RPS", "20"))
+    ALERT_JOB_PROGRESS_SECONDS = float(os.environ.get("ALERT_JOB_PROGRESS_SECONDS", "10"))
+    # cohort strategy only: notifications per bulk insert
+    ALERT_JOB_INSERT_BATCH     = int(os.environ.get("ALERT_JOB_INSERT_BATCH", "500"))
+
+    # ── Live notification stream (/api/alerts/stream) ──────────────
+    # Each open stream holds a worker thread. Under gunicorn.conf.py the
+    # cap is lowered to the worker's threads minus RESERVED_THREADS (a
+    # sync worker serves no streams)
+    ALERT_STREAM_MAX_PER_WORKER      = int(os.environ.get("ALERT_STREAM_MAX_PER_WORKER", "50"))
+    ALERT_STREAM_RESERVED_THREADS    = int(os.environ.get("ALERT_STREAM_RESERVED_THREADS", "8"))
+    ALERT_STREAM_QUEUE_SIZE          = int(os.environ.get("ALERT_STREAM_QUEUE_SIZE", "100"))
+    ALERT_STREAM_HEARTBEAT_SECONDS   = float(os.environ.get("ALERT_STREAM_HEARTBEAT_SECONDS", "15"))
+    # How often a stream re-reads the database (rows published by another worker)
+    ALERT_STREAM_RESYNC_SECONDS      = float(os.environ.get("ALERT_STREAM_RESYNC_SECONDS", "120"))
+    ALERT_STREAM_RETRY_AFTER_SECONDS = int(os.environ.get("ALERT_STREAM_RETRY_AFTER_SECONDS", "30"))
+
+    # ── Scheduled job leases (06_job_leases.sql) ───────────────────
+    # One worker runs each scheduled job; the lease outlives a crashed
+    # holder by at most JOB_LEASE_SECONDS, and the daily job is retried
+    # every JOB_RETRY_MINUTES until some worker completes it.
+    JOB_LEASE_SECONDS = int(os.environ.get("JOB_LEASE_SECONDS", "600"))
+    JOB_RETRY_MINUTES = int(os.environ.get("JOB_RETRY_MINUTES", "15"))
+
     # ── CORS ───────────────────────────────────────────────────────
     ALLOWED_ORIGINS = os.environ.get(
         "ALLOWED_ORIGINS",
         "http://localhost:3000,http://127.0.0.1:5500"
     ).split(",")
 
+    # ── Catalog cache ──────────────────────────────────────────────
+    # Max age of the in-process scholarship catalog snapshot. Admin writes
+    # invalidate it immediately in the worker that served them; the TTL
+    # bounds staleness in the other workers.
+    CATALOG_TTL_SECONDS = int(os.environ.get("CATALOG_TTL_SECONDS", "300"))
+    # Cache-Control max-age of catalog responses (list / detail); repeats
+    # after that are revalidated with their ETag and usually get a 304
+    CATALOG_CACHE_MAX_AGE = int(os.environ.get("CATALOG_CACHE_MAX_AGE", "60"))
+    # Scholarship list search: "fts" = relevance-ranked search_scholarships()
+    # RPC (11_fulltext_search.sql), "substring" = name contains the term
+    SCHOLARSHIP_SEARCH_MODE = os.environ.get("SCHOLARSHIP_SEARCH_MODE", "fts")
+
+    # ── Chat assistant ─────────────────────────────────────────────
+    # Number of retrieved scholarships included in each LLM prompt
+    CHAT_TOP_K = int(os.environ.get("CHAT_TOP_K", "5"))
+
+    # ── LLM (Ollama) client ────────────────────────────────────────
+    # MAX_IN_FLIGHT: concurrent generations per worker
+    # MAX_QUEUE:     requests allowed to wait for a slot; beyond this
+    #                /api/chat answers 503 immediately
+    OLLAMA_URL                  = os.environ.get("OLLAMA_URL", "http://localhost:11434")
+    OLLAMA_MODEL                = os.environ.get("OLLAMA_MODEL", "llama3")
+    LLM_MAX_IN_FLIGHT           = int(os.environ.get("LLM_MAX_IN_FLIGHT", "2"))
+    LLM_MAX_QUEUE               = int(os.environ.get("LLM_MAX_QUEUE", "8"))
+    LLM_QUEUE_TIMEOUT_SECONDS   = float(os.environ.get("LLM_QUEUE_TIMEOUT_SECONDS", "10"))
+    LLM_CONNECT_TIMEOUT_SECONDS = float(os.environ.get("LLM_CONNECT_TIMEOUT_SECONDS", "3"))
+    LLM_READ_TIMEOUT_SECONDS    = float(os.environ.get("LLM_READ_TIMEOUT_SECONDS", "120"))
+
+    # ── Chat answer cache ──────────────────────────────────────────
+    # Answers are keyed by normalized question + catalog content (its etag)
+    ANSWER_CACHE_MAX_ENTRIES = int(os.environ.get("ANSWER_CACHE_MAX_ENTRIES", "512"))
+    ANSWER_CACHE_TTL_SECONDS = int(os.environ.get("ANSWER_CACHE_TTL_SECONDS", "3600"))
+
 
 class ProductionConfig(Config):
     DEBUG = False
@@ -4,9 +4,11 @@ FILE: app/extensions.py
 PURPOSE: Initialize shared Supabase clients
   - supabase_client   : uses anon key (subject to RLS – for user-facing ops)
   - supabase_admin    : uses service role key (bypasses RLS – for server-only ops)
+  - rls_transport     : pooled HTTP transport shared by per-user RLS clients
 """
 
 import os
+import httpx
 from supabase import create_client, Client
 
 # ── Anon client: respects RLS policies ────────────────────────────
@@ -25,4 +27,14 @@ supabase_admin: Client = create_client(
     os.environ.get("SUPABASE_URL", ""),
     os.environ.get("SUPABASE_SERVICE_KEY", "")
 )
+# ── Shared transport for per-user PostgREST clients ────────────────
+# Holds the keep-alive connection pool only; no auth state lives here, so
+# it is safe to share between concurrent users (see get_user_client).
+rls_transport = httpx.HTTPTransport(
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=int(os.environ.get("RLS_POOL_MAX_CONNECTIONS", "50")),
+        max_keepalive_connections=int(os.environ.get("RLS_POOL_MAX_KEEPALIVE", "20"))
+    )
+)
 print("SERVICE KEY:", os.environ.get("SUPABASE_SERVICE_KEY"))
\ No newline at end of file
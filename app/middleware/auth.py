@@ -5,25 +5,59 @@ PURPOSE: JWT authentication and admin authorization decorators
 """
 
 import functools
+import threading
+import time
 from typing import Callable, Any
 
-from flask import request, jsonify, g
-from supabase import Client
+from flask import request, jsonify, g, current_app
+from postgrest import SyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_HEADERS
+from postgrest.utils import SyncClient
 
-from app.extensions import supabase_client
+from app.extensions import supabase_client, rls_transport
+from app.middleware.tokens import verify_access_token, TokenError
 
 
-def _extract_bearer_token() -> str | None:
-    """Extract Bearer token from Authorization header."""
+def _extract_bearer_token(allow_query_token: bool = False) -> str | None:
+    """
+    Extract Bearer token from Authorization header.
+    EventSource (SSE) cannot send headers, so views marked with
+    allow_query_token may take it as ?access_token= instead – only on
+    text/event-stream requests. Everywhere else a query-string token is
+    ignored, so tokens do not end up in access logs.
+    """
     auth_header = request.headers.get("Authorization", "")
     if auth_header.startswith("Bearer "):
         return auth_header[len("Bearer "):]
+    if allow_query_token and request.accept_mimetypes.best == "text/event-stream":
+        return request.args.get("access_token") or None
     return None
 
 
+def allow_query_token(f: Callable) -> Callable:
+    """
+    Mark an SSE view as accepting ?access_token= (see _extract_bearer_token).
+    Apply below @login_required.
+
+    Usage:
+        @app.route("/api/stream")
+        @login_required
+        @allow_query_token
+        def my_stream():
+            ...
+    """
+    f.allows_query_token = True
+    return f
+
+
 def login_required(f: Callable) -> Callable:
     """
     Decorator: verifies Supabase JWT and loads user into Flask g.
+
+    The token is verified locally (signature, expiry, audience) – see
+    app/middleware/tokens.py. Only when it cannot be verified locally
+    (e.g. no SUPABASE_JWT_SECRET) and AUTH_REMOTE_FALLBACK is on does it
+    fall back to asking Supabase Auth.
     
     Usage:
         @app.route("/api/something")
@@ -36,30 +70,92 @@ def login_required(f: Callable) -> Callable:
     """
     @functools.wraps(f)
     def decorated(*args: Any, **kwargs: Any):
-        token = _extract_bearer_token()
+        token = _extract_bearer_token(getattr(f, "allows_query_token", False))
         if not token:
             return jsonify({"error": "Missing authorization token"}), 401
 
         try:
-            # Verify the JWT with Supabase and get the user object
-            response = supabase_client.auth.get_user(token)
-            if not response or not response.user:
-                return jsonify({"error": "Invalid or expired token"}), 401
-            
-            # Store user on Flask's request context object
-            g.user  = response.user
-            g.token = token   # Preserve token for downstream RLS-aware calls
-        except Exception as e:
-            return jsonify({"error": "Authentication failed", "detail": str(e)}), 401
+            user = verify_access_token(token)
+        except TokenError:
+            return jsonify({"error": "Invalid or expired token"}), 401
+
+        if user is None:
+            if not current_app.config.get("AUTH_REMOTE_FALLBACK", True):
+                return jsonify({"error": "Authentication failed", "detail": "Token cannot be verified"}), 401
+            try:
+                # Verify the JWT with Supabase and get the user object
+                response = supabase_client.auth.get_user(token)
+                if not response or not response.user:
+                    return jsonify({"error": "Invalid or expired token"}), 401
+                user = response.user
+            except Exception as e:
+                return jsonify({"error": "Authentication failed", "detail": str(e)}), 401
+
+        # Store user on Flask's request context object
+        g.user  = user
+        g.token = token   # Preserve token for downstream RLS-aware calls
 
         return f(*args, **kwargs)
     return decorated
 
 
+# user_id → (checked_at, is_admin). Short-lived so a demotion done in another
+# worker takes effect within ADMIN_STATUS_TTL_SECONDS.
+_admin_status_cache: dict[str, tuple[float, bool]] = {}
+_admin_status_lock = threading.Lock()
+
+
+def _admin_claim(user) -> bool | None:
+    """is_admin from a custom JWT claim (top-level or app_metadata), if present."""
+    claims = getattr(user, "claims", None) or {}
+    if isinstance(claims.get("is_admin"), bool):
+        return claims["is_admin"]
+    app_metadata = getattr(user, "app_metadata", None) or {}
+    if isinstance(app_metadata.get("is_admin"), bool):
+        return app_metadata["is_admin"]
+    return None
+
+
+def _lookup_admin_status(user_id: str) -> bool:
+    """is_admin from the per-user TTL cache, falling back to the profiles table."""
+    ttl = current_app.config.get("ADMIN_STATUS_TTL_SECONDS", 60)
+    now = time.monotonic()
+    with _admin_status_lock:
+        cached = _admin_status_cache.get(user_id)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    result = (
+        supabase_client
+        .table("profiles")
+        .select("is_admin")
+        .eq("id", user_id)
+        .single()
+        .execute()
+    )
+    is_admin = bool(result.data and result.data.get("is_admin"))
+    with _admin_status_lock:
+        _admin_status_cache[user_id] = (now, is_admin)
+    return is_admin
+
+
+def invalidate_admin_status(user_id: str | None = None) -> None:
+    """Forget cached admin status for one user (or everyone). Call when is_admin changes."""
+    with _admin_status_lock:
+        if user_id is None:
+            _admin_status_cache.clear()
+        else:
+            _admin_status_cache.pop(user_id, None)
+
+
 def admin_required(f: Callable) -> Callable:
     """
     Decorator: requires authenticated user WITH is_admin = True in profiles.
     Must be used AFTER @login_required.
+
+    The flag comes from an is_admin JWT claim when the token carries one
+    (valid until the token expires), otherwise from a per-user cache of
+    profiles.is_admin that lives ADMIN_STATUS_TTL_SECONDS.
     
     Usage:
         @app.route("/api/admin/something")
@@ -74,15 +170,10 @@ def admin_required(f: Callable) -> Callable:
         user_id = g.user.id
 
         try:
-            result = (
-                supabase_client
-                .table("profiles")
-                .select("is_admin")
-                .eq("id", user_id)
-                .single()
-                .execute()
-            )
-            if not result.data or not result.data.get("is_admin"):
+            is_admin = _admin_claim(g.user)
+            if is_admin is None:
+                is_admin = _lookup_admin_status(user_id)
+            if not is_admin:
                 return jsonify({"error": "Admin access required"}), 403
         except Exception:
             return jsonify({"error": "Could not verify admin status"}), 403
@@ -91,17 +182,38 @@ def admin_required(f: Callable) -> Callable:
     return decorated
 
 
-def get_user_client(token: str) -> Client:
+class _UserPostgrestClient(SyncPostgrestClient):
+    """
+    PostgREST client bound to one user's JWT.
+    Its httpx client only carries that user's headers and borrows
+    connections from the shared rls_transport pool, so building one is
+    cheap and nothing is shared between users except idle sockets.
+    Do not close() it – that would close the shared transport.
+    """
+
+    def create_session(self, base_url, headers, timeout, *args, **kwargs):
+        return SyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=rls_transport,
+            follow_redirects=True
+        )
+
+
+def get_user_client(token: str) -> SyncPostgrestClient:
     """
-    Returns a Supabase client with the user's JWT injected.
+    Returns a PostgREST client with the user's JWT injected.
     This ensures RLS policies are applied using the user's identity.
+    Supports the same .table(...) / .rpc(...) query builder as the
+    Supabase client.
     """
-    from supabase import create_client
-    import os
-    client = create_client(
-        os.environ.get("SUPABASE_URL", ""),
-        os.environ.get("SUPABASE_KEY", "")
+    anon_key = current_app.config.get("SUPABASE_KEY", "")
+    return _UserPostgrestClient(
+        f"{current_app.config.get('SUPABASE_URL', '').rstrip('/')}/rest/v1",
+        headers={
+            **DEFAULT_POSTGREST_CLIENT_HEADERS,
+            "apikey":        anon_key,
+            "Authorization": f"Bearer {token}",
+        }
     )
-    # Set the session so RLS policies evaluate as this user
-    client.auth.set_session(token, "")
-    return client
@@ -0,0 +1,132 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/middleware/tokens.py
+PURPOSE: Local verification of Supabase access tokens (JWTs)
+  - HS256 tokens are checked against SUPABASE_JWT_SECRET
+  - asymmetric tokens (RS256 / ES256) against the project's JWKS,
+    fetched once and cached by PyJWKClient
+  - signature, expiry and audience are always checked
+  - already-verified tokens are kept in a small LRU until they expire
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import jwt
+from flask import current_app
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "ES256")
+
+
+class TokenError(Exception):
+    """The token was checked locally and is invalid (bad signature, expired, wrong audience...)."""
+
+
+class TokenUser:
+    """
+    Minimal stand-in for the Supabase User object, built from verified claims.
+    Exposes the attributes the routes use (id, email) plus the raw claims.
+    """
+    __slots__ = ("id", "email", "role", "app_metadata", "user_metadata", "claims")
+
+    def __init__(self, claims: dict):
+        self.id            = claims["sub"]
+        self.email         = claims.get("email")
+        self.role          = claims.get("role")
+        self.app_metadata  = claims.get("app_metadata") or {}
+        self.user_metadata = claims.get("user_metadata") or {}
+        self.claims        = claims
+
+
+_cache: OrderedDict[str, TokenUser] = OrderedDict()
+_cache_lock = threading.Lock()
+_jwks_client: jwt.PyJWKClient | None = None
+_jwks_lock  = threading.Lock()
+
+
+def _get_jwks_client() -> jwt.PyJWKClient | None:
+    global _jwks_client
+    supabase_url = current_app.config.get("SUPABASE_URL", "")
+    if not supabase_url:
+        return None
+    if _jwks_client is None:
+        with _jwks_lock:
+            if _jwks_client is None:
+                _jwks_client = jwt.PyJWKClient(
+                    f"{supabase_url.rstrip('/')}/auth/v1/.well-known/jwks.json",
+                    cache_keys=True
+                )
+    return _jwks_client
+
+
+def _cache_get(token: str) -> TokenUser | None:
+    with _cache_lock:
+        user = _cache.get(token)
+        if user is None:
+            return None
+        if user.claims["exp"] <= time.time():
+            del _cache[token]
+            return None
+        _cache.move_to_end(token)
+        return user
+
+
+def _cache_put(token: str, user: TokenUser) -> None:
+    max_size = current_app.config.get("AUTH_TOKEN_CACHE_SIZE", 1024)
+    with _cache_lock:
+        _cache[token] = user
+        _cache.move_to_end(token)
+        while len(_cache) > max_size:
+            _cache.popitem(last=False)
+
+
+def verify_access_token(token: str) -> TokenUser | None:
+    """
+    Verify a Supabase access token without a network round trip.
+
+    Returns:
+        TokenUser if the token is valid,
+        None if it cannot be verified locally (no secret configured,
+        unsupported algorithm, JWKS unavailable) – caller may fall back
+        to the remote Supabase check.
+    Raises:
+        TokenError if the token is definitely invalid.
+    """
+    user = _cache_get(token)
+    if user is not None:
+        return user
+
+    cfg = current_app.config
+    try:
+        algorithm = jwt.get_unverified_header(token).get("alg")
+    except jwt.PyJWTError as e:
+        raise TokenError(str(e))
+
+    if algorithm == "HS256" and cfg.get("SUPABASE_JWT_SECRET"):
+        key = cfg["SUPABASE_JWT_SECRET"]
+    elif algorithm in ASYMMETRIC_ALGORITHMS:
+        jwks = _get_jwks_client()
+        if jwks is None:
+            return None
+        try:
+            key = jwks.get_signing_key_from_jwt(token).key
+        except jwt.PyJWKClientError:
+            return None
+    else:
+        return None
+
+    try:
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=[algorithm],
+            audience=cfg.get("JWT_AUDIENCE", "authenticated"),
+            options={"require": ["exp", "sub"]}
+        )
+    except jwt.PyJWTError as e:
+        raise TokenError(str(e))
+
+    user = TokenUser(claims)
+    _cache_put(token, user)
+    return user
@@ -6,9 +6,11 @@ PURPOSE: Admin-only routes for managing scholarship data.
          The service role client is used for writes (bypasses RLS on insert).
 """
 
-from flask import Blueprint, request, jsonify
-from app.middleware.auth import login_required, admin_required
+from datetime import date, timedelta
+from flask import Blueprint, request, jsonify, current_app
+from app.middleware.auth import login_required, admin_required, invalidate_admin_status
 from app.extensions import supabase_admin
+from app.services.catalog import invalidate_catalog, catalog_stats
 
 admin_bp = Blueprint("admin", __name__)
 
@@ -70,6 +72,7 @@ def add_scholarship():
 
     try:
         result = supabase_admin.table("scholarships").insert(row).execute()
+        invalidate_catalog()
         return jsonify({
             "message":     "Scholarship created",
             "scholarship": result.data[0]
@@ -115,6 +118,7 @@ def update_scholarship(scholarship_id: str):
             .execute()
         )
         if result.data:
+            invalidate_catalog()
             return jsonify({"message": "Scholarship updated", "scholarship": result.data[0]}), 200
         else:
             return jsonify({"error": "Scholarship not found"}), 404
@@ -142,6 +146,7 @@ def deactivate_scholarship(scholarship_id: str):
             .execute()
         )
         if result.data:
+            invalidate_catalog()
             return jsonify({"message": "Scholarship deactivated"}), 200
         return jsonify({"error": "Scholarship not found"}), 404
     except Exception as e:
@@ -203,6 +208,7 @@ def add_eligibility(scholarship_id: str):
 
     try:
         result = supabase_admin.table("eligibility").insert(validated_rows).execute()
+        invalidate_catalog()
         return jsonify({"message": "Eligibility rows added", "added": len(result.data)}), 201
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -248,6 +254,7 @@ def add_documents(scholarship_id: str):
 
     try:
         result = supabase_admin.table("documents_required").insert(rows).execute()
+        invalidate_catalog()
         return jsonify({"message": "Documents added", "added": len(result.data)}), 201
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -305,11 +312,86 @@ def add_steps(scholarship_id: str):
 
     try:
         result = supabase_admin.table("application_steps").insert(validated_steps).execute()
+        invalidate_catalog()
         return jsonify({"message": "Application steps added", "added": len(result.data)}), 201
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+# ──────────────────────────────────────────────────────────────────
+# ADMIN ROLE MANAGEMENT
+# ──────────────────────────────────────────────────────────────────
+
+@admin_bp.route("/users/<string:user_id>/admin", methods=["PUT"])
+@login_required
+@admin_required
+def set_admin_status(user_id: str):
+    """
+    Promote or demote a user.
+    Drops the cached admin status so the change applies immediately in
+    this worker (other workers pick it up within ADMIN_STATUS_TTL_SECONDS).
+    
+    Request Body:
+        { "is_admin": true }
+    
+    Response 200:
+        { "message": "Admin status updated", "user_id": "uuid", "is_admin": true }
+    """
+    data = request.get_json(silent=True)
+    if not data or not isinstance(data.get("is_admin"), bool):
+        return jsonify({"error": "Provide boolean 'is_admin' in request body"}), 400
+
+    try:
+        result = (
+            supabase_admin
+            .table("profiles")
+            .update({"is_admin": data["is_admin"]})
+            .eq("id", user_id)
+            .execute()
+        )
+        if not result.data:
+            return jsonify({"error": "Profile not found"}), 404
+        invalidate_admin_status(user_id)
+        return jsonify({
+            "message":  "Admin status updated",
+            "user_id":  user_id,
+            "is_admin": data["is_admin"]
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+# ──────────────────────────────────────────────────────────────────
+# CATALOG CACHE
+# ──────────────────────────────────────────────────────────────────
+
+@admin_bp.route("/catalog/stats", methods=["GET"])
+@login_required
+@admin_required
+def get_catalog_stats():
+    """
+    In-process catalog cache counters for the worker that serves the request.
+
+    Response 200:
+        {
+            "hits": 1520, "misses": 6, "hit_ratio": 0.9961,
+            "refreshes": 6, "invalidations": 2,
+            "last_refresh_ms": 84.2, "avg_refresh_ms": 97.5,
+            "version": 6, "size": 25, "age_seconds": 41.3
+        }
+    """
+    return jsonify(catalog_stats()), 200
+
+
+@admin_bp.route("/catalog/refresh", methods=["POST"])
+@login_required
+@admin_required
+def refresh_catalog():
+    """Drop this worker's cached catalog so the next read reloads it from Supabase."""
+    invalidate_catalog()
+    return jsonify({"message": "Catalog cache invalidated"}), 200
+
+
 # ──────────────────────────────────────────────────────────────────
 # ADMIN DASHBOARD OVERVIEW
 # ──────────────────────────────────────────────────────────────────
@@ -320,6 +402,8 @@ def add_steps(scholarship_id: str):
 def admin_overview():
     """
     High-level dashboard stats for admins.
+    With ADMIN_STATS_ESTIMATED, total_users and total_notifications_sent
+    are planner estimates (constant time on large tables).
     
     Response 200:
         {
@@ -330,23 +414,89 @@ def admin_overview():
         }
     """
     try:
-        scholarships_result = (
-            supabase_admin.table("scholarships").select("id, is_active").execute()
-        )
-        all_scholarships = scholarships_result.data or []
-        active_count     = sum(1 for s in all_scholarships if s.get("is_active"))
+        # Counted inside Postgres by admin_overview_stats() (07_admin_stats.sql)
+        result = supabase_admin.rpc(
+            "admin_overview_stats",
+            {"p_estimated": current_app.config.get("ADMIN_STATS_ESTIMATED", False)}
+        ).execute()
+        stats = (result.data or [{}])[0]
+
+        return jsonify({
+            "total_scholarships":       stats.get("total_scholarships", 0),
+            "active_scholarships":      stats.get("active_scholarships", 0),
+            "total_users":              stats.get("total_users", 0),
+            "total_notifications_sent": stats.get("total_notifications_sent", 0)
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 
-        profiles_result = supabase_admin.table("profiles").select("id").execute()
-        total_users     = len(profiles_result.data or [])
+STATS_GRANULARITIES  = ("day", "week", "month")
+STATS_MAX_RANGE_DAYS = 3 * 366
 
-        notif_result          = supabase_admin.table("notifications").select("id").execute()
-        total_notifications   = len(notif_result.data or [])
 
+@admin_bp.route("/stats/timeseries", methods=["GET"])
+@login_required
+@admin_required
+def admin_stats_timeseries():
+    """
+    Dashboard trends read from the pre-aggregated daily_stats buckets
+    (08_daily_stats.sql), kept up to date by the scheduled
+    refresh_daily_stats() job – never from the raw tables.
+
+    Query Params:
+        from        – YYYY-MM-DD (default: 30 days before 'to')
+        to          – YYYY-MM-DD (default: today)
+        granularity – day | week | month (default: day)
+
+    Response 200:
+        {
+            "from": "2025-10-27", "to": "2025-11-25", "granularity": "day",
+            "buckets": [
+                {
+                    "bucket": "2025-11-25",
+                    "signups": 12,
+                    "notifications_created": 40,
+                    "notifications_unread": 31,
+                    "unread_ratio": 0.775,
+                    "active_scholarships": 23
+                },
+                ...
+            ]
+        }
+    """
+    granularity = request.args.get("granularity", "day")
+    if granularity not in STATS_GRANULARITIES:
+        return jsonify({"error": f"granularity must be one of: {', '.join(STATS_GRANULARITIES)}"}), 400
+
+    try:
+        date_to   = date.fromisoformat(request.args["to"]) if request.args.get("to") else date.today()
+        date_from = (
+            date.fromisoformat(request.args["from"]) if request.args.get("from")
+            else date_to - timedelta(days=30)
+        )
+    except ValueError:
+        return jsonify({"error": "from and to must be dates in YYYY-MM-DD format"}), 400
+    if date_from > date_to:
+        return jsonify({"error": "from must not be after to"}), 400
+    if (date_to - date_from).days > STATS_MAX_RANGE_DAYS:
+        return jsonify({"error": f"Date range is limited to {STATS_MAX_RANGE_DAYS} days"}), 400
+
+    try:
+        result = supabase_admin.rpc("admin_stats_timeseries", {
+            "p_from":        date_from.isoformat(),
+            "p_to":          date_to.isoformat(),
+            "p_granularity": granularity
+        }).execute()
+        buckets = [
+            {**row, "unread_ratio": float(row.get("unread_ratio") or 0)}
+            for row in (result.data or [])
+        ]
         return jsonify({
-            "total_scholarships":      len(all_scholarships),
-            "active_scholarships":     active_count,
-            "total_users":             total_users,
-            "total_notifications_sent": total_notifications
+            "from":        date_from.isoformat(),
+            "to":          date_to.isoformat(),
+            "granularity": granularity,
+            "buckets":     buckets
         }), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
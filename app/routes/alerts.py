@@ -5,15 +5,28 @@ PURPOSE:
   1. User alert preference management (set how many days before deadline to alert)
   2. Deadline alert system routes (manual trigger + status)
   3. Core alert logic called by the daily cron job
+  4. Live notification stream (Server-Sent Events)
 """
 
-from datetime import date, timedelta
-from flask import Blueprint, request, jsonify, g
-from app.middleware.auth import login_required, admin_required
+import logging
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+from flask import Blueprint, request, jsonify, g, current_app, Response, stream_with_context
+from app.middleware.auth import login_required, admin_required, allow_query_token
 from app.extensions import supabase_admin, supabase_client
 from app.middleware.auth import get_user_client
+from app.services.catalog import get_catalog
+from app.services.matching import get_matching_engine
+from app.services.notification_hub import get_notification_hub, StreamLimitError
+from app.services.sse import format_sse, SSE_HEADERS
 
 alerts_bp = Blueprint("alerts", __name__)
+logger    = logging.getLogger("keralaseva.alerts")
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -95,106 +108,396 @@ def set_alert_preferences():
 # CORE DEADLINE ALERT JOB
 # ──────────────────────────────────────────────────────────────────
 
-def run_deadline_alert_job() -> dict:
+ALERT_JOB_STRATEGIES = ("sql", "per_user", "cohort")
+PAGE_SIZE            = 1000   # PostgREST max-rows default on Supabase
+
+
+def _run_set_based_alert_job(today: date, full_rescan: bool = False) -> dict:
     """
-    Core alert function called by the daily cron job or admin trigger.
-    
-    Algorithm:
-    1. Fetch all alert preferences for all users
-    2. For each user:
-       a. Determine their alert_before_days threshold
-       b. Get scholarships with deadline <= today + threshold
-       c. For each such scholarship, check if the user is eligible
-          by calling get_matching_scholarships() SQL function
-       d. If eligible AND no existing notification → INSERT notification
-    
-    This avoids creating duplicate alerts (UNIQUE constraint on user_id + scholarship_id).
-    
-    Returns:
-        { "notifications_created": int, "users_processed": int, "errors": list }
+    One RPC that matches users against upcoming scholarships and
+    bulk-inserts the notifications with ON CONFLICT DO NOTHING, inside
+    Postgres.
+
+    With ALERT_JOB_INCREMENTAL (default) this is
+    generate_deadline_alerts_incremental() (05_incremental_alerts.sql),
+    which only evaluates pairs affected by changes since the stored
+    watermark; full_rescan=True forces a complete pass for recovery.
+    Otherwise generate_deadline_alerts() (04_deadline_alerts.sql)
+    rescans everything.
     """
-    today             = date.today()
-    errors            = []
-    notifications_created = 0
-    users_processed   = 0
+    if current_app.config.get("ALERT_JOB_INCREMENTAL", True):
+        result = supabase_admin.rpc(
+            "generate_deadline_alerts_incremental",
+            {"p_today": today.isoformat(), "p_full": full_rescan}
+        ).execute()
+    else:
+        result = supabase_admin.rpc(
+            "generate_deadline_alerts",
+            {"p_today": today.isoformat()}
+        ).execute()
+    row = (result.data or [{}])[0]
+    if "full_rescan" in row:
+        logger.info(f"Alert job mode: {'full rescan' if row['full_rescan'] else 'incremental'}")
+    return {
+        "notifications_created": row.get("notifications_created", 0),
+        "users_processed":       row.get("users_processed", 0),
+        "errors":                []
+    }
+
+
+class _RateLimiter:
+    """Thread-safe limiter spacing calls at least 1/rate seconds apart (rate <= 0 disables)."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at  = time.monotonic()
+        self._lock     = threading.Lock()
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _process_user(user_id: str, alert_before_days: int, today: date, limiter: _RateLimiter) -> tuple[int, list]:
+    """
+    Match one user and insert their due notifications.
+    Returns (notifications_created, errors); never raises, so one bad
+    user cannot abort the run.
+    """
+    errors  = []
+    created = 0
+    alert_cutoff = (today + timedelta(days=alert_before_days)).isoformat()
 
     try:
-        # Step 1: Get all users with their alert preferences
-        # We use admin client to bypass RLS for the server job
-        prefs_result = supabase_admin.table("user_alert_preferences").select("*").execute()
-        all_prefs    = prefs_result.data or []
-
-        # Also get users WITHOUT preferences (use default of 7 days)
-        profiles_result = supabase_admin.table("profiles").select("id").execute()
-        all_profile_ids = {p["id"] for p in (profiles_result.data or [])}
-        pref_user_ids   = {p["user_id"] for p in all_prefs}
-        
-        # Build user → days map
-        user_days_map = {p["user_id"]: p["alert_before_days"] for p in all_prefs}
-        for uid in all_profile_ids - pref_user_ids:
-            user_days_map[uid] = 7  # default
-
-        # Step 2: For each user, find eligible upcoming scholarships
-        for user_id, alert_before_days in user_days_map.items():
-            users_processed += 1
-            alert_cutoff = (today + timedelta(days=alert_before_days)).isoformat()
+        # Get all scholarships matching this user via our SQL function
+        limiter.wait()
+        matching_result = supabase_admin.rpc(
+            "get_matching_scholarships",
+            {"p_user_id": user_id}
+        ).execute()
+        matching = matching_result.data or []
+
+        # Filter to those whose deadline is within the alert window
+        upcoming_eligible = [
+            s for s in matching
+            if s.get("deadline") and s["deadline"] <= alert_cutoff
+            and s["deadline"] >= today.isoformat()
+        ]
+
+        # Insert notifications (existing user+scholarship pairs are
+        # skipped by the UNIQUE constraint and return no row)
+        for scholarship in upcoming_eligible:
+            s_id     = scholarship["scholarship_id"]
+            s_name   = scholarship["name"]
+            deadline = scholarship["deadline"]
+            days_left = scholarship.get("days_until_due", "?")
+
+            message = (
+                f"⏰ Deadline Alert: '{s_name}' deadline is on {deadline} "
+                f"({days_left} days remaining). Apply now!"
+            )
 
             try:
-                # Get all scholarships matching this user via our SQL function
-                matching_result = supabase_admin.rpc(
-                    "get_matching_scholarships",
-                    {"p_user_id": user_id}
+                limiter.wait()
+                inserted = supabase_admin.table("notifications").upsert(
+                    {
+                        "user_id":        user_id,
+                        "scholarship_id": s_id,
+                        "message":        message,
+                        "is_read":        False
+                    },
+                    on_conflict="user_id,scholarship_id",
+                    ignore_duplicates=True
                 ).execute()
-                matching = matching_result.data or []
-
-                # Filter to those whose deadline is within the alert window
-                upcoming_eligible = [
-                    s for s in matching
-                    if s.get("deadline") and s["deadline"] <= alert_cutoff
-                    and s["deadline"] >= today.isoformat()
-                ]
-
-                # Step 3: Insert notifications (skip if already exists)
-                for scholarship in upcoming_eligible:
-                    s_id     = scholarship["scholarship_id"]
-                    s_name   = scholarship["name"]
-                    deadline = scholarship["deadline"]
-                    days_left = scholarship.get("days_until_due", "?")
-
-                    message = (
-                        f"⏰ Deadline Alert: '{s_name}' deadline is on {deadline} "
-                        f"({days_left} days remaining). Apply now!"
-                    )
-
-                    try:
-                        supabase_admin.table("notifications").insert({
-                            "user_id":        user_id,
-                            "scholarship_id": s_id,
-                            "message":        message,
-                            "is_read":        False
-                        }).execute()
-                        notifications_created += 1
-                    except Exception as insert_err:
-                        # Unique constraint violation = duplicate, skip silently
-                        if "unique" in str(insert_err).lower():
-                            pass
-                        else:
-                            errors.append(f"user {user_id}, scholarship {s_id}: {str(insert_err)}")
-
-            except Exception as user_err:
-                errors.append(f"Processing user {user_id}: {str(user_err)}")
+                created += len(inserted.data or [])
+            except Exception as insert_err:
+                errors.append(f"user {user_id}, scholarship {s_id}: {str(insert_err)}")
 
-    except Exception as e:
-        errors.append(f"Fatal error in alert job: {str(e)}")
+    except Exception as user_err:
+        errors.append(f"Processing user {user_id}: {str(user_err)}")
+
+    return created, errors
+
+
+def _run_per_user_alert_job(today: date) -> dict:
+    """
+    Per-user strategy: one get_matching_scholarships RPC per user and one
+    notification insert per match. Kept for databases where
+    04_deadline_alerts.sql has not been applied.
+
+    Users are processed by a bounded thread pool (ALERT_JOB_WORKERS) with
+    calls to Supabase capped at ALERT_JOB_MAX_RPS. Counts are aggregated
+    from each user's result in this thread, so they stay exact.
+    """
+    cfg      = current_app.config
+    workers  = max(1, int(cfg.get("ALERT_JOB_WORKERS", 8)))
+    limiter  = _RateLimiter(float(cfg.get("ALERT_JOB_MAX_RPS", 20)))
+    progress_every = float(cfg.get("ALERT_JOB_PROGRESS_SECONDS", 10))
+
+    errors                = []
+    notifications_created = 0
+    users_processed       = 0
+
+    # Step 1: Get all users with their alert preferences
+    # We use admin client to bypass RLS for the server job; both tables
+    # are read page by page (a single select stops at PostgREST max-rows)
+    all_prefs = _fetch_all("user_alert_preferences", "user_id, alert_before_days", order="user_id")
+
+    # Also get users WITHOUT preferences (use default of 7 days)
+    all_profile_ids = {p["id"] for p in _fetch_all("profiles", "id", order="id")}
+    pref_user_ids   = {p["user_id"] for p in all_prefs}
+
+    # Build user → days map
+    user_days_map = {p["user_id"]: p["alert_before_days"] for p in all_prefs}
+    for uid in all_profile_ids - pref_user_ids:
+        user_days_map[uid] = 7  # default
+
+    # Step 2: Match and notify users concurrently
+    total      = len(user_days_map)
+    started    = time.monotonic()
+    last_log   = started
+    logger.info(f"Alert job: processing {total} users with {workers} workers")
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="alert-job") as pool:
+        futures = [
+            pool.submit(_process_user, user_id, days, today, limiter)
+            for user_id, days in user_days_map.items()
+        ]
+        for future in as_completed(futures):
+            created, user_errors = future.result()
+            users_processed       += 1
+            notifications_created += created
+            errors.extend(user_errors)
+
+            now = time.monotonic()
+            if now - last_log >= progress_every or users_processed == total:
+                last_log = now
+                rate = users_processed / (now - started) if now > started else 0.0
+                eta  = (total - users_processed) / rate if rate else 0.0
+                logger.info(
+                    f"Alert job progress: {users_processed}/{total} users, "
+                    f"{rate:.1f} users/s, ETA {eta:.0f}s, "
+                    f"{notifications_created} notifications, {len(errors)} errors"
+                )
 
     return {
         "notifications_created": notifications_created,
         "users_processed":       users_processed,
-        "run_date":              today.isoformat(),
         "errors":                errors
     }
 
 
+def _fetch_all(table: str, columns: str, order: str) -> list[dict]:
+    """
+    Read a whole table with the service client, page by page.
+    order must be a unique column: without a stable order Postgres may
+    return pages from different scans, skipping or repeating rows.
+    """
+    rows, start = [], 0
+    while True:
+        page = (
+            supabase_admin
+            .table(table)
+            .select(columns)
+            .order(order)
+            .range(start, start + PAGE_SIZE - 1)
+            .execute()
+            .data or []
+        )
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        start += PAGE_SIZE
+
+
+def _cohort_notification_rows(profiles: list[dict], days_by_user: dict, engine,
+                              thresholds: list[int], today: date) -> tuple[list[dict], int]:
+    """
+    Notification rows due today for every profile, matching once per
+    cohort. Returns (rows, number of cohorts). No I/O – the same rows a
+    per-user engine.match() pass would produce.
+    """
+    # cohort key → (representative profile, {alert_before_days: [user_id, ...]})
+    cohorts: dict[tuple, tuple[dict, dict]] = {}
+    for p in profiles:
+        income_class = bisect_left(thresholds, p["income"]) if p.get("income") is not None else None
+        key = (p.get("community"), p.get("gender"), p.get("education_level"), income_class)
+        if key not in cohorts:
+            cohorts[key] = (p, defaultdict(list))
+        alert_before_days = days_by_user.get(p["id"])
+        cohorts[key][1][7 if alert_before_days is None else alert_before_days].append(p["id"])
+
+    today_iso = today.isoformat()
+    rows      = []
+    for representative, users_by_days in cohorts.values():
+        matching = [s for s in engine.match(representative) if s["deadline"] and s["deadline"] >= today_iso]
+        if not matching:
+            continue
+        for alert_before_days, user_ids in users_by_days.items():
+            alert_cutoff = (today + timedelta(days=alert_before_days)).isoformat()
+            for s in matching:
+                if s["deadline"] > alert_cutoff:
+                    continue
+                days_left = (date.fromisoformat(s["deadline"]) - today).days
+                message = (
+                    f"⏰ Deadline Alert: '{s['name']}' deadline is on {s['deadline']} "
+                    f"({days_left} days remaining). Apply now!"
+                )
+                rows.extend(
+                    {
+                        "user_id":        user_id,
+                        "scholarship_id": s["scholarship_id"],
+                        "message":        message,
+                        "is_read":        False
+                    }
+                    for user_id in user_ids
+                )
+    return rows, len(cohorts)
+
+
+def _run_cohort_alert_job(today: date) -> dict:
+    """
+    Cohort strategy: matching only depends on (community, gender,
+    education_level, income), so users are grouped into cohorts and
+    matched once per cohort with the in-process engine
+    (app/services/matching.py).
+
+    Income is reduced to its position among the catalog's distinct
+    income_limit thresholds: two incomes with the same number of
+    thresholds below them pass exactly the same limits. Each cohort's
+    matches are filtered once per alert_before_days value and the
+    resulting notifications are bulk-inserted in batches.
+    """
+    batch_size = int(current_app.config.get("ALERT_JOB_INSERT_BATCH", 500))
+    started    = time.monotonic()
+
+    profiles = _fetch_all("profiles", "id, community, gender, education_level, income", order="id")
+    prefs    = _fetch_all("user_alert_preferences", "user_id, alert_before_days", order="user_id")
+    days_by_user = {p["user_id"]: p["alert_before_days"] for p in prefs}
+
+    engine     = get_matching_engine()
+    thresholds = sorted({
+        s["income_limit"] for s in get_catalog()["scholarships"]
+        if s.get("income_limit")
+    })
+    rows, cohort_count = _cohort_notification_rows(profiles, days_by_user, engine, thresholds, today)
+
+    # Users with preferences but no profile match nothing, as in the SQL function
+    users_processed = len({p["id"] for p in profiles} | set(days_by_user))
+    logger.info(f"Alert job: {users_processed} users in {cohort_count} cohorts")
+
+    errors                = []
+    notifications_created = 0
+    for i in range(0, len(rows), batch_size):
+        batch = rows[i:i + batch_size]
+        try:
+            inserted = supabase_admin.table("notifications").upsert(
+                batch,
+                on_conflict="user_id,scholarship_id",
+                ignore_duplicates=True
+            ).execute()
+            notifications_created += len(inserted.data or [])
+        except Exception as insert_err:
+            errors.append(f"Inserting notifications {i}-{i + len(batch) - 1}: {str(insert_err)}")
+
+    logger.info(
+        f"Alert job (cohort): {len(rows)} due pairs, {notifications_created} new, "
+        f"{time.monotonic() - started:.2f}s"
+    )
+    return {
+        "notifications_created": notifications_created,
+        "users_processed":       users_processed,
+        "errors":                errors
+    }
+
+
+def _publish_new_notifications(since: datetime) -> None:
+    """
+    Push notifications created by this run to the users with an open
+    /api/alerts/stream in this worker. Only those users' rows are read.
+    Streams in other workers pick the rows up on their next resync.
+    """
+    hub      = get_notification_hub()
+    user_ids = hub.subscribed_user_ids()
+    # Margin for clock skew between this host and Postgres; streams drop
+    # rows they have already sent
+    since_iso = (since - timedelta(minutes=5)).isoformat()
+    for i in range(0, len(user_ids), 100):
+        rows = (
+            supabase_admin
+            .table("notifications")
+            .select("*")
+            .in_("user_id", user_ids[i:i + 100])
+            .gte("created_at", since_iso)
+            .order("id.asc")
+            .execute()
+            .data or []
+        )
+        hub.publish(rows)
+
+
+def run_deadline_alert_job(strategy: str | None = None, full_rescan: bool = False) -> dict:
+    """
+    Core alert function called by the daily cron job or admin trigger.
+
+    Strategies (ALERT_JOB_STRATEGY config, or the strategy argument):
+      "sql"      – default. A single RPC does the matching and bulk insert
+                   inside Postgres; incremental from the last run's
+                   watermark unless full_rescan (or ALERT_JOB_INCREMENTAL
+                   is off).
+      "per_user" – one get_matching_scholarships() RPC per user, then one
+                   insert per match (legacy), on a bounded thread pool.
+      "cohort"   – users grouped by matching attributes and matched once
+                   per cohort in-process, then bulk-inserted.
+
+    Either way a user is notified once per eligible scholarship whose
+    deadline is within their alert_before_days window (default 7);
+    the UNIQUE(user_id, scholarship_id) constraint prevents duplicates.
+    
+    Returns:
+        { "notifications_created": int, "users_processed": int,
+          "run_date": "YYYY-MM-DD", "errors": list }
+    """
+    today      = date.today()
+    started_at = datetime.now(timezone.utc)
+    strategy   = strategy or current_app.config.get("ALERT_JOB_STRATEGY", "sql")
+    if strategy not in ALERT_JOB_STRATEGIES:
+        strategy = "sql"
+
+    try:
+        if strategy == "per_user":
+            result = _run_per_user_alert_job(today)
+        elif strategy == "cohort":
+            result = _run_cohort_alert_job(today)
+        else:
+            result = _run_set_based_alert_job(today, full_rescan=full_rescan)
+    except Exception as e:
+        result = {
+            "notifications_created": 0,
+            "users_processed":       0,
+            "errors":                [f"Fatal error in alert job: {str(e)}"]
+        }
+
+    if result["notifications_created"]:
+        try:
+            _publish_new_notifications(started_at)
+        except Exception as e:
+            logger.warning(f"Could not publish new notifications to streams: {str(e)}")
+
+    return {
+        "notifications_created": result["notifications_created"],
+        "users_processed":       result["users_processed"],
+        "run_date":              today.isoformat(),
+        "errors":                result["errors"]
+    }
+
+
 @alerts_bp.route("/run-job", methods=["POST"])
 @login_required
 @admin_required
@@ -202,6 +505,9 @@ def trigger_alert_job():
     """
     Admin-only endpoint to manually trigger the deadline alert job.
     Normally this is called by a cron job (APScheduler, Celery, or system cron).
+
+    Request Body (optional):
+        { "full_rescan": true }   – ignore the incremental watermark (recovery)
     
     Response 200:
         {
@@ -214,8 +520,153 @@ def trigger_alert_job():
             }
         }
     """
-    result = run_deadline_alert_job()
+    data   = request.get_json(silent=True) or {}
+    result = run_deadline_alert_job(full_rescan=bool(data.get("full_rescan")))
     return jsonify({
         "message": "Alert job completed",
         "result":  result
     }), 200
+
+
+# ──────────────────────────────────────────────────────────────────
+# LIVE NOTIFICATION STREAM (SSE)
+# ──────────────────────────────────────────────────────────────────
+
+def _notifications_after(user_id: str, last_id: int, limit: int = 100) -> list[dict]:
+    return (
+        supabase_admin
+        .table("notifications")
+        .select("*")
+        .eq("user_id", user_id)
+        .gt("id", last_id)
+        .order("id.asc")
+        .limit(limit)
+        .execute()
+        .data or []
+    )
+
+
+def _latest_notification_id(user_id: str) -> int:
+    rows = (
+        supabase_admin
+        .table("notifications")
+        .select("id")
+        .eq("user_id", user_id)
+        .order("id.desc")
+        .limit(1)
+        .execute()
+        .data or []
+    )
+    return rows[0]["id"] if rows else 0
+
+
+def _stream_notifications(hub, sub, last_id: int, expires_at: float | None,
+                          heartbeat: float, resync: float):
+    """
+    Event stream for one subscription: catch-up from the database after
+    last_id, then live rows from the hub. Every event carries the
+    notification id, so a reconnecting EventSource resumes with
+    Last-Event-ID. Ends when the access token expires (the client
+    reconnects with a fresh one).
+    """
+    def replay():
+        nonlocal last_id
+        while True:
+            rows = _notifications_after(sub.user_id, last_id)
+            for row in rows:
+                last_id = row["id"]
+                yield format_sse(row, event="notification", event_id=row["id"])
+            if len(rows) < 100:
+                return
+
+    try:
+        yield "retry: 5000\n\n"
+        yield from replay()
+        next_resync = time.monotonic() + resync
+        while expires_at is None or time.time() < expires_at:
+            try:
+                row = sub.queue.get(timeout=heartbeat)
+            except queue.Empty:
+                row = None
+
+            if sub.overflowed or time.monotonic() >= next_resync:
+                # Missed pushes (full queue) or rows published by the
+                # alert job in another worker: read them from the database
+                sub.overflowed = False
+                while not sub.queue.empty():
+                    sub.queue.get_nowait()
+                yield from replay()
+                next_resync = time.monotonic() + resync
+            elif row is not None and row["id"] > last_id:
+                last_id = row["id"]
+                yield format_sse(row, event="notification", event_id=row["id"])
+            elif row is None:
+                yield ": keep-alive\n\n"
+    finally:
+        hub.unsubscribe(sub)
+
+
+@alerts_bp.route("/stream", methods=["GET"])
+@login_required
+@allow_query_token
+def stream_notifications():
+    """
+    Server-Sent Events stream of the user's new notifications.
+
+    EventSource cannot set headers, so the token may be passed as
+    ?access_token=... (accepted only here, on text/event-stream requests).
+    Resumes after the Last-Event-ID header (sent automatically by
+    EventSource on reconnect) or ?last_event_id=; a fresh connection
+    only receives notifications created from now on.
+
+    Events:
+        event: notification   id: <notification id>   data: { notification row }
+        ": keep-alive" comments every ALERT_STREAM_HEARTBEAT_SECONDS
+
+    Response 503: the worker already serves its maximum number of streams
+    (ALERT_STREAM_MAX_PER_WORKER, lowered to leave
+    ALERT_STREAM_RESERVED_THREADS of the worker's threads for other
+    requests – see get_notification_hub).
+    """
+    cfg     = current_app.config
+    user_id = g.user.id
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    try:
+        last_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        return jsonify({"error": "Last-Event-ID must be a notification id"}), 400
+
+    hub = get_notification_hub()
+    try:
+        sub = hub.subscribe(user_id)
+    except StreamLimitError:
+        retry_after = cfg.get("ALERT_STREAM_RETRY_AFTER_SECONDS", 30)
+        response = jsonify({"error": "Too many open streams, retry later", "retry_after": retry_after})
+        response.headers["Retry-After"] = str(retry_after)
+        return response, 503
+
+    try:
+        if last_id is None:
+            last_id = _latest_notification_id(user_id)
+    except Exception as e:
+        hub.unsubscribe(sub)
+        return jsonify({"error": str(e)}), 500
+
+    claims   = getattr(g.user, "claims", None) or {}
+    response = Response(
+        stream_with_context(_stream_notifications(
+            hub,
+            sub,
+            last_id,
+            expires_at = claims.get("exp"),
+            heartbeat  = cfg.get("ALERT_STREAM_HEARTBEAT_SECONDS", 15),
+            resync     = cfg.get("ALERT_STREAM_RESYNC_SECONDS", 120),
+        )),
+        mimetype="text/event-stream",
+        headers=SSE_HEADERS
+    )
+    # Frees the slot even if the client leaves before the first chunk
+    # (a generator that never started does not run its finally block)
+    response.call_on_close(lambda: hub.unsubscribe(sub))
+    return response
@@ -1,46 +1,25 @@
-from flask import Blueprint, request, jsonify
-from app.extensions import supabase_client
-import requests
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context
+from app.services.catalog import get_catalog
+from app.services.retrieval import BM25Index
+from app.services.llm import get_llm_client, LLMBusyError
+from app.services.answer_cache import get_answer_cache
+from app.services.sse import format_sse, SSE_HEADERS
+from app.middleware.auth import login_required, admin_required
+import threading
 
 chat_bp = Blueprint("chat", __name__)
 
-@chat_bp.route("/chat", methods=["POST"])
-def chat():
-
-    data = request.json
-    question = data.get("message", "").strip()
-
-    if not question:
-        return jsonify({"reply": "Please ask a question."}), 400
+DEFAULT_CHAT_TOP_K = 5
 
-    # 🔹 Fetch all active scholarships
-    scholarships = supabase_client.table("scholarships") \
-        .select("*") \
-        .eq("is_active", True) \
-        .execute()
+# Per-scholarship prompt blocks plus a BM25 index over them, rebuilt only
+# when the catalog snapshot version changes. "etag" is the snapshot's
+# content hash, used to key the answer cache.
+_corpus_lock = threading.Lock()
+_corpus: dict = {"version": None, "etag": None, "blocks": [], "index": None}
 
-    all_data_text = ""
 
-    for s in scholarships.data or []:
-        scholarship_id = s["id"]
-
-        eligibility = supabase_client.table("eligibility") \
-            .select("*") \
-            .eq("scholarship_id", scholarship_id) \
-            .execute()
-
-        documents = supabase_client.table("documents_required") \
-            .select("*") \
-            .eq("scholarship_id", scholarship_id) \
-            .execute()
-
-        steps = supabase_client.table("application_steps") \
-            .select("*") \
-            .eq("scholarship_id", scholarship_id) \
-            .order("step_number") \
-            .execute()
-
-        all_data_text += f"""
+def _scholarship_text(s: dict, eligibility: list, documents: list, steps: list) -> str:
+    return f"""
 ----------------------------------------------------
 Scholarship Name: {s.get('name')}
 Description: {s.get('description')}
@@ -50,21 +29,74 @@ Amount: {s.get('amount_min')} - {s.get('amount_max')}
 Apply Here: {s.get('portal_url')}
 
 Eligibility:
-{eligibility.data}
+{eligibility}
 
 Documents Required:
-{documents.data}
+{documents}
 
 Application Steps:
-{steps.data}
+{steps}
 """
 
-    try:
-        ollama_response = requests.post(
-            "http://localhost:11434/api/generate",
-            json={
-                "model": "llama3",
-                "prompt": f"""
+
+def _search_text(s: dict, eligibility: list, documents: list, steps: list) -> str:
+    """Text indexed for retrieval. The name is repeated to weight it above the body."""
+    parts = [s.get("name") or "", s.get("name") or "", s.get("description") or ""]
+    for e in eligibility:
+        parts += [e.get("community") or "", e.get("gender") or "", e.get("education_level") or ""]
+    parts += [d.get("document_name") or "" for d in documents]
+    parts += [st.get("step_text") or "" for st in steps]
+    return " ".join(parts)
+
+
+def _build_corpus(catalog: dict) -> dict:
+    """Prompt blocks and BM25 index for a catalog snapshot (blocks in catalog order)."""
+    blocks, search_docs = [], []
+    for s in catalog["scholarships"]:
+        related = (
+            catalog["eligibility"].get(s["id"], []),
+            catalog["documents_required"].get(s["id"], []),
+            catalog["application_steps"].get(s["id"], []),
+        )
+        blocks.append(_scholarship_text(s, *related))
+        search_docs.append(_search_text(s, *related))
+    return {
+        "version": catalog["version"],
+        "etag":    catalog["etag"],
+        "blocks":  blocks,
+        "index":   BM25Index(search_docs),
+    }
+
+
+def _get_corpus() -> dict:
+    global _corpus
+    catalog = get_catalog()
+    if _corpus["version"] == catalog["version"]:
+        return _corpus
+
+    with _corpus_lock:
+        if _corpus["version"] != catalog["version"]:
+            # Swap in a new dict so readers never see a half-updated corpus
+            _corpus = _build_corpus(catalog)
+        return _corpus
+
+
+def _retrieve_context(corpus: dict, question: str, top_k: int) -> str:
+    """
+    Prompt text for the top-k scholarships relevant to the question.
+    Falls back to the first k (soonest deadline) when no term matches,
+    so general questions still get some database context.
+    top_k below 1 is treated as 1, so the prompt is never empty.
+    """
+    top_k = max(1, int(top_k))
+    hits  = corpus["index"].search(question, top_k)
+    if hits:
+        return "".join(corpus["blocks"][pos] for pos, _ in hits)
+    return "".join(corpus["blocks"][:top_k])
+
+
+def _build_prompt(all_data_text: str, question: str) -> str:
+    return f"""
 You are KeralaSeva AI Assistant.
 
 You MUST answer only from the database below.
@@ -78,15 +110,150 @@ USER QUESTION:
 {question}
 
 Answer clearly and structured.
-""",
-                "stream": False
-            }
-        )
+"""
 
-        reply_text = ollama_response.json().get("response", "Sorry, I could not answer that.")
 
-        return jsonify({"reply": reply_text})
+def _relay_tokens(tokens, on_complete):
+    """
+    Relay model tokens as SSE 'token' events, then a 'done' event.
+    on_complete(reply) is called with the full text only if the
+    generation finished.
 
+    If the client disconnects, the response is closed and tokens.close()
+    (registered with call_on_close) drops the upstream connection, which
+    makes Ollama abort the generation and frees the slot.
+    """
+    parts = []
+    try:
+        for token in tokens:
+            parts.append(token)
+            yield format_sse({"token": token}, event="token")
+        on_complete("".join(parts))
+        yield format_sse({"cached": False}, event="done")
     except Exception as e:
         print("OLLAMA ERROR:", e)
-        return jsonify({"reply": "AI service unavailable."}), 200
\ No newline at end of file
+        yield format_sse({"reply": "AI service unavailable."}, event="error")
+    finally:
+        tokens.close()
+
+
+def _busy_response(err: LLMBusyError):
+    response = jsonify({
+        "reply":       "The assistant is busy right now. Please try again in a few seconds.",
+        "retry_after": err.retry_after
+    })
+    response.headers["Retry-After"] = str(err.retry_after)
+    return response, 503
+
+
+@chat_bp.route("/chat", methods=["POST"])
+def chat():
+    """
+    Answer a question about scholarships from the database.
+
+    Request Body:
+        { "message": "What documents are needed for e-Grantz?", "stream": false }
+
+    Response 200 (stream false):
+        { "reply": "...", "cached": false }
+
+    Response 200 (stream true): text/event-stream of
+        event: token  data: {"token": "..."}     (repeated)
+        event: done   data: {"cached": false}
+        event: error  data: {"reply": "AI service unavailable."}
+
+    Repeated questions (same normalized text, same catalog content) are
+    answered from the answer cache with "cached": true.
+
+    Response 503 (all generation slots and the wait queue are full):
+        { "reply": "...busy...", "retry_after": 10 }   + Retry-After header
+    """
+
+    data = request.json
+    question = data.get("message", "").strip()
+
+    if not question:
+        return jsonify({"reply": "Please ask a question."}), 400
+
+    corpus  = _get_corpus()
+    answers = get_answer_cache()
+    content = corpus["etag"]
+
+    # 🔹 Repeated question against the same catalog → cached answer
+    cached = answers.get(content, question)
+    if cached is not None:
+        if data.get("stream"):
+            return Response(
+                format_sse({"token": cached}, event="token")
+                + format_sse({"cached": True}, event="done"),
+                mimetype="text/event-stream",
+                headers=SSE_HEADERS
+            )
+        return jsonify({"reply": cached, "cached": True})
+
+    # 🔹 Only the scholarships relevant to the question go into the prompt
+    all_data_text = _retrieve_context(
+        corpus, question, current_app.config.get("CHAT_TOP_K", DEFAULT_CHAT_TOP_K)
+    )
+    prompt        = _build_prompt(all_data_text, question)
+
+    llm = get_llm_client()
+
+    if data.get("stream"):
+        try:
+            tokens = llm.stream(prompt)
+        except LLMBusyError as busy:
+            return _busy_response(busy)
+        except Exception as e:
+            print("OLLAMA ERROR:", e)
+            return jsonify({"reply": "AI service unavailable."}), 200
+
+        response = Response(
+            stream_with_context(_relay_tokens(
+                tokens,
+                on_complete=lambda reply: answers.put(content, question, reply)
+            )),
+            mimetype="text/event-stream",
+            headers=SSE_HEADERS
+        )
+        response.call_on_close(tokens.close)
+        return response
+
+    try:
+        reply_text = llm.generate(prompt)
+        answers.put(content, question, reply_text)
+        return jsonify({"reply": reply_text, "cached": False})
+
+    except LLMBusyError as busy:
+        return _busy_response(busy)
+    except Exception as e:
+        print("OLLAMA ERROR:", e)
+        return jsonify({"reply": "AI service unavailable."}), 200
+
+
+@chat_bp.route("/chat/stats", methods=["GET"])
+@login_required
+@admin_required
+def chat_stats():
+    """
+    LLM client queue stats (for sizing LLM_MAX_IN_FLIGHT / LLM_MAX_QUEUE)
+    and answer cache hit/miss counts.
+
+    Response 200:
+        {
+            "llm": {
+                "in_flight": 2, "queue_depth": 3,
+                "max_in_flight": 2, "max_queue": 8,
+                "started": 1520, "rejected": 4,
+                "avg_wait_ms": 812.4, "max_wait_ms": 9650.0
+            },
+            "answer_cache": {
+                "hits": 930, "misses": 590, "hit_ratio": 0.6118,
+                "size": 212, "max_entries": 512, "evictions": 0
+            }
+        }
+    """
+    return jsonify({
+        "llm":          get_llm_client().stats(),
+        "answer_cache": get_answer_cache().stats()
+    }), 200
@@ -4,27 +4,182 @@ FILE: app/routes/scholarships.py
 PURPOSE: Scholarship browsing, personalized matching, and detail view
 """
 
-from flask import Blueprint, request, jsonify, g
-from app.middleware.auth import login_required
+import threading
+from datetime import date, datetime
+from flask import Blueprint, request, jsonify, g, current_app
+from app.middleware.auth import login_required, get_user_client
 from app.extensions import supabase_client, supabase_admin
+from app.services.matching import get_matching_engine
+from app.services.pagination import parse_limit, encode_cursor, decode_cursor, quote
+from app.services.catalog import get_catalog, content_hash, SCHOLARSHIP_COLUMNS
+from app.services.suggest import get_suggest_index, DEFAULT_SUGGESTIONS, MAX_SUGGESTIONS
+from app.services.http_cache import (
+    is_not_modified, not_modified, with_cache_headers,
+    public_cache_control, PRIVATE_CACHE_CONTROL
+)
 
 scholarships_bp = Blueprint("scholarships", __name__)
 
 
+ELIGIBILITY_COLUMNS = ("community", "gender", "education_level")
+
+# Keyset sort order, passed as ONE order param (postgrest-py 0.16 adds a
+# separate param per .order() call and PostgREST keeps only one)
+NOTIFICATION_ORDER  = "created_at.desc,id.desc"
+
+
+def _index_eligibility(rows: list[dict]) -> tuple[list[str], dict[tuple[str, str], set[int]]]:
+    """
+    Index eligibility rows for filtering.
+    Returns (owners, index) where owners[pos] is the scholarship_id of row pos
+    and index maps (column, lowercased value) → set of row positions.
+    """
+    owners: list[str] = []
+    index: dict[tuple[str, str], set[int]] = {}
+    for pos, row in enumerate(rows):
+        owners.append(row["scholarship_id"])
+        for column in ELIGIBILITY_COLUMNS:
+            value = (row.get(column) or "").strip().lower()
+            index.setdefault((column, value), set()).add(pos)
+    return owners, index
+
+
+def _match_eligibility(indexed: tuple[list[str], dict], filters: dict[str, str]) -> set[str]:
+    """
+    Return scholarship ids with at least one eligibility row matching
+    EVERY filter exactly (case-insensitive), e.g. "SC" does not match "SC/OBC".
+    """
+    owners, index = indexed
+    matched: set[int] | None = None
+    for column, value in filters.items():
+        positions = index.get((column, value.strip().lower()), set())
+        matched = positions if matched is None else matched & positions
+        if not matched:
+            return set()
+    return {owners[pos] for pos in matched or ()}
+
+
+# Columns of the detail response's related lists
+DETAIL_ELIGIBILITY_FIELDS = ("id", "community", "gender", "education_level")
+DETAIL_DOCUMENT_FIELDS    = ("id", "document_name")
+DETAIL_STEP_FIELDS        = ("id", "step_number", "step_text")
+
+
+def _pick(row: dict, fields: tuple[str, ...]) -> dict:
+    return {field: row.get(field) for field in fields}
+
+
+def _day_last_modified(catalog: dict) -> float:
+    """Last-Modified for responses that also depend on today's date."""
+    midnight = datetime.combine(date.today(), datetime.min.time()).timestamp()
+    return max(catalog["last_modified"], midnight)
+
+
+_eligibility_index: dict = {"version": None, "indexed": None}
+_eligibility_index_lock = threading.Lock()
+
+
+def _catalog_eligibility(catalog: dict) -> tuple[list[str], dict]:
+    """Eligibility index over the whole catalog, built once per catalog version."""
+    global _eligibility_index
+    cached = _eligibility_index
+    if cached["version"] == catalog["version"]:
+        return cached["indexed"]
+    with _eligibility_index_lock:
+        if _eligibility_index["version"] != catalog["version"]:
+            rows = [
+                {**e, "scholarship_id": record.id}
+                for record in catalog["records"]
+                for e in record.eligibility
+            ]
+            _eligibility_index = {"version": catalog["version"], "indexed": _index_eligibility(rows)}
+        return _eligibility_index["indexed"]
+
+
+# Ranked search returns at most this many results (search_scholarships caps p_limit too)
+SEARCH_MAX_RESULTS = 100
+
+
+def _ranked_search(catalog: dict, search_term: str) -> list:
+    """
+    Catalog records for search_term, most relevant first: ids ranked in
+    Postgres by search_scholarships() (11_fulltext_search.sql – full-text
+    over name, description and document names, trigram typo tolerance),
+    rows taken from the catalog.
+    """
+    result = supabase_client.rpc(
+        "search_scholarships",
+        {"p_query": search_term, "p_limit": SEARCH_MAX_RESULTS}
+    ).execute()
+    by_id = catalog["by_id"]
+    # An id missing from the snapshot was activated since it was loaded
+    return [by_id[r["scholarship_id"]] for r in result.data or [] if r["scholarship_id"] in by_id]
+
+
+def _filter_records(catalog: dict, search_term: str, income: int | None,
+                    upcoming: bool, filters: dict[str, str], ranked: list | None = None) -> list:
+    """
+    Catalog records passing the list filters, in listing order – or, when
+    ranked records are given, those of them passing, in rank order.
+    """
+    today        = date.today().isoformat()
+    search_lower = search_term.lower() if ranked is None else ""
+    eligible_ids = _match_eligibility(_catalog_eligibility(catalog), filters) if filters else None
+
+    records = []
+    for record in catalog["records"] if ranked is None else ranked:
+        row = record.row
+        # 🔍 Keyword search (name substring; ranked search already matched)
+        if search_lower and search_lower not in record.name_lower:
+            continue
+        # 💰 Income filter (same as income_limit = 0 OR income_limit >= income)
+        if income is not None:
+            income_limit = row.get("income_limit")
+            if income_limit is None or (income_limit != 0 and income_limit < income):
+                continue
+        # 📅 Deadline filter (upcoming only)
+        if upcoming and not (row.get("deadline") and row["deadline"] >= today):
+            continue
+        # 🎯 Advanced eligibility filtering (exact, same eligibility row)
+        if eligible_ids is not None and record.id not in eligible_ids:
+            continue
+        records.append(record)
+    return records
+
+
 @scholarships_bp.route("/", methods=["GET"])
 @login_required
 def list_all_scholarships():
     """
-    Return all active scholarships (no personalization filter).
+    Return active scholarships (no personalization filter), one page at a
+    time, ordered by deadline (missing deadlines last), then id.
     Supports advanced filtering via query parameters.
+    Served from the in-process catalog cache (app/services/catalog.py).
+    With SCHOLARSHIP_SEARCH_MODE=fts (default), a search is ranked by
+    relevance instead: best SEARCH_MAX_RESULTS matches, paged in rank order.
+    Conditional GET: ETag / Last-Modified follow the catalog snapshot; a
+    matching If-None-Match or If-Modified-Since gets 304.
 
     Query Params:
-        search      : text search on scholarship name
+        search      : text search – fts: words / "phrases" / -word over
+                      name, description and documents, typo tolerant;
+                      substring: part of the scholarship name
         deadline    : 'upcoming'
         community   : SC / ST / OBC / Minority / etc
         gender      : Male / Female
         education   : Degree / PG / etc
         income      : max income limit (integer)
+        limit       : page size (default 20, max 100)
+        cursor      : next_cursor from the previous page
+        with_total  : '1' to also return the total number of matches
+
+    Response 200:
+        {
+            "count": 20,
+            "scholarships": [...],
+            "next_cursor": "opaque string" | null,
+            "total": 57                      (only with with_total=1)
+        }
     """
 
     search_term     = request.args.get("search", "").strip()
@@ -33,68 +188,76 @@ def list_all_scholarships():
     gender          = request.args.get("gender")
     education       = request.args.get("education")
     income          = request.args.get("income")
+    with_total      = request.args.get("with_total") == "1"
+    ranked_search   = bool(search_term) and current_app.config.get("SCHOLARSHIP_SEARCH_MODE", "fts") == "fts"
 
     try:
-        query = (
-            supabase_client
-            .table("scholarships")
-            .select("*")
-            .eq("is_active", True)
-            .order("deadline", desc=False)
-        )
-
-        # 🔍 Keyword search (name)
-        if search_term:
-            query = query.ilike("name", f"%{search_term}%")
-
-        # 💰 Income filter
+        limit = parse_limit(request.args.get("limit"))
+        after = decode_cursor(request.args.get("cursor"), 2)
+        if after is not None and ranked_search:
+            # ["rank", offset]: position in the ranked result list
+            if after[0] != "rank" or not isinstance(after[1], int) or after[1] < 0:
+                raise ValueError("Invalid cursor")
+        elif after is not None:
+            if after[0] is not None:
+                date.fromisoformat(after[0])
+            if not isinstance(after[1], str):
+                raise ValueError("Invalid cursor")
         if income:
-            query = query.or_(f"income_limit.eq.0,income_limit.gte.{income}")
-
-        result = query.execute()
-        scholarships = result.data or []
-
-        # 📅 Deadline filter (upcoming only)
-        if deadline_filter == "upcoming":
-            from datetime import date
-            today = date.today().isoformat()
-            scholarships = [
-                s for s in scholarships
-                if s.get("deadline") and s["deadline"] >= today
-            ]
-
-        # 🎯 Advanced eligibility filtering
-        if community or gender or education:
-            filtered = []
-
-            for s in scholarships:
-                eligibilities = (
-                    supabase_client
-                    .table("eligibility")
-                    .select("*")
-                    .eq("scholarship_id", s["id"])
-                    .execute()
-                    .data or []
-                )
-
-                for e in eligibilities:
-                    if community and community.lower() not in e.get("community", "").lower():
-                        continue
-                    if gender and gender.lower() not in e.get("gender", "").lower():
-                        continue
-
-                    if education and education.lower() not in e.get("education_level", "").lower():
-                        continue
-
-                    filtered.append(s)
-                    break
+            int(income)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    filters = {
+        column: value
+        for column, value in (
+            ("community",       community),
+            ("gender",          gender),
+            ("education_level", education),
+        )
+        if value
+    }
+    upcoming = deadline_filter == "upcoming"
 
-            scholarships = filtered
+    try:
+        # Same catalog → same page for the same URL ('upcoming' also
+        # changes with the date)
+        catalog       = get_catalog()
+        etag          = f"{catalog['etag']}-{date.today().isoformat()}" if upcoming else catalog["etag"]
+        last_modified = _day_last_modified(catalog) if upcoming else catalog["last_modified"]
+        cache_control = public_cache_control()
+        if is_not_modified(etag, last_modified):
+            return not_modified(etag, last_modified, cache_control)
+
+        # Rows come from the in-process catalog; only a ranked search
+        # queries Supabase (for the ranked ids)
+        ranked  = _ranked_search(catalog, search_term) if ranked_search else None
+        matched = _filter_records(catalog, search_term, int(income) if income else None, upcoming, filters, ranked)
+
+        if ranked_search:
+            offset      = after[1] if after is not None else 0
+            page        = matched[offset:offset + limit]
+            next_cursor = encode_cursor(["rank", offset + limit]) if len(matched) > offset + limit else None
+        else:
+            records = matched
+            if after is not None:
+                after_key = (after[0] is None, after[0] or "", after[1])
+                records   = [r for r in matched if r.sort_key > after_key]
+
+            page        = records[:limit]
+            next_cursor = None
+            if len(records) > limit:
+                next_cursor = encode_cursor([page[-1].row.get("deadline"), page[-1].id])
+
+        response = {
+            "count":        len(page),
+            "scholarships": [r.row for r in page],
+            "next_cursor":  next_cursor
+        }
+        if with_total:
+            response["total"] = len(matched)
 
-        return jsonify({
-            "count": len(scholarships),
-            "scholarships": scholarships
-        }), 200
+        return with_cache_headers(jsonify(response), etag, last_modified, cache_control), 200
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -104,34 +267,91 @@ def list_all_scholarships():
 def get_matching_scholarships():
     """
     Return personalized scholarship matches for logged-in user.
-    Uses SQL RPC function: get_matching_scholarships(p_user_id UUID)
+    Same rules and row shape as the SQL function
+    get_matching_scholarships(p_user_id UUID), evaluated in-process
+    against the cached catalog (see app/services/matching.py).
+
+    Conditional GET: the ETag covers the catalog, the date and the
+    profile's matching attributes, so after the (small) profile lookup a
+    matching If-None-Match gets 304 without running the match or
+    sending the list. Private: cached by the browser only.
     """
 
     user_id = g.user.id
 
     try:
-        result = (
-            supabase_client
-            .rpc("get_matching_scholarships", {"p_user_id": user_id})
+        profile_result = (
+            get_user_client(g.token)
+            .table("profiles")
+            .select("community, gender, education_level, income")
+            .eq("id", user_id)
+            .limit(1)
             .execute()
         )
+        profile = (profile_result.data or [None])[0]
 
-        scholarships = result.data or []
+        catalog       = get_catalog()
+        etag          = content_hash(catalog["etag"], date.today().isoformat(), user_id, profile)
+        last_modified = _day_last_modified(catalog)
+        if is_not_modified(etag, None):
+            return not_modified(etag, last_modified, PRIVATE_CACHE_CONTROL, vary="Authorization")
 
-        return jsonify({
+        # No profile → no matches (same as the SQL function)
+        scholarships = get_matching_engine().match(profile) if profile else []
+
+        response = jsonify({
             "count": len(scholarships),
             "scholarships": scholarships
-        }), 200
+        })
+        return with_cache_headers(
+            response, etag, last_modified, PRIVATE_CACHE_CONTROL, vary="Authorization"
+        ), 200
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    
+
+
+@scholarships_bp.route("/suggest", methods=["GET"])
+@login_required
+def suggest_scholarships():
+    """
+    Typeahead suggestions: scholarships whose name (from any word),
+    initials or a common alias start with q, e.g. "matric", "manf",
+    "e-grants". Served from an in-memory prefix index over the catalog
+    (app/services/suggest.py) – no Supabase query.
+
+    Query Params:
+        q       : what the user has typed so far
+        limit   : number of suggestions (default 8, max 10)
+
+    Response 200:
+        { "suggestions": [ { "id": "uuid", "name": "E-Grantz Scholarship (Kerala)" }, ... ] }
+    """
+    try:
+        limit = parse_limit(request.args.get("limit"), DEFAULT_SUGGESTIONS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        suggestions = get_suggest_index().suggest(request.args.get("q", ""), min(limit, MAX_SUGGESTIONS))
+        response    = jsonify({"suggestions": suggestions})
+        response.headers["Cache-Control"] = public_cache_control()
+        return response, 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @scholarships_bp.route("/<string:scholarship_id>", methods=["GET"])
 @login_required
 def get_scholarship_detail(scholarship_id: str):
     """
     Full detail page for a single scholarship.
     Returns all related data: eligibility, documents, steps.
+    Active scholarships are served from the in-process catalog cache;
+    others (inactive) are read from Supabase in one embedded query.
+    Conditional GET for active scholarships: the ETag is the
+    scholarship's content hash in the catalog snapshot, so a matching
+    If-None-Match / If-Modified-Since gets 304.
     
     Response 200:
         {
@@ -162,65 +382,114 @@ def get_scholarship_detail(scholarship_id: str):
         }
     """
     try:
-        # 1. Fetch scholarship base record
-        s_result = (
+        catalog       = get_catalog()
+        etag          = catalog["etags"].get(scholarship_id)   # None: inactive / unknown
+        last_modified = catalog["last_modified"]
+        cache_control = public_cache_control()
+        if etag and is_not_modified(etag, last_modified):
+            return not_modified(etag, last_modified, cache_control)
+
+        # Active scholarships are served from the in-process catalog
+        record = catalog["by_id"].get(scholarship_id)
+        if record is not None:
+            response = jsonify({
+                "scholarship":        record.row,
+                "eligibility":        [_pick(e, DETAIL_ELIGIBILITY_FIELDS) for e in record.eligibility],
+                "documents_required": [_pick(d, DETAIL_DOCUMENT_FIELDS) for d in record.documents],
+                "application_steps":  [_pick(st, DETAIL_STEP_FIELDS) for st in record.steps]
+            })
+            return with_cache_headers(response, etag, last_modified, cache_control), 200
+
+        # Inactive / unknown: one round trip with eligibility rows,
+        # documents and steps embedded (steps ordered by step_number)
+        result = (
             supabase_client
             .table("scholarships")
-            .select("*")
+            .select(
+                f"{SCHOLARSHIP_COLUMNS}, "
+                "eligibility(id, community, gender, education_level), "
+                "documents_required(id, document_name), "
+                "application_steps(id, step_number, step_text)"
+            )
             .eq("id", scholarship_id)
-            .single()
+            .order("step_number", foreign_table="application_steps")
+            .limit(1)
             .execute()
         )
-        if not s_result.data:
+        if not result.data:
             return jsonify({"error": "Scholarship not found"}), 404
 
-        scholarship = s_result.data
-
-        # 2. Fetch eligibility rows
-        e_result = (
-            supabase_client
-            .table("eligibility")
-            .select("id, community, gender, education_level")
-            .eq("scholarship_id", scholarship_id)
-            .execute()
-        )
-
-        # 3. Fetch required documents
-        d_result = (
-            supabase_client
-            .table("documents_required")
-            .select("id, document_name")
-            .eq("scholarship_id", scholarship_id)
-            .execute()
-        )
-
-        # 4. Fetch application steps ordered by step_number
-        steps_result = (
-            supabase_client
-            .table("application_steps")
-            .select("id, step_number, step_text")
-            .eq("scholarship_id", scholarship_id)
-            .order("step_number", desc=False)
-            .execute()
-        )
+        scholarship        = result.data[0]
+        eligibility        = scholarship.pop("eligibility", None) or []
+        documents_required = scholarship.pop("documents_required", None) or []
+        application_steps  = scholarship.pop("application_steps", None) or []
 
         return jsonify({
             "scholarship":        scholarship,
-            "eligibility":        e_result.data or [],
-            "documents_required": d_result.data or [],
-            "application_steps":  steps_result.data or []
+            "eligibility":        eligibility,
+            "documents_required": documents_required,
+            "application_steps":  application_steps
         }), 200
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+def _count_unread(user_id: str) -> int:
+    """Unread notifications counted in Postgres (partial index idx_notifications_user_unread)."""
+    return (
+        supabase_client
+        .table("notifications")
+        .select("id", count="exact")
+        .eq("user_id", user_id)
+        .eq("is_read", False)
+        .limit(1)
+        .execute()
+        .count or 0
+    )
+
+
+def _parse_since(raw: str) -> tuple[str, int | str]:
+    """since marker → ("id", int) or ("created_at", ISO timestamp). Raises ValueError."""
+    if raw.isdigit():
+        return "id", int(raw)
+    datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    return "created_at", raw
+
+
+@scholarships_bp.route("/notifications/unread-count", methods=["GET"])
+@login_required
+def get_unread_count():
+    """
+    Number of unread notifications – cheap enough to poll.
+
+    Response 200:
+        { "unread_count": 3 }
+    """
+    try:
+        return jsonify({"unread_count": _count_unread(g.user.id)}), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @scholarships_bp.route("/notifications", methods=["GET"])
 @login_required
 def get_my_notifications():
     """
-    Get all deadline notifications for the authenticated user.
+    Get the authenticated user's deadline notifications, newest first,
+    one page at a time (keyset on created_at, id).
     RLS ensures users only see their own notifications.
+
+    Query Params:
+        limit       : page size (default 20, max 100)
+        cursor      : next_cursor from the previous page
+        with_total  : '1' to also return the total number of notifications
+        since       : delta mode – a notification id (e.g. the previous
+                      response's latest_id) or an ISO timestamp; returns
+                      only notifications created after it (up to limit,
+                      oldest first – poll again while has_more) and
+                      skips the counts:
+                      { "notifications": [...], "latest_id": 57, "has_more": false }
     
     Response 200:
         {
@@ -234,27 +503,88 @@ def get_my_notifications():
                     "created_at": "2025-11-25T08:00:00Z"
                 },
                 ...
-            ]
+            ],
+            "next_cursor": "opaque string" | null,
+            "total": 42                      (only with with_total=1)
         }
     """
     user_id = g.user.id
 
     try:
-        result = (
+        limit = parse_limit(request.args.get("limit"))
+        after = decode_cursor(request.args.get("cursor"), 2)
+        if after is not None and not (isinstance(after[0], str) and isinstance(after[1], int)):
+            raise ValueError("Invalid cursor")
+        since = _parse_since(request.args["since"]) if request.args.get("since") else None
+    except ValueError:
+        return jsonify({"error": "Invalid limit, cursor or since"}), 400
+
+    try:
+        # Delta polling: nothing new → an empty list and the same marker
+        if since is not None:
+            column, marker = since
+            result = (
+                supabase_client
+                .table("notifications")
+                .select("*")
+                .eq("user_id", user_id)
+                .gt(column, marker)
+                .order("id.asc" if column == "id" else "created_at.asc,id.asc")
+                .limit(limit + 1)
+                .execute()
+            )
+            notifications = result.data or []
+            has_more      = len(notifications) > limit
+            notifications = notifications[:limit]
+            latest_id     = notifications[-1]["id"] if notifications else (marker if column == "id" else None)
+            return jsonify({
+                "notifications": notifications,
+                "latest_id":     latest_id,
+                "has_more":      has_more
+            }), 200
+
+        query = (
             supabase_client
             .table("notifications")
             .select("*")
             .eq("user_id", user_id)
-            .order("created_at", desc=True)
+        )
+        if after is not None:
+            created_at, last_id = after
+            query = query.or_(
+                f"created_at.lt.{quote(created_at)},"
+                f"and(created_at.eq.{quote(created_at)},id.lt.{last_id})"
+            )
+        result = (
+            query
+            .order(NOTIFICATION_ORDER)
+            .limit(limit + 1)
             .execute()
         )
         notifications = result.data or []
-        unread_count  = sum(1 for n in notifications if not n.get("is_read"))
 
-        return jsonify({
-            "unread_count":  unread_count,
-            "notifications": notifications
-        }), 200
+        next_cursor = None
+        if len(notifications) > limit:
+            notifications = notifications[:limit]
+            next_cursor   = encode_cursor([notifications[-1]["created_at"], notifications[-1]["id"]])
+
+        response = {
+            "unread_count":  _count_unread(user_id),
+            "notifications": notifications,
+            "next_cursor":   next_cursor
+        }
+        if request.args.get("with_total") == "1":
+            response["total"] = (
+                supabase_client
+                .table("notifications")
+                .select("id", count="exact")
+                .eq("user_id", user_id)
+                .limit(1)
+                .execute()
+                .count or 0
+            )
+
+        return jsonify(response), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -0,0 +1,6 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/__init__.py
+PURPOSE: In-process services shared by the route blueprints
+         (catalog snapshot, chat prompt building, etc.)
+"""
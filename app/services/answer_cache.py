@@ -0,0 +1,100 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/answer_cache.py
+PURPOSE: LRU + TTL cache of chat answers keyed by normalized question and
+         catalog content (the snapshot's etag). A reload that finds the
+         same content keeps every cached answer; changed content drops
+         them. An answer generated against older content is not stored.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(_NON_WORD_RE.sub(" ", (question or "").lower()).split())
+
+
+class AnswerCache:
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl         = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._content    = None   # catalog etag the entries were answered from
+        self._lock       = threading.Lock()
+        self._hits       = 0
+        self._misses     = 0
+        self._evictions  = 0
+
+    def _sync_content(self, content: str) -> None:
+        # Caller holds the lock. Answers from other catalog content are stale.
+        if content != self._content:
+            self._entries.clear()
+            self._content = content
+
+    def get(self, content: str, question: str) -> str | None:
+        key = normalize_question(question)
+        with self._lock:
+            self._sync_content(content)
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, content: str, question: str, answer: str) -> None:
+        """
+        Store an answer generated from catalog content. Dropped when the
+        cache has moved on to other content since (e.g. a stream that
+        outlived a catalog change) – it must not clear the newer entries.
+        """
+        key = normalize_question(question)
+        with self._lock:
+            if content != self._content:
+                return
+            self._entries[key] = (time.monotonic(), answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits":        self._hits,
+                "misses":      self._misses,
+                "hit_ratio":   round(self._hits / lookups, 4) if lookups else 0.0,
+                "size":        len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions":   self._evictions,
+            }
+
+
+_cache: AnswerCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> AnswerCache:
+    """Return the worker-wide answer cache, built from app config on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                cfg = current_app.config
+                _cache = AnswerCache(
+                    max_entries = cfg.get("ANSWER_CACHE_MAX_ENTRIES", 512),
+                    ttl         = cfg.get("ANSWER_CACHE_TTL_SECONDS", 3600),
+                )
+    return _cache
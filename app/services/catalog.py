@@ -0,0 +1,218 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/catalog.py
+PURPOSE: In-process read-through cache of the active scholarship catalog.
+         Loaded with embedded PostgREST queries, page by page, versioned,
+         and invalidated by admin writes (with a TTL backstop so other
+         gunicorn workers eventually pick up changes too).
+         Each snapshot carries content hashes (catalog-wide and per
+         scholarship) used as HTTP ETags, and the time its content last
+         changed, used as Last-Modified.
+         Hit ratio and reload timings are exposed by catalog_stats().
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+from flask import current_app
+
+from app.extensions import supabase_admin
+
+DEFAULT_CATALOG_TTL_SECONDS = 300
+
+# Scholarship columns served by the API – not "*", which would also return
+# the search columns (document_names, search_vector – 11_fulltext_search.sql)
+SCHOLARSHIP_COLUMNS = (
+    "id, name, description, deadline, income_limit, amount_min, amount_max, "
+    "portal_url, is_active, created_at, updated_at"
+)
+
+# Snapshot rows per request: PostgREST max-rows (1000 on Supabase) silently
+# truncates anything larger. Pages need a stable order, passed as ONE order
+# param (see NOTIFICATION_ORDER in app/routes/scholarships.py).
+PAGE_SIZE     = 1000
+CATALOG_ORDER = "deadline.asc,id.asc"
+
+_lock     = threading.Lock()
+_snapshot: dict | None = None
+_version  = 0
+_content: tuple[str, float] | None = None   # (etag, last_modified) of the newest load
+
+
+def content_hash(*parts) -> str:
+    """Short, stable hash of JSON-serializable parts (used for ETags)."""
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+class ScholarshipRecord:
+    """
+    One active scholarship with everything attached to it.
+    Shares the row / list objects held by the snapshot dicts – treat as read-only.
+    """
+    __slots__ = ("id", "row", "eligibility", "documents", "steps", "etag", "sort_key", "name_lower")
+
+    def __init__(self, row: dict, eligibility: list, documents: list, steps: list, etag: str):
+        self.id          = row["id"]
+        self.row         = row
+        self.eligibility = eligibility
+        self.documents   = documents
+        self.steps       = steps
+        self.etag        = etag
+        # Listing order: deadline ascending, missing deadlines last, then id
+        self.sort_key    = (row.get("deadline") is None, row.get("deadline") or "", row["id"])
+        self.name_lower  = (row.get("name") or "").lower()
+
+
+_stats_lock = threading.Lock()
+_stats = {
+    "hits":              0,
+    "misses":            0,
+    "refreshes":         0,
+    "invalidations":     0,
+    "last_refresh_ms":   0.0,
+    "total_refresh_ms":  0.0,
+}
+
+
+def _load_snapshot(version: int) -> dict:
+    """Fetch active scholarships with their eligibility, documents and steps."""
+    # Service client: the catalog is public data, and the snapshot is also
+    # used outside any user's request (e.g. by the alert job).
+    rows, start = [], 0
+    while True:
+        page = (
+            supabase_admin
+            .table("scholarships")
+            .select(f"{SCHOLARSHIP_COLUMNS}, eligibility(*), documents_required(*), application_steps(*)")
+            .eq("is_active", True)
+            .order(CATALOG_ORDER)
+            .range(start, start + PAGE_SIZE - 1)
+            .execute()
+            .data or []
+        )
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            break
+        start += PAGE_SIZE
+
+    scholarships       = []
+    eligibility        = {}
+    documents_required = {}
+    application_steps  = {}
+    for row in rows:
+        s_id = row["id"]
+        eligibility[s_id]        = row.pop("eligibility", None) or []
+        documents_required[s_id] = row.pop("documents_required", None) or []
+        application_steps[s_id]  = sorted(
+            row.pop("application_steps", None) or [],
+            key=lambda step: step.get("step_number") or 0
+        )
+        scholarships.append(row)
+
+    etags = {
+        s["id"]: content_hash(s, eligibility[s["id"]], documents_required[s["id"]], application_steps[s["id"]])
+        for s in scholarships
+    }
+    records = sorted(
+        (
+            ScholarshipRecord(s, eligibility[s["id"]], documents_required[s["id"]],
+                              application_steps[s["id"]], etags[s["id"]])
+            for s in scholarships
+        ),
+        key=lambda r: r.sort_key
+    )
+    loaded_at = time.time()
+
+    return {
+        "version":            version,
+        "loaded_at":          loaded_at,
+        "etag":               content_hash([etags[s["id"]] for s in scholarships]),
+        "etags":              etags,
+        "last_modified":      loaded_at,
+        "records":            records,
+        "by_id":              {r.id: r for r in records},
+        "scholarships":       scholarships,
+        "eligibility":        eligibility,
+        "documents_required": documents_required,
+        "application_steps":  application_steps,
+    }
+
+
+def get_catalog() -> dict:
+    """
+    Return the current catalog snapshot, reloading it if it was invalidated
+    or is older than CATALOG_TTL_SECONDS.
+
+    Snapshot keys:
+        version, loaded_at, scholarships (list of rows),
+        eligibility / documents_required / application_steps
+        (dicts keyed by scholarship id; steps ordered by step_number),
+        etag (hash of the whole catalog), etags (per scholarship id),
+        last_modified (when the content last changed, epoch seconds –
+        kept across reloads that find identical content),
+        records (ScholarshipRecord list in listing order), by_id
+
+    Every reload gets a new version, so anything derived from the catalog
+    can be cached against snapshot["version"].
+    """
+    global _snapshot, _version, _content
+    ttl = current_app.config.get("CATALOG_TTL_SECONDS", DEFAULT_CATALOG_TTL_SECONDS)
+
+    snapshot = _snapshot
+    if snapshot is not None and time.time() - snapshot["loaded_at"] < ttl:
+        with _stats_lock:
+            _stats["hits"] += 1
+        return snapshot
+
+    with _lock:
+        snapshot = _snapshot
+        if snapshot is not None and time.time() - snapshot["loaded_at"] < ttl:
+            with _stats_lock:
+                _stats["hits"] += 1
+            return snapshot
+        started = time.perf_counter()
+        _version += 1
+        fresh = _load_snapshot(_version)
+        if _content is not None and _content[0] == fresh["etag"]:
+            fresh["last_modified"] = _content[1]
+        _content  = (fresh["etag"], fresh["last_modified"])
+        _snapshot = fresh
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with _stats_lock:
+            _stats["misses"]           += 1
+            _stats["refreshes"]        += 1
+            _stats["last_refresh_ms"]   = round(elapsed_ms, 2)
+            _stats["total_refresh_ms"] += elapsed_ms
+        return _snapshot
+
+
+def invalidate_catalog() -> None:
+    """Drop the cached snapshot. Called by admin routes after any catalog write."""
+    global _snapshot
+    with _lock:
+        _snapshot = None
+    with _stats_lock:
+        _stats["invalidations"] += 1
+
+
+def catalog_stats() -> dict:
+    """Cache counters for monitoring (this worker only)."""
+    snapshot = _snapshot
+    with _stats_lock:
+        lookups   = _stats["hits"] + _stats["misses"]
+        refreshes = _stats["refreshes"]
+        return {
+            "hits":            _stats["hits"],
+            "misses":          _stats["misses"],
+            "hit_ratio":       round(_stats["hits"] / lookups, 4) if lookups else 0.0,
+            "refreshes":       refreshes,
+            "invalidations":   _stats["invalidations"],
+            "last_refresh_ms": _stats["last_refresh_ms"],
+            "avg_refresh_ms":  round(_stats["total_refresh_ms"] / refreshes, 2) if refreshes else 0.0,
+            "version":         snapshot["version"] if snapshot else None,
+            "size":            len(snapshot["records"]) if snapshot else 0,
+            "age_seconds":     round(time.time() - snapshot["loaded_at"], 1) if snapshot else None,
+        }
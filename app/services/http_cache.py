@@ -0,0 +1,50 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/http_cache.py
+PURPOSE: Conditional GET helpers (ETag / Last-Modified / Cache-Control).
+         Routes compute the validators from in-memory state first and
+         answer If-None-Match / If-Modified-Since with 304 before doing
+         any database work.
+"""
+
+from datetime import datetime, timezone
+
+from flask import request, current_app, Response
+
+
+def public_cache_control() -> str:
+    """Catalog data is the same for every user, so browsers and proxies may reuse it briefly."""
+    max_age = current_app.config.get("CATALOG_CACHE_MAX_AGE", 60)
+    return f"public, max-age={max_age}, must-revalidate"
+
+
+# Per-user responses: browser cache only, always revalidated with the ETag
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def is_not_modified(etag: str, last_modified: float | None = None) -> bool:
+    """
+    True when the client's copy is current. If-None-Match wins over
+    If-Modified-Since when both are sent (RFC 9110).
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains(etag) or request.if_none_match.star_tag
+    if last_modified is not None and request.if_modified_since is not None:
+        return int(last_modified) <= request.if_modified_since.timestamp()
+    return False
+
+
+def with_cache_headers(response: Response, etag: str, last_modified: float | None,
+                       cache_control: str, vary: str | None = None) -> Response:
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = datetime.fromtimestamp(int(last_modified), tz=timezone.utc)
+    response.headers["Cache-Control"] = cache_control
+    if vary:
+        response.vary.add(vary)
+    return response
+
+
+def not_modified(etag: str, last_modified: float | None,
+                 cache_control: str, vary: str | None = None) -> Response:
+    return with_cache_headers(Response(status=304), etag, last_modified, cache_control, vary)
@@ -0,0 +1,107 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/job_lease.py
+PURPOSE: Single-runner guarantee for scheduled jobs.
+         Every gunicorn worker starts its own APScheduler, so each job
+         run first takes a lease row in Postgres (06_job_leases.sql);
+         only the worker holding the lease runs the job. The holder
+         renews the lease in the background while it works, so a crashed
+         holder's lease expires and a later attempt takes the run over.
+"""
+
+import logging
+import os
+import socket
+import threading
+import uuid
+
+from app.extensions import supabase_admin
+
+logger = logging.getLogger("keralaseva.jobs")
+
+
+class JobLease:
+    """
+    Lease on one scheduled run, identified by run_key
+    (e.g. "daily_deadline_alerts:2025-11-25").
+
+    Usage:
+        lease = JobLease(run_key, lease_seconds=600)
+        if lease.acquire():
+            try:
+                ...
+                lease.complete()
+            except Exception:
+                lease.release()
+                raise
+    """
+
+    def __init__(self, run_key: str, lease_seconds: int = 600):
+        self.run_key       = run_key
+        self.lease_seconds = max(int(lease_seconds), 30)
+        self.holder        = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop         = threading.Event()
+        self._heartbeat: threading.Thread | None = None
+
+    def acquire(self) -> bool:
+        """Try to take the run. Logs and returns False when another worker has it or it is done."""
+        try:
+            result = supabase_admin.rpc("try_acquire_job_lease", {
+                "p_run_key":       self.run_key,
+                "p_holder":        self.holder,
+                "p_lease_seconds": self.lease_seconds
+            }).execute()
+        except Exception as e:
+            logger.error(f"Job {self.run_key}: could not acquire lease, skipping this attempt: {str(e)}")
+            return False
+
+        row = (result.data or [{}])[0]
+        if not row.get("acquired"):
+            if row.get("completed"):
+                logger.debug(f"Job {self.run_key}: already completed, skipping")
+            else:
+                logger.info(f"Job {self.run_key}: skipped, lease held by {row.get('current_holder')}")
+            return False
+
+        logger.info(f"Job {self.run_key}: lease acquired by {self.holder}")
+        self._heartbeat = threading.Thread(
+            target=self._renew_loop, name=f"lease-{self.run_key}", daemon=True
+        )
+        self._heartbeat.start()
+        return True
+
+    def _renew_loop(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                held = supabase_admin.rpc("renew_job_lease", {
+                    "p_run_key":       self.run_key,
+                    "p_holder":        self.holder,
+                    "p_lease_seconds": self.lease_seconds
+                }).execute().data
+            except Exception as e:
+                logger.warning(f"Job {self.run_key}: lease renewal failed: {str(e)}")
+                continue
+            if not held:
+                logger.warning(f"Job {self.run_key}: lease lost to another worker")
+                return
+
+    def _finish(self, completed: bool) -> None:
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+        try:
+            supabase_admin.rpc("finish_job_lease", {
+                "p_run_key":   self.run_key,
+                "p_holder":    self.holder,
+                "p_completed": completed
+            }).execute()
+        except Exception as e:
+            logger.warning(f"Job {self.run_key}: could not finish lease: {str(e)}")
+
+    def complete(self) -> None:
+        """Mark the run done; no other worker will run it."""
+        self._finish(completed=True)
+
+    def release(self) -> None:
+        """Give the run up after a failure so the next attempt retries it."""
+        self._finish(completed=False)
@@ -0,0 +1,204 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/llm.py
+PURPOSE: Ollama client used by the chat assistant.
+  - one keep-alive connection pool shared by all requests in the worker
+  - connect / read deadlines on every call
+  - a bounded number of in-flight generations plus a bounded wait queue;
+    when the queue is full callers get LLMBusyError immediately
+  - queue depth and wait-time stats for sizing
+"""
+
+import json
+import threading
+import time
+
+import requests
+from flask import current_app
+from requests.adapters import HTTPAdapter
+
+
+class LLMBusyError(Exception):
+    """Raised when no generation slot is free and the wait queue is full or timed out."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("LLM is busy")
+        self.retry_after = retry_after
+
+
+class _TokenStream:
+    """
+    Iterator over tokens of one streaming generation.
+    close() is idempotent and releases the upstream connection and the
+    generation slot, whether or not iteration ever started.
+    """
+
+    def __init__(self, client: "LLMClient", upstream: requests.Response):
+        self._client   = client
+        self._upstream = upstream
+        self._lines    = upstream.iter_lines()
+        self._closed   = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        while not self._closed:
+            try:
+                line = next(self._lines)
+            except StopIteration:
+                break
+            if not line:
+                continue
+            chunk = json.loads(line)
+            token = chunk.get("response")
+            if chunk.get("done"):
+                self.close()
+            if token:
+                return token
+        self.close()
+        raise StopIteration
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._upstream.close()
+        self._client._release()
+
+
+class LLMClient:
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        max_in_flight: int,
+        max_queue: int,
+        queue_timeout: float,
+        connect_timeout: float,
+        read_timeout: float,
+    ):
+        self.base_url      = base_url.rstrip("/")
+        self.model         = model
+        self.max_in_flight = max_in_flight
+        self.max_queue     = max_queue
+        self.queue_timeout = queue_timeout
+        self.timeout       = (connect_timeout, read_timeout)
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_in_flight)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._lock  = threading.Lock()
+        self._in_flight   = 0
+        self._waiting     = 0
+        self._started     = 0
+        self._rejected    = 0
+        self._wait_total  = 0.0
+        self._wait_max    = 0.0
+
+    # ── Slot management ───────────────────────────────────────────
+
+    def _acquire(self) -> None:
+        started = time.monotonic()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                if self._waiting >= self.max_queue:
+                    self._rejected += 1
+                    raise LLMBusyError(retry_after=max(1, int(self.queue_timeout)))
+                self._waiting += 1
+            try:
+                acquired = self._slots.acquire(timeout=self.queue_timeout)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            if not acquired:
+                with self._lock:
+                    self._rejected += 1
+                raise LLMBusyError(retry_after=max(1, int(self.queue_timeout)))
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self._in_flight  += 1
+            self._started    += 1
+            self._wait_total += waited
+            self._wait_max    = max(self._wait_max, waited)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    # ── Public API ────────────────────────────────────────────────
+
+    def generate(self, prompt: str) -> str:
+        """Blocking generation. Raises LLMBusyError or requests exceptions."""
+        self._acquire()
+        try:
+            response = self._session.post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.model, "prompt": prompt, "stream": False},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.json().get("response", "Sorry, I could not answer that.")
+        finally:
+            self._release()
+
+    def stream(self, prompt: str) -> _TokenStream:
+        """
+        Start a streaming generation and return an iterator of tokens.
+        The slot is taken before returning, so LLMBusyError is raised here,
+        not mid-stream. Callers must close() the stream.
+        """
+        self._acquire()
+        try:
+            upstream = self._session.post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.model, "prompt": prompt, "stream": True},
+                timeout=self.timeout,
+                stream=True
+            )
+            upstream.raise_for_status()
+        except Exception:
+            self._release()
+            raise
+        return _TokenStream(self, upstream)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight":      self._in_flight,
+                "queue_depth":    self._waiting,
+                "max_in_flight":  self.max_in_flight,
+                "max_queue":      self.max_queue,
+                "started":        self._started,
+                "rejected":       self._rejected,
+                "avg_wait_ms":    round(1000 * self._wait_total / self._started, 2) if self._started else 0.0,
+                "max_wait_ms":    round(1000 * self._wait_max, 2),
+            }
+
+
+_client: LLMClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """Return the worker-wide LLM client, built from app config on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                cfg = current_app.config
+                _client = LLMClient(
+                    base_url        = cfg.get("OLLAMA_URL", "http://localhost:11434"),
+                    model           = cfg.get("OLLAMA_MODEL", "llama3"),
+                    max_in_flight   = cfg.get("LLM_MAX_IN_FLIGHT", 2),
+                    max_queue       = cfg.get("LLM_MAX_QUEUE", 8),
+                    queue_timeout   = cfg.get("LLM_QUEUE_TIMEOUT_SECONDS", 10.0),
+                    connect_timeout = cfg.get("LLM_CONNECT_TIMEOUT_SECONDS", 3.0),
+                    read_timeout    = cfg.get("LLM_READ_TIMEOUT_SECONDS", 120.0),
+                )
+    return _client
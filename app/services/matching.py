@@ -0,0 +1,152 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/matching.py
+PURPOSE: In-process equivalent of the get_matching_scholarships() SQL
+         function (03_matching_and_rls.sql).
+
+Matching Logic (must stay identical to the SQL function):
+  Income:    income_limit = 0  OR  income_limit >= user's income
+  Community: eligibility.community = user's community
+             OR eligibility.community = 'Any'
+             OR user is Muslim  and eligibility.community = 'Minority'
+             OR user is SC/ST   and eligibility.community IN ('SC', 'ST')
+             OR user is SC/OBC-eligible (SC or OBC) and eligibility.community = 'SC/OBC'
+  Gender:    eligibility.gender = user's gender OR 'Any'
+  Education: eligibility.education_level = user's education_level
+             OR 'Any'
+             OR 'PostMatric' when the user is at or beyond PostMatric
+  Community + gender + education must hold on the SAME eligibility row.
+  Only active scholarships; one row per scholarship; ordered by upcoming
+  deadline first (past / missing deadlines last), then name.
+"""
+
+import threading
+from datetime import date
+
+from app.services.catalog import get_catalog
+
+POST_MATRIC_LEVELS = frozenset({
+    "PostMatric", "Diploma", "Degree", "PG", "PhD",
+    "Technical", "Engineering", "Professional",
+})
+
+
+def community_matches(row_value: str, user_value: str) -> bool:
+    return (
+        row_value == user_value
+        or row_value == "Any"
+        or (user_value == "Muslim" and row_value == "Minority")
+        or (user_value == "SC/ST" and row_value in ("SC", "ST"))
+        or (user_value == "SC" and row_value == "SC/OBC")
+        or (user_value == "OBC" and row_value == "SC/OBC")
+    )
+
+
+def gender_matches(row_value: str, user_value: str) -> bool:
+    return row_value == user_value or row_value == "Any"
+
+
+def education_matches(row_value: str, user_value: str) -> bool:
+    return (
+        row_value == user_value
+        or row_value == "Any"
+        or (row_value == "PostMatric" and user_value in POST_MATRIC_LEVELS)
+    )
+
+
+class _Candidate:
+    __slots__ = ("income_limit", "rules", "row")
+
+    def __init__(self, income_limit: int, rules: tuple, row: dict):
+        self.income_limit = income_limit
+        self.rules        = rules   # ((community, gender, education_level), ...)
+        self.row          = row     # output row, same shape as the SQL function
+
+
+class MatchingEngine:
+    """
+    Catalog compiled for matching on a given day.
+    Scholarships are pre-sorted in the SQL function's order, and the
+    candidate list for each (community, gender, education_level) tuple is
+    computed once and memoized, so a match is one income scan over a
+    short list.
+    """
+
+    def __init__(self, scholarships: list[dict], eligibility: dict, today: date):
+        self.today = today
+        far_future = date.max
+        candidates = []
+        for s in scholarships:
+            deadline = date.fromisoformat(s["deadline"]) if s.get("deadline") else None
+            rules = tuple(
+                (e.get("community"), e.get("gender"), e.get("education_level"))
+                for e in eligibility.get(s["id"], [])
+            )
+            if not rules:
+                continue   # INNER JOIN eligibility: no rows, never matches
+            row = {
+                "scholarship_id": s["id"],
+                "name":           s.get("name"),
+                "description":    s.get("description"),
+                "deadline":       s.get("deadline"),
+                "income_limit":   s.get("income_limit"),
+                "amount_min":     s.get("amount_min"),
+                "amount_max":     s.get("amount_max"),
+                "portal_url":     s.get("portal_url"),
+                "days_until_due": (deadline - today).days if deadline else None,
+            }
+            sort_key = (deadline if deadline and deadline >= today else far_future, s.get("name") or "")
+            candidates.append((sort_key, _Candidate(s.get("income_limit") or 0, rules, row)))
+
+        candidates.sort(key=lambda item: item[0])
+        self._candidates = [c for _, c in candidates]
+        self._by_attributes: dict[tuple, list[_Candidate]] = {}
+        self._lock = threading.Lock()
+
+    def _for_attributes(self, key: tuple) -> list[_Candidate]:
+        cached = self._by_attributes.get(key)
+        if cached is not None:
+            return cached
+        community, gender, education = key
+        matched = [
+            c for c in self._candidates
+            if any(
+                community_matches(rc, community)
+                and gender_matches(rg, gender)
+                and education_matches(re, education)
+                for rc, rg, re in c.rules
+            )
+        ]
+        with self._lock:
+            self._by_attributes[key] = matched
+        return matched
+
+    def match(self, profile: dict) -> list[dict]:
+        """
+        Scholarships matching a profile (community, gender, education_level,
+        income). Returned rows are shared – treat them as read-only.
+        """
+        key = (profile.get("community"), profile.get("gender"), profile.get("education_level"))
+        income = profile.get("income")
+        return [
+            c.row for c in self._for_attributes(key)
+            if c.income_limit == 0 or (income is not None and c.income_limit >= income)
+        ]
+
+
+_engine: MatchingEngine | None = None
+_engine_key: tuple | None = None
+_engine_lock = threading.Lock()
+
+
+def get_matching_engine() -> MatchingEngine:
+    """Engine compiled from the current catalog snapshot, rebuilt per catalog version and day."""
+    global _engine, _engine_key
+    catalog = get_catalog()
+    key = (catalog["version"], date.today())
+    if _engine_key != key:
+        with _engine_lock:
+            if _engine_key != key:
+                _engine = MatchingEngine(catalog["scholarships"], catalog["eligibility"], key[1])
+                _engine_key = key
+    return _engine
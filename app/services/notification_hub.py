@@ -0,0 +1,138 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/notification_hub.py
+PURPOSE: In-process pub/sub hub feeding /api/alerts/stream.
+         Each open stream subscribes with its user id and gets a small
+         bounded queue; publishers (the deadline alert job) push new
+         notification rows to the subscribers of their user. A full
+         queue marks the subscription as overflowed instead of blocking
+         the publisher – the stream then re-reads from the database.
+         The number of open streams per worker is capped; each stream
+         holds a thread, so the cap also leaves threads for ordinary
+         requests when the worker's thread count is known.
+"""
+
+import logging
+import queue
+import threading
+
+from flask import current_app
+
+logger = logging.getLogger("keralaseva.alerts")
+
+
+class StreamLimitError(Exception):
+    """This worker already serves the maximum number of streams."""
+
+
+class Subscription:
+    __slots__ = ("user_id", "queue", "overflowed")
+
+    def __init__(self, user_id: str, max_queue: int):
+        self.user_id    = user_id
+        self.queue      = queue.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+
+class NotificationHub:
+    def __init__(self, max_streams: int, max_queue: int):
+        self.max_streams = max_streams
+        self.max_queue   = max_queue
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._count      = 0
+        self._lock       = threading.Lock()
+        self._published  = 0
+        self._rejected   = 0
+
+    def subscribe(self, user_id: str) -> Subscription:
+        """Register a stream. Raises StreamLimitError when the worker is at its cap."""
+        with self._lock:
+            if self._count >= self.max_streams:
+                self._rejected += 1
+                raise StreamLimitError()
+            sub = Subscription(user_id, self.max_queue)
+            self._subscribers.setdefault(user_id, set()).add(sub)
+            self._count += 1
+            return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.user_id)
+            if subs is None or sub not in subs:
+                return
+            subs.discard(sub)
+            if not subs:
+                del self._subscribers[sub.user_id]
+            self._count -= 1
+
+    def subscribed_user_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._subscribers)
+
+    def publish(self, rows: list[dict]) -> int:
+        """Fan notification rows out to their users' streams. Returns deliveries."""
+        delivered = 0
+        with self._lock:
+            for row in rows:
+                for sub in self._subscribers.get(row.get("user_id"), ()):
+                    try:
+                        sub.queue.put_nowait(row)
+                        delivered += 1
+                    except queue.Full:
+                        sub.overflowed = True
+            self._published += delivered
+        return delivered
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "open_streams": self._count,
+                "users":        len(self._subscribers),
+                "max_streams":  self.max_streams,
+                "published":    self._published,
+                "rejected":     self._rejected,
+            }
+
+
+_hub: NotificationHub | None = None
+_hub_lock = threading.Lock()
+
+
+def max_streams_for_worker(configured: int, worker_threads: int | None, reserved: int) -> int:
+    """
+    Stream cap for this worker: the configured cap, lowered so at least
+    `reserved` threads stay free for other requests. worker_threads is
+    None when it is unknown or not the limit (dev server, async workers).
+    A sync worker (1 thread) gets 0: streams are refused with 503.
+    """
+    if worker_threads is None:
+        return configured
+    return max(0, min(configured, worker_threads - reserved))
+
+
+def get_notification_hub() -> NotificationHub:
+    """
+    Return the worker-wide hub, built from app config on first use.
+    WORKER_THREADS is set per worker by gunicorn.conf.py.
+    """
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                cfg = current_app.config
+                max_streams = max_streams_for_worker(
+                    cfg.get("ALERT_STREAM_MAX_PER_WORKER", 50),
+                    cfg.get("WORKER_THREADS"),
+                    cfg.get("ALERT_STREAM_RESERVED_THREADS", 8),
+                )
+                if max_streams == 0:
+                    logger.warning(
+                        "Alert streams disabled in this worker: not enough threads "
+                        f"(WORKER_THREADS={cfg.get('WORKER_THREADS')}). Run gunicorn with "
+                        "gunicorn.conf.py (gthread workers)."
+                    )
+                _hub = NotificationHub(
+                    max_streams = max_streams,
+                    max_queue   = cfg.get("ALERT_STREAM_QUEUE_SIZE", 100),
+                )
+    return _hub
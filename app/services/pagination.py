@@ -0,0 +1,46 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/pagination.py
+PURPOSE: Keyset (cursor) pagination helpers.
+         A cursor is the sort key of the last row of a page, encoded as
+         an opaque URL-safe string. The next page asks Postgres for rows
+         strictly after that key, so every page costs the same index
+         range scan however deep the client scrolls (no OFFSET).
+"""
+
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE     = 100
+
+
+def parse_limit(raw: str | None, default: int = DEFAULT_PAGE_SIZE) -> int:
+    """Page size from a query param, clamped to [1, MAX_PAGE_SIZE]. Raises ValueError if not an integer."""
+    if raw in (None, ""):
+        return default
+    return max(1, min(int(raw), MAX_PAGE_SIZE))
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None, size: int) -> list | None:
+    """Cursor → list of `size` sort-key values (None when no cursor). Raises ValueError if malformed."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def quote(value) -> str:
+    """Quote a value for a PostgREST or=(...) filter (timestamps, dates with ':' '+' '.')."""
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
@@ -0,0 +1,67 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/retrieval.py
+PURPOSE: Small in-process BM25 index used to pick the scholarships that are
+         relevant to a chat question, so the LLM prompt only carries those.
+"""
+
+import math
+import re
+from collections import Counter
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Words that appear in almost every question or record and carry no signal
+STOPWORDS = {
+    "a", "an", "and", "are", "be", "can", "do", "does", "for", "from", "how",
+    "i", "in", "is", "it", "me", "my", "of", "on", "or", "the", "to", "what",
+    "when", "where", "which", "who", "with", "you", "your",
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens without stopwords."""
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a fixed list of documents.
+    Build once per catalog version; search() is read-only and thread-safe.
+    """
+
+    def __init__(self, documents: list[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b  = b
+        self._term_freqs = [Counter(tokenize(doc)) for doc in documents]
+        self._doc_lens   = [sum(tf.values()) for tf in self._term_freqs]
+        self._avg_len    = (sum(self._doc_lens) / len(self._doc_lens)) if self._doc_lens else 0.0
+
+        doc_freq: Counter = Counter()
+        for tf in self._term_freqs:
+            doc_freq.update(tf.keys())
+        n = len(documents)
+        self._idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+
+    def search(self, query: str, top_k: int) -> list[tuple[int, float]]:
+        """Return up to top_k (document position, score) pairs with score > 0, best first."""
+        terms = [t for t in set(tokenize(query)) if t in self._idf]
+        if not terms:
+            return []
+
+        scores = []
+        for pos, tf in enumerate(self._term_freqs):
+            norm  = self.k1 * (1 - self.b + self.b * self._doc_lens[pos] / (self._avg_len or 1))
+            score = 0.0
+            for term in terms:
+                freq = tf.get(term)
+                if freq:
+                    score += self._idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            if score > 0:
+                scores.append((pos, score))
+
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return scores[:top_k]
@@ -0,0 +1,25 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/sse.py
+PURPOSE: Server-Sent Events helpers for streaming responses
+"""
+
+import json
+
+# Headers for text/event-stream responses. X-Accel-Buffering stops nginx
+# from buffering the stream when deployed behind it.
+SSE_HEADERS = {
+    "Cache-Control":     "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse(data, event: str | None = None, event_id: str | int | None = None) -> str:
+    """Serialize one SSE message. data is JSON-encoded."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
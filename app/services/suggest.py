@@ -0,0 +1,137 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: app/services/suggest.py
+PURPOSE: In-memory prefix index (trie) behind /api/scholarships/suggest.
+         Keys are scholarship names (from every word, so "matric" finds
+         "Post Matric ..."), their initials ("manf") and common aliases
+         ("e-grants", "nsp", "kshec"). Every trie node keeps its best few
+         suggestions, so a lookup is one walk down the query's characters.
+         Rebuilt once per catalog version.
+"""
+
+import re
+import threading
+
+from app.services.catalog import get_catalog
+from app.services.retrieval import STOPWORDS
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_PARENS_RE = re.compile(r"\([^)]*\)")
+
+DEFAULT_SUGGESTIONS = 8
+MAX_SUGGESTIONS     = 10
+
+# Aliases by a lowercase fragment of the scholarship name
+NAME_ALIASES = {
+    "e-grantz":                    ("egrants", "e grants", "e-grants"),
+    "merit-cum-means":             ("mcm", "merit cum means"),
+    "chief minister":              ("cm", "cmrf"),
+    "junior research fellowship":  ("jrf", "net jrf"),
+    "higher education council":    ("kshec",),
+    "single girl child":           ("sgc",),
+}
+
+# Aliases by the portal's host name
+PORTAL_ALIASES = {
+    "scholarships.gov.in":         ("nsp", "national scholarship portal"),
+    "kshec.kerala.gov.in":         ("kshec",),
+}
+
+# Ranking of the ways a key can match (lower is better)
+_NAME_START = 0
+_ALIAS      = 1
+_NAME_WORD  = 2
+
+
+def normalize(text: str) -> str:
+    """Lowercase alphanumerics only: "E-Grantz", "e grantz" and "egrantz" are one key."""
+    return "".join(_WORD_RE.findall((text or "").lower()))
+
+
+def _initials(name: str) -> str:
+    """"Maulana Azad National Fellowship (SC)" → "manf" (no stopwords or parentheses)."""
+    words = [w for w in _WORD_RE.findall(_PARENS_RE.sub(" ", name.lower())) if w not in STOPWORDS]
+    return "".join(w[0] for w in words) if len(words) > 1 else ""
+
+
+def _keys(record) -> list[tuple[str, int]]:
+    """(normalized key, match kind) pairs under which a scholarship is found."""
+    name  = record.row.get("name") or ""
+    words = _WORD_RE.findall(name.lower())
+    keys  = [("".join(words), _NAME_START)]
+    keys += [("".join(words[i:]), _NAME_WORD) for i in range(1, len(words))]
+
+    aliases = [_initials(name)]
+    for fragment, names in NAME_ALIASES.items():
+        if fragment in record.name_lower:
+            aliases.extend(names)
+    portal = (record.row.get("portal_url") or "").lower()
+    for host, names in PORTAL_ALIASES.items():
+        if host in portal:
+            aliases.extend(names)
+    keys += [(normalize(alias), _ALIAS) for alias in aliases]
+    return [(key, kind) for key, kind in keys if key]
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        self.top: list = []
+
+
+class SuggestIndex:
+    """
+    Trie over the keys of a list of catalog records.
+    Build once per catalog version; suggest() is read-only and thread-safe.
+    """
+
+    def __init__(self, records: list, max_results: int = MAX_SUGGESTIONS):
+        self.max_results = max_results
+        self._root = _Node()
+
+        # Best match kind per (node, scholarship): collected first, then
+        # each node's list is ranked and cut to max_results
+        best: dict[int, dict[str, tuple]] = {}
+        nodes: dict[int, _Node] = {}
+        for record in records:
+            for key, kind in _keys(record):
+                node = self._root
+                for char in key:
+                    node = node.children.setdefault(char, _Node())
+                    found = best.setdefault(id(node), {})
+                    nodes[id(node)] = node
+                    rank = (kind, record.sort_key)
+                    if record.id not in found or rank < found[record.id][0]:
+                        found[record.id] = (rank, {"id": record.id, "name": record.row.get("name")})
+
+        for node_id, found in best.items():
+            ranked = sorted(found.values(), key=lambda entry: entry[0])
+            nodes[node_id].top = [suggestion for _, suggestion in ranked[:max_results]]
+
+    def suggest(self, query: str, limit: int = DEFAULT_SUGGESTIONS) -> list[dict]:
+        """Up to limit {"id", "name"} dicts whose keys start with the query, best first."""
+        node = self._root
+        for char in normalize(query):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.top[:limit] if node is not self._root else []
+
+
+_index: SuggestIndex | None = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def get_suggest_index() -> SuggestIndex:
+    """Index built from the current catalog snapshot, rebuilt per catalog version."""
+    global _index, _index_version
+    catalog = get_catalog()
+    if _index_version != catalog["version"]:
+        with _index_lock:
+            if _index_version != catalog["version"]:
+                _index = SuggestIndex(catalog["records"])
+                _index_version = catalog["version"]
+    return _index
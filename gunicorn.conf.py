@@ -0,0 +1,34 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: gunicorn.conf.py
+PURPOSE: Production server settings, picked up automatically by
+         `gunicorn "run:app"` from the project directory.
+         Threaded (gthread) workers: every open /api/alerts/stream
+         connection holds a thread for its whole lifetime, which would
+         block a sync worker completely.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+bind         = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+workers      = int(os.environ.get("GUNICORN_WORKERS", "4"))
+worker_class = "gthread"
+threads      = int(os.environ.get("GUNICORN_THREADS", "64"))
+
+
+def post_worker_init(worker):
+    """Tell the app how many threads this worker has (sizes the alert stream cap)."""
+    from gunicorn.workers.gthread import ThreadWorker
+    from gunicorn.workers.sync import SyncWorker
+
+    if isinstance(worker, ThreadWorker):
+        worker_threads = worker.cfg.threads
+    elif isinstance(worker, SyncWorker):
+        worker_threads = 1
+    else:
+        worker_threads = None   # async workers: not bound by threads
+    worker.wsgi.config["WORKER_THREADS"] = worker_threads
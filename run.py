@@ -4,8 +4,12 @@ FILE: run.py
 PURPOSE: Application entry point. Starts Flask server and APScheduler cron job.
 Usage:
     python run.py
-Or with gunicorn in production:
-    gunicorn -w 4 -b 0.0.0.0:5000 "run:app"
+Or with gunicorn in production (from this directory):
+    gunicorn "run:app"
+    Settings come from gunicorn.conf.py: 4 gthread workers × 64 threads
+    (GUNICORN_WORKERS / GUNICORN_THREADS). Threaded workers are required
+    – each open /api/alerts/stream connection holds a thread; a sync
+    worker (-k sync) refuses streams with 503.
 """
 from flask import Flask, request, jsonify
 from app.extensions import supabase_client
@@ -15,6 +19,7 @@ load_dotenv()
 
 import atexit
 import logging
+from datetime import datetime
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from zoneinfo import ZoneInfo
@@ -37,16 +42,41 @@ logger = logging.getLogger("keralaseva")
 
 
 # ── Daily Alert Cron Job ────────────────────────────────────────────
+SCHEDULER_TZ = ZoneInfo("Asia/Kolkata")
+
+
 def daily_alert_task():
     """
     Runs the deadline alert job every day at 08:00 AM IST (02:30 UTC).
     Creates notifications for users whose eligible scholarships are
     approaching their deadlines.
+
+    Every gunicorn worker schedules this task; a lease on
+    "daily_deadline_alerts:<date>" (06_job_leases.sql) makes exactly one
+    of them run it. The task is retried every JOB_RETRY_MINUTES for the
+    rest of the day, so if the worker holding the lease dies, another one
+    takes the run over once the lease expires. Attempts after the run
+    has completed are no-ops.
     """
     from app.routes.alerts import run_deadline_alert_job
-    logger.info("Running daily deadline alert job...")
+    from app.services.job_lease import JobLease
+
+    run_date = datetime.now(SCHEDULER_TZ).date()
     with app.app_context():
-        result = run_deadline_alert_job()
+        lease = JobLease(
+            f"daily_deadline_alerts:{run_date.isoformat()}",
+            lease_seconds=app.config.get("JOB_LEASE_SECONDS", 600)
+        )
+        if not lease.acquire():
+            return
+
+        logger.info("Running daily deadline alert job...")
+        try:
+            result = run_deadline_alert_job()
+        except Exception:
+            lease.release()
+            raise
+
         logger.info(
             f"Alert job done: {result['notifications_created']} notifications created "
             f"for {result['users_processed']} users. Errors: {len(result['errors'])}"
@@ -55,19 +85,65 @@ def daily_alert_task():
             for err in result["errors"]:
                 logger.warning(f"Alert job error: {err}")
 
+        # A fatal error means nothing ran – leave the run to the next attempt
+        if any(err.startswith("Fatal error") for err in result["errors"]):
+            lease.release()
+        else:
+            lease.complete()
+
+
+# ── Hourly Dashboard Stats Rollup ──────────────────────────────────
+def refresh_stats_task():
+    """
+    Refreshes the daily_stats buckets behind /api/admin/stats/timeseries
+    (08_daily_stats.sql). Incremental: only the last STATS_LOOKBACK_DAYS
+    buckets are recomputed. One worker per hour, via a lease.
+    """
+    from app.extensions import supabase_admin
+    from app.services.job_lease import JobLease
+
+    now = datetime.now(SCHEDULER_TZ)
+    with app.app_context():
+        lease = JobLease(
+            f"refresh_daily_stats:{now:%Y-%m-%dT%H}",
+            lease_seconds=app.config.get("JOB_LEASE_SECONDS", 600)
+        )
+        if not lease.acquire():
+            return
+        try:
+            result = supabase_admin.rpc("refresh_daily_stats", {
+                "p_today":         now.date().isoformat(),
+                "p_lookback_days": app.config.get("STATS_LOOKBACK_DAYS", 7)
+            }).execute()
+        except Exception as e:
+            logger.warning(f"Stats rollup failed: {str(e)}")
+            lease.release()
+            return
+        logger.info(f"Stats rollup done: {result.data} daily buckets refreshed")
+        lease.complete()
+
 
 # Start APScheduler only when not in test mode
 if not app.config.get("TESTING") and os.environ.get("DISABLE_SCHEDULER") != "1":
-    scheduler = BackgroundScheduler(timezone=ZoneInfo("Asia/Kolkata"))
+    retry_minutes = max(1, min(int(app.config.get("JOB_RETRY_MINUTES", 15)), 59))
+    scheduler = BackgroundScheduler(timezone=SCHEDULER_TZ)
     scheduler.add_job(
         func=daily_alert_task,
-        trigger=CronTrigger(hour=8, minute=0),   # 8:00 AM IST daily
+        # 8:00 AM IST daily, then retry attempts until the end of the day
+        trigger=CronTrigger(hour="8-23", minute=f"*/{retry_minutes}"),
         id="daily_deadline_alerts",
         name="Daily Scholarship Deadline Alerts",
         replace_existing=True
     )
+    scheduler.add_job(
+        func=refresh_stats_task,
+        trigger=CronTrigger(minute=5),           # hourly, at :05
+        id="refresh_daily_stats",
+        name="Hourly Dashboard Stats Rollup",
+        replace_existing=True
+    )
     scheduler.start()
-    logger.info("✅ APScheduler started – daily alerts at 08:00 IST")
+    logger.info("✅ APScheduler started – daily alerts at 08:00 IST, stats rollup hourly")
 
     # Gracefully shut down scheduler when app exits
     atexit.register(lambda: scheduler.shutdown())
@@ -0,0 +1,49 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/bench_alert_cohorts.py
+PURPOSE: Runtime of the cohort alert strategy's matching step against a
+         per-user pass over the same synthetic population, both
+         in-process with MatchingEngine (no Supabase – the real per_user
+         strategy adds one RPC per user on top). Not collected by
+         pytest – run directly:
+
+             python tests/bench_alert_cohorts.py [users] [catalog_size]
+"""
+
+import random
+import sys
+import time
+from datetime import date
+
+import conftest  # noqa: F401  (repo root on sys.path, offline settings)
+from app.routes.alerts import _cohort_notification_rows
+from app.services.matching import MatchingEngine
+from factories import random_catalog, active_catalog
+from test_alert_cohorts import random_population, per_user_rows
+
+
+def main(users: int = 50000, catalog_size: int = 300) -> None:
+    rng   = random.Random(42)
+    today = date.today()
+    scholarships, eligibility = active_catalog(*random_catalog(rng, catalog_size, today))
+    engine     = MatchingEngine(scholarships, eligibility, today)
+    thresholds = sorted({s["income_limit"] for s in scholarships if s.get("income_limit")})
+    profiles, days_by_user = random_population(rng, users)
+
+    started = time.perf_counter()
+    expected = per_user_rows(profiles, days_by_user, engine, today)
+    per_user = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rows, cohorts = _cohort_notification_rows(profiles, days_by_user, engine, thresholds, today)
+    cohort = time.perf_counter() - started
+
+    print(f"{users} users, {len(scholarships)} active scholarships, {len(rows)} due notifications")
+    print(f"per-user: {per_user:.3f}s ({users / per_user:,.0f} users/s)")
+    print(f"cohort:   {cohort:.3f}s ({users / cohort:,.0f} users/s) in {cohorts} cohorts "
+          f"– {per_user / cohort:.1f}x")
+    assert len(rows) == len(expected)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
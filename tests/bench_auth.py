@@ -0,0 +1,79 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/bench_auth.py
+PURPOSE: Cost of authenticating a request in login_required:
+           - local verification (app/middleware/tokens.py), cold (a new
+             token each time) and LRU hit (the same token again)
+           - the remote supabase.auth.get_user check it replaced, stubbed
+             with a fixed round trip
+         Timed per request through a Flask test client, and for
+         verify_access_token alone.
+         Not collected by pytest – run directly:
+
+             python tests/bench_auth.py [requests] [remote_round_trip_ms]
+"""
+
+import sys
+import time
+
+import conftest  # noqa: F401  (repo root on sys.path, offline settings)
+from flask import Flask, g, jsonify
+
+from app.middleware import auth, tokens
+from app.middleware.auth import login_required
+from app.middleware.tokens import verify_access_token
+from test_auth_tokens import make_token, SECRET
+from timing import sample, describe
+
+
+class _RemoteAuth:
+    """supabase_client stand-in whose auth.get_user takes one round trip."""
+
+    def __init__(self, round_trip_ms: float):
+        self.auth = self
+        self.round_trip = round_trip_ms / 1000
+
+    def get_user(self, token):
+        time.sleep(self.round_trip)
+        return type("UserResponse", (), {"user": type("User", (), {"id": "user-1"})()})()
+
+
+def main(requests: int = 2000, remote_round_trip_ms: float = 30.0) -> None:
+    auth.supabase_client = _RemoteAuth(remote_round_trip_ms)
+    app = Flask(__name__)
+    app.config.update(SUPABASE_JWT_SECRET=SECRET, JWT_AUDIENCE="authenticated",
+                      AUTH_REMOTE_FALLBACK=True, AUTH_TOKEN_CACHE_SIZE=requests * 2)
+
+    @app.route("/me")
+    @login_required
+    def me():
+        return jsonify({"id": g.user.id})
+
+    client = app.test_client()
+    fresh  = iter([make_token(sub=f"user-{n}") for n in range(requests * 2)])
+    shared = make_token()
+
+    def get(token):
+        response = client.get("/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200, response.get_json()
+
+    print(f"{requests} requests, remote get_user stubbed at {remote_round_trip_ms} ms")
+    with app.app_context():
+        tokens._cache.clear()
+        print(f"  verify_access_token, cold:  {describe(sample(lambda: verify_access_token(next(fresh)), requests))}")
+        verify_access_token(shared)
+        print(f"  verify_access_token, hit:   {describe(sample(lambda: verify_access_token(shared), requests))}")
+
+    tokens._cache.clear()
+    print(f"  request, local cold:        {describe(sample(lambda: get(next(fresh)), requests))}")
+    print(f"  request, local LRU hit:     {describe(sample(lambda: get(shared), requests))}")
+
+    # No secret → cannot verify locally → the remote check on every request
+    app.config["SUPABASE_JWT_SECRET"] = ""
+    tokens._cache.clear()
+    remote_runs = min(requests, 100)
+    print(f"  request, remote get_user:   {describe(sample(lambda: get(shared), remote_runs))}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]), *(float(arg) for arg in sys.argv[2:3]))
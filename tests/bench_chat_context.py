@@ -0,0 +1,45 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/bench_chat_context.py
+PURPOSE: Chat retrieval report on the seed catalog: recall@k over the
+         labelled questions, prompt size with the whole catalog vs the
+         top-k context, and retrieval latency. Prompt tokens are
+         estimated at ~4 characters per token (no tokenizer or Ollama
+         needed). Not collected by pytest – run directly:
+
+             python tests/bench_chat_context.py
+"""
+
+import time
+
+import conftest  # noqa: F401  (repo root on sys.path, offline settings)
+from app.routes.chat import _build_corpus, _build_prompt, _retrieve_context
+from chat_eval import LABELLED_QUESTIONS
+from seed_catalog import load_seed_catalog
+from test_chat_retrieval import recall_at_k
+
+CHARS_PER_TOKEN = 4
+
+
+def main() -> None:
+    catalog = load_seed_catalog()
+    corpus  = _build_corpus(catalog)
+    print(f"{len(corpus['blocks'])} scholarships, {len(LABELLED_QUESTIONS)} labelled questions")
+
+    for k in (1, 3, 5, 10):
+        print(f"recall@{k}: {recall_at_k(corpus, catalog, k):.2f}")
+
+    full = sum(len(_build_prompt("".join(corpus["blocks"]), q)) for q, _ in LABELLED_QUESTIONS)
+    full /= len(LABELLED_QUESTIONS)
+    print(f"whole catalog prompt: {full:,.0f} chars ≈ {full / CHARS_PER_TOKEN:,.0f} tokens")
+    for k in (3, 5):
+        started = time.perf_counter()
+        sizes = [len(_build_prompt(_retrieve_context(corpus, q, k), q)) for q, _ in LABELLED_QUESTIONS]
+        elapsed_us = (time.perf_counter() - started) / len(sizes) * 1e6
+        avg = sum(sizes) / len(sizes)
+        print(f"top-{k} prompt: {avg:,.0f} chars ≈ {avg / CHARS_PER_TOKEN:,.0f} tokens "
+              f"({avg / full:.0%} of whole catalog), retrieval {elapsed_us:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
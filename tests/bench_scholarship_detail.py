@@ -0,0 +1,90 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/bench_scholarship_detail.py
+PURPOSE: Round trips and latency of GET /api/scholarships/<id> against the
+         fake Supabase client with a fixed latency per round trip:
+           - before:   four sequential queries (scholarship, eligibility,
+                       documents, steps), ported from the original route
+           - embedded: the route's single embedded query (inactive rows)
+           - catalog:  the route for active rows (in-process snapshot)
+         Not collected by pytest – run directly:
+
+             python tests/bench_scholarship_detail.py [requests] [round_trip_ms]
+"""
+
+import itertools
+import random
+import sys
+from datetime import date
+
+from flask import jsonify
+
+import conftest  # noqa: F401  (repo root on sys.path, offline settings)
+from factories import random_catalog
+from fake_supabase import FakeSupabase, fake_api, catalog_tables, AUTH_HEADERS
+from timing import sample, describe
+
+
+def legacy_detail(client: FakeSupabase, scholarship_id: str):
+    """The original four-query detail view."""
+    scholarship = client.table("scholarships").select("*").eq("id", scholarship_id).single().execute().data
+    eligibility = (
+        client.table("eligibility").select("id, community, gender, education_level")
+        .eq("scholarship_id", scholarship_id).execute().data
+    )
+    documents = (
+        client.table("documents_required").select("id, document_name")
+        .eq("scholarship_id", scholarship_id).execute().data
+    )
+    steps = (
+        client.table("application_steps").select("id, step_number, step_text")
+        .eq("scholarship_id", scholarship_id).order("step_number", desc=False).execute().data
+    )
+    return jsonify({
+        "scholarship":        scholarship,
+        "eligibility":        eligibility or [],
+        "documents_required": documents or [],
+        "application_steps":  steps or []
+    }), 200
+
+
+def main(requests: int = 500, round_trip_ms: float = 2.0) -> None:
+    rng    = random.Random(42)
+    tables = catalog_tables(*random_catalog(rng, 1000, date.today()))
+    for row in tables["scholarships"]:
+        row.update(created_at="2025-01-01T00:00:00Z", updated_at="2025-01-01T00:00:00Z")
+    fake   = FakeSupabase(tables, latency_ms=round_trip_ms)
+    client = fake_api(setattr, fake)
+    client.application.add_url_rule(
+        "/legacy/<scholarship_id>", "legacy_detail", lambda scholarship_id: legacy_detail(fake, scholarship_id)
+    )
+
+    active   = [s["id"] for s in tables["scholarships"] if s["is_active"]]
+    inactive = [s["id"] for s in tables["scholarships"] if not s["is_active"]]
+    client.get(f"/api/scholarships/{active[0]}", headers=AUTH_HEADERS)   # load the catalog
+
+    # Same payload both ways
+    for s_id in inactive[:20]:
+        legacy = client.get(f"/legacy/{s_id}").get_json()
+        now    = client.get(f"/api/scholarships/{s_id}", headers=AUTH_HEADERS).get_json()
+        assert legacy == now, s_id
+
+    print(f"{requests} requests, {round_trip_ms} ms per round trip")
+    for label, url, ids in (
+        ("before (4 queries)", "/legacy/{}",               inactive),
+        ("embedded query",     "/api/scholarships/{}",     inactive),
+        ("catalog (active)",   "/api/scholarships/{}",     active),
+    ):
+        cycle = itertools.cycle(ids)
+
+        def get():
+            response = client.get(url.format(next(cycle)), headers=AUTH_HEADERS)
+            assert response.status_code == 200, response.get_json()
+
+        start   = len(fake.queries)
+        samples = sample(get, requests)
+        print(f"  {label:19} {(len(fake.queries) - start) / requests:4.1f} round trips/request, {describe(samples)}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]), *(float(arg) for arg in sys.argv[2:3]))
@@ -0,0 +1,92 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/bench_scholarship_list.py
+PURPOSE: Round trips and latency of a filtered GET /api/scholarships/ over
+         a catalog of thousands of scholarships, against the fake
+         Supabase client with a fixed latency per round trip:
+           - before: one eligibility query per scholarship (N+1), ported
+             from the original list_all_scholarships
+           - now:    the endpoint, with a cold catalog (snapshot load) and
+             a warm one
+         Not collected by pytest – run directly:
+
+             python tests/bench_scholarship_list.py [catalog_size] [requests] [round_trip_ms]
+"""
+
+import itertools
+import random
+import sys
+from datetime import date
+
+import conftest  # noqa: F401  (repo root on sys.path, offline settings)
+from app.services.catalog import invalidate_catalog
+from factories import random_catalog, PROFILE_COMMUNITIES, ELIGIBILITY_GENDERS, EDUCATION_LEVELS
+from fake_supabase import FakeSupabase, fake_api, catalog_tables, AUTH_HEADERS
+from timing import sample, describe
+
+
+def legacy_list(client: FakeSupabase, args: dict) -> list[dict]:
+    """The original handler's queries and substring eligibility test."""
+    query = client.table("scholarships").select("*").eq("is_active", True).order("deadline", desc=False)
+    if args.get("income"):
+        query = query.or_(f"income_limit.eq.0,income_limit.gte.{args['income']}")
+    scholarships = query.execute().data or []
+
+    community, gender, education = args.get("community"), args.get("gender"), args.get("education")
+    if community or gender or education:
+        filtered = []
+        for s in scholarships:
+            eligibilities = client.table("eligibility").select("*").eq("scholarship_id", s["id"]).execute().data or []
+            for e in eligibilities:
+                if community and community.lower() not in e.get("community", "").lower():
+                    continue
+                if gender and gender.lower() not in e.get("gender", "").lower():
+                    continue
+                if education and education.lower() not in e.get("education_level", "").lower():
+                    continue
+                filtered.append(s)
+                break
+        scholarships = filtered
+    return scholarships
+
+
+def main(catalog_size: int = 3000, requests: int = 200, round_trip_ms: float = 1.0) -> None:
+    rng  = random.Random(42)
+    fake = FakeSupabase(catalog_tables(*random_catalog(rng, catalog_size, date.today())), latency_ms=round_trip_ms)
+    client = fake_api(setattr, fake, SCHOLARSHIP_SEARCH_MODE="substring")
+
+    filter_sets = [
+        {"community": c, "gender": g, "education": e, "income": "200000"}
+        for c, g, e in itertools.product(PROFILE_COMMUNITIES, ELIGIBILITY_GENDERS[:2], EDUCATION_LEVELS)
+    ]
+    rng.shuffle(filter_sets)
+    urls = itertools.cycle(
+        "/api/scholarships/?" + "&".join(f"{k}={v}" for k, v in args.items()) for args in filter_sets
+    )
+    print(f"{catalog_size} scholarships, {round_trip_ms} ms per round trip")
+
+    # Before: every request is 1 + N round trips, so only a few are timed
+    legacy_args = itertools.cycle(filter_sets)
+    start = len(fake.queries)
+    legacy = sample(lambda: legacy_list(fake, next(legacy_args)), 5)
+    print(f"  before (N+1):   {(len(fake.queries) - start) / 5:7.1f} round trips/request, {describe(legacy)}")
+
+    def get():
+        response = client.get(next(urls), headers=AUTH_HEADERS)
+        assert response.status_code == 200, response.get_json()
+
+    def cold_get():
+        invalidate_catalog()
+        get()
+
+    start = len(fake.queries)
+    cold  = sample(cold_get, 20)
+    print(f"  now, cold:      {(len(fake.queries) - start) / 20:7.1f} round trips/request, {describe(cold)}")
+
+    start = len(fake.queries)
+    warm  = sample(get, requests)
+    print(f"  now, warm:      {(len(fake.queries) - start) / requests:7.1f} round trips/request, {describe(warm)}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]), *(float(arg) for arg in sys.argv[3:4]))
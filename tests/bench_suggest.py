@@ -0,0 +1,53 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/bench_suggest.py
+PURPOSE: Per-keystroke latency of the typeahead index
+         (app/services/suggest.py): every prefix of every scholarship name
+         and alias, typed one character at a time, on the seed catalog
+         and on a large synthetic one. Also the index build time (once
+         per catalog version).
+         Not collected by pytest – run directly:
+
+             python tests/bench_suggest.py [synthetic_size]
+"""
+
+import random
+import sys
+import time
+from datetime import date
+
+import conftest  # noqa: F401  (repo root on sys.path, offline settings)
+from app.services.suggest import SuggestIndex, NAME_ALIASES, PORTAL_ALIASES
+from factories import random_catalog, active_catalog
+from seed_catalog import load_seed_catalog
+from test_suggest import make_records
+from timing import sample, describe
+
+
+def keystrokes(records: list) -> list[str]:
+    """What a user types on the way to each name or alias: "e", "e-", "e-g", ..."""
+    targets = [r.row["name"] for r in records]
+    targets += [alias for names in (*NAME_ALIASES.values(), *PORTAL_ALIASES.values()) for alias in names]
+    return [target[:end] for target in targets for end in range(1, len(target) + 1)]
+
+
+def run(label: str, records: list) -> None:
+    started = time.perf_counter()
+    index   = SuggestIndex(records)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    typed = keystrokes(records)
+    queue = iter(typed * 3)
+    samples = sample(lambda: index.suggest(next(queue)), len(typed) * 3)
+    print(f"  {label:22} build {build_ms:7.1f} ms, {len(typed):6} keystrokes, {describe(samples)}")
+
+
+def main(synthetic_size: int = 5000) -> None:
+    print("per keystroke (suggest only, no HTTP):")
+    run("seed catalog", make_records(load_seed_catalog()["scholarships"]))
+    scholarships, _ = active_catalog(*random_catalog(random.Random(42), synthetic_size, date.today()))
+    run(f"{len(scholarships)} synthetic", make_records(scholarships))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,108 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/bench_user_client.py
+PURPOSE: Per-request cost of get_user_client (app/middleware/auth.py) for
+         GET /api/profile/, before and after the shared-transport client:
+           - before: a full Supabase client per request (create_client +
+             auth.set_session, which also asks Supabase Auth for the user)
+           - now:    a PostgREST client over the pooled rls_transport
+         Construction alone is timed first, then whole requests against a
+         local HTTP stand-in for PostgREST / Supabase Auth (so new
+         connections and the extra auth round trip are real).
+         Not collected by pytest – run directly:
+
+             python tests/bench_user_client.py [requests]
+"""
+
+import json
+import os
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import conftest  # noqa: F401  (repo root on sys.path, offline settings)
+from supabase import create_client
+
+from app.middleware.auth import get_user_client
+from app.routes import profile
+from fake_supabase import FakeSupabase, fake_api, AUTH_HEADERS, TEST_USER_ID
+from test_auth_tokens import make_token
+from timing import sample, describe
+
+PROFILE = {
+    "id": TEST_USER_ID, "name": "Fatima Khan", "community": "Muslim", "gender": "Female",
+    "education_level": "Degree", "income": 180000, "district": "Malappuram", "is_admin": False,
+}
+AUTH_USER = {
+    "id": TEST_USER_ID, "aud": "authenticated", "role": "authenticated",
+    "email": "student@example.com", "app_metadata": {}, "user_metadata": {},
+    "created_at": "2025-01-01T00:00:00Z",
+}
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    """GET /rest/v1/profiles and GET /auth/v1/user, nothing else."""
+    protocol_version = "HTTP/1.1"
+    connections      = 0
+
+    def setup(self):
+        super().setup()
+        # Headers and body are separate writes: without this, delayed ACKs add ~40 ms
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        type(self).connections += 1
+
+    def do_GET(self):
+        # postgrest-py sends a "{}" body even on GET: read it, or it leaks into the next request
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        body = json.dumps(PROFILE if self.path.startswith("/rest/v1/profiles") else AUTH_USER).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def legacy_user_client(token: str):
+    """The original get_user_client."""
+    client = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_KEY"])
+    client.auth.set_session(token, "")
+    return client
+
+
+def main(requests: int = 500) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["SUPABASE_URL"] = url
+
+    client = fake_api(setattr, FakeSupabase({}), SUPABASE_URL=url)
+    token  = make_token(sub=TEST_USER_ID)
+    headers = {**AUTH_HEADERS, "Authorization": f"Bearer {token}"}
+
+    def get():
+        response = client.get("/api/profile/", headers=headers)
+        assert response.status_code == 200, response.get_json()
+
+    print(f"{requests} requests against a local stand-in at {url}")
+    with client.application.app_context():
+        print(f"  construction, before (create_client):  "
+              f"{describe(sample(lambda: create_client(url, os.environ['SUPABASE_KEY']), requests))}")
+        print(f"  construction, now (get_user_client):   "
+              f"{describe(sample(lambda: get_user_client(token), requests))}")
+
+    for label, factory in (("before", legacy_user_client), ("now", get_user_client)):
+        profile.get_user_client = factory
+        _StandIn.connections = 0
+        samples = sample(get, requests)
+        print(f"  GET /api/profile/, {label:6}  {describe(samples)}, "
+              f"{_StandIn.connections} connections opened")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
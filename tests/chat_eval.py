@@ -0,0 +1,52 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/chat_eval.py
+PURPOSE: Labelled chat questions → the seed scholarships (02_seed_data.sql)
+         an answer needs, for measuring retrieval recall@k offline.
+"""
+
+# (question, names of the scholarships the answer must draw on)
+LABELLED_QUESTIONS = [
+    ("What documents are needed for e-Grantz?",
+     ["E-Grantz Scholarship (Kerala)", "E-Grantz OBC Scholarship (Kerala)"]),
+    ("How do I apply for the CH Muhammed Koya scholarship?",
+     ["CH Muhammed Koya Scholarship"]),
+    ("Is there a scholarship for Muslim girls doing a degree?",
+     ["CH Muhammed Koya Scholarship"]),
+    ("Which fellowship can minority PhD students get from UGC?",
+     ["Maulana Azad National Fellowship"]),
+    ("Rajiv Gandhi fellowship eligibility",
+     ["Rajiv Gandhi National Fellowship (SC/ST)"]),
+    ("I want to study abroad for my PhD, I am SC. Any scholarship?",
+     ["Overseas Scholarship for SC/ST (Kerala)"]),
+    ("AICTE Pragati scholarship amount for girls in diploma",
+     ["AICTE Pragati Scholarship for Girls"]),
+    ("single girl child scholarship for PG",
+     ["UGC Single Girl Child Scholarship (PG)"]),
+    ("CBSE scholarship for single girl child in class 11",
+     ["CBSE Merit Scholarship for Single Girl Child"]),
+    ("What is the Mother Teresa scholarship?",
+     ["Mother Teresa Scholarship for Women"]),
+    ("Chief Minister research fellowship deadline",
+     ["Chief Minister's Research Fellowship (Kerala)"]),
+    ("CSIR JRF for chemical sciences",
+     ["CSIR Junior Research Fellowship"]),
+    ("UGC NET JRF fellowship",
+     ["UGC Junior Research Fellowship (JRF)"]),
+    ("Top class education scheme IIT admission SC",
+     ["Top Class Education Scheme for SC Students"]),
+    ("APJ Abdul Kalam scholarship for diploma",
+     ["APJ Abdul Kalam Scholarship"]),
+    ("merit cum means scholarship for engineering minority students",
+     ["Merit-cum-Means Scholarship (Minority)"]),
+    ("pre matric scholarship for OBC students in class 8",
+     ["Pre-Matric Scholarship for OBC Students"]),
+    ("post matric scholarship for SC/ST students documents",
+     ["Post Matric Scholarship for SC/ST Students"]),
+    ("Central sector OBC scholarship for degree",
+     ["Central Sector OBC Scholarship Scheme"]),
+    ("Dr Ambedkar scheme education loan interest subsidy",
+     ["Dr. Ambedkar Centrally Sponsored Scheme (OBC/SC)"]),
+    ("National fellowship for ST students M.Phil",
+     ["National Fellowship for Higher Education of ST Students"]),
+]
@@ -0,0 +1,76 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/factories.py
+PURPOSE: Seeded random catalogs and profiles drawn from the values the
+         schema allows (01_schema.sql CHECK constraints), shared by the
+         matching / alert tests and benchmarks.
+"""
+
+import random
+import uuid
+from datetime import date, timedelta
+
+PROFILE_COMMUNITIES = ["Muslim", "SC", "ST", "SC/ST", "OBC", "SC/OBC", "General", "Minority"]
+PROFILE_GENDERS     = ["Male", "Female", "Other"]
+EDUCATION_LEVELS    = ["School", "PostMatric", "Diploma", "Degree", "PG", "PhD",
+                       "Professional", "Technical", "Engineering"]
+
+ELIGIBILITY_COMMUNITIES = PROFILE_COMMUNITIES + ["Any"]
+ELIGIBILITY_GENDERS     = ["Male", "Female", "Any"]
+ELIGIBILITY_EDUCATION   = EDUCATION_LEVELS + ["Any"]
+
+INCOME_LEVELS = [0, 50000, 100000, 200000, 250000, 300000, 800000]
+
+
+def random_catalog(rng: random.Random, size: int, today: date) -> tuple[list[dict], dict[str, list[dict]]]:
+    """
+    (scholarships, eligibility by scholarship id) – active and inactive
+    rows, past / upcoming / missing deadlines, income_limit 0 included,
+    and some scholarships without any eligibility row.
+    """
+    scholarships, eligibility = [], {}
+    for n in range(size):
+        s_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        roll = rng.random()
+        if roll < 0.15:
+            deadline = None
+        else:
+            deadline = (today + timedelta(days=rng.randint(-60, 120))).isoformat()
+        scholarships.append({
+            "id":           s_id,
+            "name":         f"Scholarship {n:04d} {rng.choice(['Merit', 'Post Matric', 'Fellowship'])}",
+            "description":  "Synthetic scholarship",
+            "deadline":     deadline,
+            "income_limit": rng.choice(INCOME_LEVELS),
+            "amount_min":   1000,
+            "amount_max":   rng.randint(1000, 50000),
+            "portal_url":   "https://scholarships.gov.in",
+            "is_active":    rng.random() < 0.9,
+        })
+        eligibility[s_id] = [
+            {
+                "scholarship_id":  s_id,
+                "community":       rng.choice(ELIGIBILITY_COMMUNITIES),
+                "gender":          rng.choice(ELIGIBILITY_GENDERS),
+                "education_level": rng.choice(ELIGIBILITY_EDUCATION),
+            }
+            for _ in range(rng.choice([0, 1, 1, 2, 3]))
+        ]
+    # Shuffle so the engine cannot rely on input order
+    rng.shuffle(scholarships)
+    return scholarships, eligibility
+
+
+def random_profile(rng: random.Random) -> dict:
+    return {
+        "community":       rng.choice(PROFILE_COMMUNITIES),
+        "gender":          rng.choice(PROFILE_GENDERS),
+        "education_level": rng.choice(EDUCATION_LEVELS),
+        "income":          rng.choice(INCOME_LEVELS + [None, 150000, 900000]),
+    }
+
+
+def active_catalog(scholarships: list[dict], eligibility: dict) -> tuple[list[dict], dict]:
+    """What the catalog snapshot holds: active scholarships only."""
+    active = [s for s in scholarships if s["is_active"]]
+    return active, {s["id"]: eligibility[s["id"]] for s in active}
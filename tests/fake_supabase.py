@@ -0,0 +1,295 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/fake_supabase.py
+PURPOSE: In-memory stand-in for the Supabase / PostgREST client, shared by
+         the tests and benchmarks. Serves .table(...) queries (select with
+         embedded child tables, eq / gt / in_ / ilike / or_, order, range /
+         limit, single, count) from lists of dict rows. Every execute() is
+         one round trip: it is recorded in .queries and can sleep for a
+         fixed latency. max_rows caps each response like PostgREST's
+         max-rows setting does (silently).
+"""
+
+import copy
+import re
+import time
+
+# Child table → column pointing at its parent row's id
+FOREIGN_KEYS = {
+    "eligibility":        "scholarship_id",
+    "documents_required": "scholarship_id",
+    "application_steps":  "scholarship_id",
+}
+
+_EMBED_RE = re.compile(r"^(\w+)\((.*)\)$")
+
+
+class FakeResult:
+    def __init__(self, data, count=None):
+        self.data  = data
+        self.count = count
+
+
+def _split_columns(columns: str) -> list[str]:
+    """Top-level comma split: "id, eligibility(id, gender)" → ["id", "eligibility(id, gender)"]."""
+    parts, depth, current = [], 0, ""
+    for char in columns:
+        if char == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+            continue
+        depth += (char == "(") - (char == ")")
+        current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _parse_order(spec: str) -> list[tuple[str, bool]]:
+    """"created_at.desc,id.desc" → [("created_at", True), ("id", True)]."""
+    keys = []
+    for part in spec.split(","):
+        column, *modifiers = part.strip().split(".")
+        keys.append((column, "desc" in modifiers))
+    return keys
+
+
+def _sort(rows: list[dict], keys: list[tuple[str, bool]]) -> list[dict]:
+    """Postgres order: NULLs last ascending, first descending."""
+    rows = list(rows)
+    for column, desc in reversed(keys):
+        present = sorted((r for r in rows if r.get(column) is not None), key=lambda r: r[column], reverse=desc)
+        missing = [r for r in rows if r.get(column) is None]
+        rows = missing + present if desc else present + missing
+    return rows
+
+
+class FakeQuery:
+    def __init__(self, client, table: str):
+        self.client        = client
+        self.table_name    = table
+        self.columns       = "*"
+        self.count_mode    = None
+        self.equals        = []
+        self.filters       = []
+        self.order_keys    = []
+        self.embed_orders  = {}
+        self.bounds        = None
+        self.row_limit     = None
+        self.single_row    = False
+        self.params        = []   # what the request would send, for assertions
+
+    # ── Query builder ──────────────────────────────────────────────
+    def select(self, columns: str = "*", count: str | None = None):
+        self.columns    = columns
+        self.count_mode = count
+        self.params.append(("select", columns))
+        return self
+
+    def eq(self, column, value):
+        self.equals.append((column, value))
+        self.params.append((column, f"eq.{value}"))
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda r: r.get(column) is not None and r[column] > value)
+        self.params.append((column, f"gt.{value}"))
+        return self
+
+    def in_(self, column, values):
+        allowed = set(values)
+        self.filters.append(lambda r: r.get(column) in allowed)
+        self.params.append((column, f"in.({','.join(map(str, values))})"))
+        return self
+
+    def ilike(self, column, pattern):
+        needle = pattern.strip("%").lower()
+        self.filters.append(lambda r: needle in (r.get(column) or "").lower())
+        self.params.append((column, f"ilike.{pattern}"))
+        return self
+
+    def or_(self, expression):
+        # Only the "income_limit.eq.0,income_limit.gte.N" shape is needed
+        alternatives = [part.split(".", 2) for part in expression.split(",")]
+        ops = {"eq": lambda a, b: a == b, "gte": lambda a, b: a >= b, "lte": lambda a, b: a <= b}
+        self.filters.append(lambda r: any(
+            r.get(column) is not None and ops[op](r[column], type(r[column])(value))
+            for column, op, value in alternatives
+        ))
+        self.params.append(("or", f"({expression})"))
+        return self
+
+    def order(self, column, *, desc=False, nullsfirst=False, foreign_table=None):
+        spec = f"{column}{'.desc' if desc else ''}"
+        if foreign_table:
+            self.embed_orders[foreign_table] = _parse_order(spec)
+            self.params.append(("order", f"{foreign_table}({spec})"))
+        else:
+            self.order_keys += _parse_order(spec)
+            self.params.append(("order", spec))
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        self.params.append(("range", (start, end)))
+        return self
+
+    def limit(self, n):
+        self.row_limit = n
+        self.params.append(("limit", n))
+        return self
+
+    def single(self):
+        self.single_row = True
+        return self
+
+    # ── Execution ──────────────────────────────────────────────────
+    def _project(self, row: dict) -> dict:
+        out = {}
+        for column in _split_columns(self.columns):
+            embed = _EMBED_RE.match(column)
+            if embed:
+                child, child_columns = embed.groups()
+                foreign_key = FOREIGN_KEYS[child]
+                children = self.client.lookup(child, foreign_key, row["id"])
+                if child in self.embed_orders:
+                    children = _sort(children, self.embed_orders[child])
+                wanted = [c.strip() for c in child_columns.split(",")]
+                out[child] = [
+                    dict(c) if wanted == ["*"] else {k: c.get(k) for k in wanted}
+                    for c in children
+                ]
+            elif column == "*":
+                out.update(row)
+            else:
+                out[column] = row.get(column)
+        return out
+
+    def execute(self):
+        client = self.client
+        client.queries.append((self.table_name, list(self.params)))
+        if client.latency:
+            time.sleep(client.latency)
+
+        if self.equals:
+            column, value = self.equals[0]
+            rows = client.lookup(self.table_name, column, value)
+        else:
+            rows = client.tables.get(self.table_name, [])
+        rows = [
+            r for r in rows
+            if all(r.get(column) == value for column, value in self.equals[1:]) and all(f(r) for f in self.filters)
+        ]
+        if self.order_keys:
+            rows = _sort(rows, self.order_keys)
+        count = len(rows) if self.count_mode else None
+
+        start = self.bounds[0] if self.bounds else 0
+        size  = self.bounds[1] - self.bounds[0] + 1 if self.bounds else self.row_limit
+        if client.max_rows is not None:
+            size = client.max_rows if size is None else min(size, client.max_rows)
+        rows = rows[start:] if size is None else rows[start:start + size]
+
+        data = [copy.deepcopy(self._project(r)) for r in rows]
+        if self.single_row:
+            if len(data) != 1:
+                raise ValueError("JSON object requested, multiple (or no) rows returned")
+            data = data[0]
+        return FakeResult(data, count)
+
+
+class FakeSupabase:
+    """
+    Fake client over {table name: [row dicts]}.
+
+    latency_ms : sleep per round trip (stands in for the network)
+    max_rows   : cap on rows per response, like PostgREST max-rows
+    rpcs       : {function name: callable(params) → data}
+    """
+
+    def __init__(self, tables: dict[str, list[dict]], latency_ms: float = 0.0,
+                 max_rows: int | None = None, rpcs: dict | None = None):
+        self.tables   = tables
+        self.latency  = latency_ms / 1000
+        self.max_rows = max_rows
+        self.rpcs     = rpcs or {}
+        self.queries: list[tuple[str, list]] = []
+        self._indexes: dict[tuple[str, str], tuple[int, dict]] = {}
+
+    def lookup(self, table: str, column: str, value) -> list[dict]:
+        """Rows of table where column == value, through an index rebuilt when the table grows or shrinks."""
+        rows = self.tables.get(table, [])
+        key  = (table, column)
+        size, index = self._indexes.get(key, (None, None))
+        if size != len(rows):
+            index = {}
+            for row in rows:
+                index.setdefault(row.get(column), []).append(row)
+            self._indexes[key] = (len(rows), index)
+        return index.get(value, [])
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: dict):
+        client = self
+
+        class _Call:
+            def execute(self):
+                client.queries.append((f"rpc:{name}", [("params", params)]))
+                if client.latency:
+                    time.sleep(client.latency)
+                return FakeResult(client.rpcs[name](params))
+
+        return _Call()
+
+
+def catalog_tables(scholarships: list[dict], eligibility: dict[str, list[dict]]) -> dict[str, list[dict]]:
+    """Tables for a tests/factories.py random_catalog(), ids added to the child rows."""
+    rows = [dict(e, id=n) for n, e in enumerate((e for s in scholarships for e in eligibility[s["id"]]), 1)]
+    return {
+        "scholarships":       scholarships,
+        "eligibility":        rows,
+        "documents_required": [
+            {"id": n, "scholarship_id": s["id"], "document_name": f"Document {n}"}
+            for n, s in enumerate(scholarships, 1)
+        ],
+        "application_steps":  [
+            {"id": n * 2 + step, "scholarship_id": s["id"], "step_number": step + 1, "step_text": f"Step {step + 1}"}
+            for n, s in enumerate(scholarships)
+            for step in (1, 0)   # stored out of order
+        ],
+    }
+
+
+# ── App wired to a fake ────────────────────────────────────────────
+
+TEST_USER_ID = "00000000-0000-4000-8000-000000000001"
+AUTH_HEADERS = {"Authorization": "Bearer test-token"}
+
+
+class _TestUser:
+    id    = TEST_USER_ID
+    email = "student@example.com"
+
+
+def fake_api(setattr, fake: FakeSupabase, **config):
+    """
+    Test client for the real app with the catalog / scholarship routes
+    reading from fake, and any bearer token signed in as TEST_USER_ID.
+    setattr is monkeypatch.setattr in tests, the builtin in benchmarks.
+    """
+    from app import create_app
+    from app.middleware import auth
+    from app.routes import scholarships
+    from app.services import catalog
+
+    setattr(auth, "verify_access_token", lambda token: _TestUser())
+    setattr(catalog, "supabase_admin", fake)
+    setattr(scholarships, "supabase_client", fake)
+    setattr(scholarships, "supabase_admin", fake)
+    catalog.invalidate_catalog()
+
+    app = create_app()
+    app.config.update(config)
+    return app.test_client()
@@ -0,0 +1,78 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/seed_catalog.py
+PURPOSE: The 02_seed_data.sql scholarships as a catalog snapshot dict
+         (same keys as app/services/catalog.py), read straight from the
+         SQL file so offline tests use the real catalog text.
+"""
+
+import os
+import re
+
+SEED_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "02_seed_data.sql")
+
+_INSERT_RE = re.compile(r"INSERT INTO public\.(\w+)\s*\(([^)]*)\)\s*VALUES(.*?);", re.S)
+_VALUE_RE  = re.compile(r"'((?:[^']|'')*)'|(-?\d+)|(TRUE|FALSE|NULL|v_id)")
+
+
+def _tuples(values_sql: str) -> list[list]:
+    """Rows of a VALUES list: quoted strings, integers, TRUE/FALSE/NULL, v_id."""
+    rows, row, depth = [], None, 0
+    pos = 0
+    while pos < len(values_sql):
+        char = values_sql[pos]
+        if char == "(" and depth == 0:
+            row, depth = [], 1
+            pos += 1
+            continue
+        if char == ")" and depth == 1:
+            rows.append(row)
+            depth = 0
+            pos += 1
+            continue
+        if depth == 1:
+            match = _VALUE_RE.match(values_sql, pos)
+            if match:
+                text, number, word = match.groups()
+                if text is not None:
+                    row.append(text.replace("''", "'"))
+                elif number is not None:
+                    row.append(int(number))
+                else:
+                    row.append({"TRUE": True, "FALSE": False, "NULL": None}.get(word, "v_id"))
+                pos = match.end()
+                continue
+        pos += 1
+    return rows
+
+
+def load_seed_catalog() -> dict:
+    with open(SEED_FILE, encoding="utf-8") as f:
+        sql = f.read()
+
+    scholarships, eligibility, documents, steps = [], {}, {}, {}
+    for n, block in enumerate(sql.split("DO $$")[1:], start=1):
+        s_id = f"seed-{n:02d}"
+        for table, columns, values in _INSERT_RE.findall(block):
+            names = [c.strip() for c in columns.split(",")]
+            for values_row in _tuples(values):
+                row = {name: (s_id if value == "v_id" else value) for name, value in zip(names, values_row)}
+                if table == "scholarships":
+                    scholarships.append(row)
+                elif table == "eligibility":
+                    eligibility.setdefault(s_id, []).append(row)
+                elif table == "documents_required":
+                    documents.setdefault(s_id, []).append(row)
+                elif table == "application_steps":
+                    steps.setdefault(s_id, []).append(row)
+
+    scholarships.sort(key=lambda s: (s.get("deadline") is None, s.get("deadline") or "", s["id"]))
+    return {
+        "version":            1,
+        "etag":               "seed",
+        "scholarships":       scholarships,
+        "eligibility":        {s["id"]: eligibility.get(s["id"], []) for s in scholarships},
+        "documents_required": {s["id"]: documents.get(s["id"], []) for s in scholarships},
+        "application_steps":  {s["id"]: sorted(steps.get(s["id"], []), key=lambda st: st["step_number"])
+                               for s in scholarships},
+    }
@@ -0,0 +1,135 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_alert_cohorts.py
+PURPOSE: The cohort alert strategy (app/routes/alerts.py) notifies exactly
+         the users / scholarships a per-user engine.match() pass would,
+         and its table reads page in a stable order.
+"""
+
+import random
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+from app.routes import alerts
+from app.services.matching import MatchingEngine
+from factories import random_catalog, random_profile, active_catalog
+
+TODAY = date(2025, 10, 1)
+
+
+def random_population(rng: random.Random, size: int) -> tuple[list[dict], dict]:
+    """Profiles plus alert_before_days for some of them (others use the default)."""
+    profiles = [
+        {"id": str(uuid.UUID(int=rng.getrandbits(128))), **random_profile(rng)}
+        for _ in range(size)
+    ]
+    days_by_user = {p["id"]: rng.choice([1, 3, 7, 14, 30, 90]) for p in profiles if rng.random() < 0.6}
+    # A preference without a profile matches nothing
+    days_by_user[str(uuid.UUID(int=rng.getrandbits(128)))] = 30
+    return profiles, days_by_user
+
+
+def per_user_rows(profiles: list[dict], days_by_user: dict, engine: MatchingEngine, today: date) -> list[dict]:
+    """The per-user strategy's selection (_process_user) with the engine instead of the RPC."""
+    rows = []
+    for p in profiles:
+        alert_cutoff = (today + timedelta(days=days_by_user.get(p["id"], 7))).isoformat()
+        for s in engine.match(p):
+            if s.get("deadline") and today.isoformat() <= s["deadline"] <= alert_cutoff:
+                rows.append({
+                    "user_id":        p["id"],
+                    "scholarship_id": s["scholarship_id"],
+                    "message": (
+                        f"⏰ Deadline Alert: '{s['name']}' deadline is on {s['deadline']} "
+                        f"({s['days_until_due']} days remaining). Apply now!"
+                    ),
+                    "is_read":        False
+                })
+    return rows
+
+
+def _key(row: dict) -> tuple:
+    return row["user_id"], row["scholarship_id"], row["message"]
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_cohort_rows_equal_per_user_rows(seed):
+    rng = random.Random(seed)
+    scholarships, eligibility = active_catalog(*random_catalog(rng, 60, TODAY))
+    engine     = MatchingEngine(scholarships, eligibility, TODAY)
+    thresholds = sorted({s["income_limit"] for s in scholarships if s.get("income_limit")})
+    profiles, days_by_user = random_population(rng, 400)
+
+    rows, cohort_count = alerts._cohort_notification_rows(profiles, days_by_user, engine, thresholds, TODAY)
+    expected = per_user_rows(profiles, days_by_user, engine, TODAY)
+
+    assert sorted(map(_key, rows)) == sorted(map(_key, expected))
+    assert len(rows) == len(expected)   # no pair twice
+    assert cohort_count <= len(profiles)
+
+
+def test_incomes_between_the_same_thresholds_share_a_cohort():
+    rng = random.Random(7)
+    scholarships, eligibility = active_catalog(*random_catalog(rng, 40, TODAY))
+    engine     = MatchingEngine(scholarships, eligibility, TODAY)
+    thresholds = sorted({s["income_limit"] for s in scholarships if s.get("income_limit")})
+    base = {"community": "SC", "gender": "Female", "education_level": "Degree"}
+    # Equal to a threshold, just above it, and no income at all
+    profiles = [
+        {"id": f"u{n}", **base, "income": income}
+        for n, income in enumerate([thresholds[0], thresholds[0] + 1, None, 0, 10 ** 9])
+    ]
+
+    rows, _ = alerts._cohort_notification_rows(profiles, {}, engine, thresholds, TODAY)
+
+    assert sorted(map(_key, rows)) == sorted(map(_key, per_user_rows(profiles, {}, engine, TODAY)))
+
+
+# ── Paged reads ────────────────────────────────────────────────────
+
+class _FakeQuery:
+    """Records the query and serves one range of an ordered table."""
+
+    def __init__(self, rows: list[dict], calls: list):
+        self.rows  = rows
+        self.calls = calls
+        self.order_by = None
+        self.bounds   = None
+
+    def table(self, name):
+        return self
+
+    def select(self, columns):
+        return self
+
+    def order(self, column):
+        self.order_by = column
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def execute(self):
+        self.calls.append((self.order_by, self.bounds))
+        start, end = self.bounds
+        ordered = sorted(self.rows, key=lambda r: r[self.order_by]) if self.order_by else self.rows
+        return type("Result", (), {"data": ordered[start:end + 1]})()
+
+
+def test_fetch_all_pages_in_a_stable_order(monkeypatch):
+    rows  = [{"id": f"{n:05d}"} for n in range(2 * alerts.PAGE_SIZE + 17)]
+    calls = []
+    monkeypatch.setattr(alerts, "supabase_admin", _FakeQuery(list(reversed(rows)), calls))
+
+    fetched = alerts._fetch_all("profiles", "id", order="id")
+
+    assert fetched == rows
+    assert [order for order, _ in calls] == ["id", "id", "id"]
+    assert [bounds for _, bounds in calls] == [
+        (0, alerts.PAGE_SIZE - 1),
+        (alerts.PAGE_SIZE, 2 * alerts.PAGE_SIZE - 1),
+        (2 * alerts.PAGE_SIZE, 3 * alerts.PAGE_SIZE - 1),
+    ]
@@ -0,0 +1,50 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_answer_cache.py
+PURPOSE: AnswerCache keying on catalog content (app/services/answer_cache.py)
+"""
+
+from app.services.answer_cache import AnswerCache
+
+
+def test_same_content_keeps_answers_across_reloads():
+    # A TTL reload with unchanged content yields the same etag
+    cache = AnswerCache(max_entries=10, ttl=3600)
+    assert cache.get("etag-a", "What is E-Grantz?") is None
+    cache.put("etag-a", "What is E-Grantz?", "answer")
+
+    assert cache.get("etag-a", "what is e-grantz") == "answer"
+
+
+def test_changed_content_drops_answers():
+    cache = AnswerCache(max_entries=10, ttl=3600)
+    cache.get("etag-a", "q")
+    cache.put("etag-a", "q", "old answer")
+
+    assert cache.get("etag-b", "q") is None
+    assert cache.get("etag-a", "q") is None
+
+
+def test_put_from_older_content_is_dropped():
+    # A stream started before a catalog change finishes after it
+    cache = AnswerCache(max_entries=10, ttl=3600)
+    cache.get("etag-1", "q")
+    cache.put("etag-1", "q", "a")
+    cache.get("etag-2", "x")
+    cache.put("etag-2", "x", "b")
+
+    cache.put("etag-1", "late", "stale")
+
+    assert cache.get("etag-2", "x") == "b"
+    assert cache.get("etag-2", "late") is None
+    assert cache.stats()["size"] == 1
+
+
+def test_put_for_other_content_does_not_clear_current_entries():
+    cache = AnswerCache(max_entries=10, ttl=3600)
+    cache.get("etag-1", "q")
+    cache.put("etag-1", "q", "a")
+    cache.put("etag-2", "x", "b")
+
+    assert cache.get("etag-1", "q") == "a"
+    assert cache.get("etag-1", "x") is None
@@ -0,0 +1,88 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_auth_tokens.py
+PURPOSE: Local access-token verification (app/middleware/tokens.py) behind
+         login_required: valid tokens pass, expired / bad-signature /
+         wrong-audience tokens get 401 without asking Supabase Auth.
+"""
+
+import time
+
+import jwt
+import pytest
+from flask import Flask, g, jsonify
+
+from app.middleware import auth, tokens
+from app.middleware.auth import login_required
+
+SECRET = "test-jwt-secret-with-enough-bytes-for-hs256"
+
+
+def make_token(secret: str = SECRET, **overrides) -> str:
+    claims = {
+        "sub":   "user-1",
+        "email": "student@example.com",
+        "aud":   "authenticated",
+        "exp":   int(time.time()) + 3600,
+        **overrides,
+    }
+    return jwt.encode({k: v for k, v in claims.items() if v is not None}, secret, algorithm="HS256")
+
+
+class _NoRemoteAuth:
+    """supabase_client stand-in: the remote check must not be reached."""
+
+    class auth:
+        @staticmethod
+        def get_user(token):
+            raise AssertionError("remote get_user called")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(auth, "supabase_client", _NoRemoteAuth())
+    tokens._cache.clear()
+    app = Flask(__name__)
+    app.config.update(SUPABASE_JWT_SECRET=SECRET, JWT_AUDIENCE="authenticated", AUTH_REMOTE_FALLBACK=True)
+
+    @app.route("/me")
+    @login_required
+    def me():
+        return jsonify({"id": g.user.id, "email": g.user.email})
+
+    yield app.test_client()
+    tokens._cache.clear()
+
+
+def _get(client, token: str):
+    return client.get("/me", headers={"Authorization": f"Bearer {token}"})
+
+
+def test_valid_token_is_verified_locally(client):
+    response = _get(client, make_token())
+    assert response.status_code == 200
+    assert response.get_json() == {"id": "user-1", "email": "student@example.com"}
+
+
+@pytest.mark.parametrize("token", [
+    make_token(exp=int(time.time()) - 10),                      # expired
+    make_token(secret="some-other-secret-of-the-same-length!!"), # bad signature
+    make_token(aud="anon"),                                      # wrong audience
+    make_token(aud=None),                                        # no audience
+    make_token(sub=None),                                        # no subject
+    make_token()[:-4] + "AAAA",                                  # tampered signature
+    "not-a-jwt",
+], ids=["expired", "bad-signature", "wrong-audience", "no-audience", "no-sub", "tampered", "garbage"])
+def test_invalid_tokens_get_401(client, token):
+    response = _get(client, token)
+    assert response.status_code == 401
+    assert response.get_json()["error"] == "Invalid or expired token"
+
+
+def test_cached_token_is_rejected_once_expired(client):
+    expires = int(time.time()) + 1
+    token   = make_token(exp=expires)
+    assert _get(client, token).status_code == 200      # now in the LRU
+
+    time.sleep(max(0.0, expires - time.time()) + 0.05)
+    assert _get(client, token).status_code == 401
@@ -0,0 +1,70 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_catalog.py
+PURPOSE: The catalog snapshot (app/services/catalog.py) reads every active
+         scholarship even when PostgREST caps each response at max-rows.
+"""
+
+import random
+from datetime import date
+
+import pytest
+
+from app.services import catalog
+from factories import random_catalog
+from fake_supabase import FakeSupabase, fake_api, catalog_tables, AUTH_HEADERS
+
+SIZE = 2 * catalog.PAGE_SIZE + 300
+
+
+@pytest.fixture(scope="module")
+def tables():
+    rng = random.Random(3)
+    tables = catalog_tables(*random_catalog(rng, SIZE, date(2025, 10, 1)))
+    for n, row in enumerate(tables["scholarships"]):
+        row["is_active"] = n % 10 != 0
+    return tables
+
+
+def _active_ids(tables: dict) -> set[str]:
+    return {s["id"] for s in tables["scholarships"] if s["is_active"]}
+
+
+def test_snapshot_reads_past_max_rows(monkeypatch, tables):
+    fake = FakeSupabase(tables, max_rows=catalog.PAGE_SIZE)
+    monkeypatch.setattr(catalog, "supabase_admin", fake)
+
+    snapshot = catalog._load_snapshot(1)
+
+    assert {r.id for r in snapshot["records"]} == _active_ids(tables)
+    assert len(snapshot["scholarships"]) == len(_active_ids(tables))
+    assert [r.sort_key for r in snapshot["records"]] == sorted(r.sort_key for r in snapshot["records"])
+    # Every record keeps its own children, whichever page it came from
+    for record in snapshot["records"]:
+        assert all(e["scholarship_id"] == record.id for e in record.eligibility)
+        assert [s["step_number"] for s in record.steps] == [1, 2]
+
+
+def test_snapshot_pages_in_a_stable_order(monkeypatch, tables):
+    fake = FakeSupabase(tables, max_rows=catalog.PAGE_SIZE)
+    monkeypatch.setattr(catalog, "supabase_admin", fake)
+
+    catalog._load_snapshot(1)
+
+    params = [dict(p) for _, p in fake.queries]
+    assert [p["order"] for p in params] == [catalog.CATALOG_ORDER] * 3
+    assert [p["range"] for p in params] == [
+        (0, catalog.PAGE_SIZE - 1),
+        (catalog.PAGE_SIZE, 2 * catalog.PAGE_SIZE - 1),
+        (2 * catalog.PAGE_SIZE, 3 * catalog.PAGE_SIZE - 1),
+    ]
+
+
+def test_list_endpoint_counts_every_active_scholarship(monkeypatch, tables):
+    fake   = FakeSupabase(tables, max_rows=catalog.PAGE_SIZE)
+    client = fake_api(monkeypatch.setattr, fake)
+
+    response = client.get("/api/scholarships/?with_total=1", headers=AUTH_HEADERS)
+
+    assert response.status_code == 200
+    assert response.get_json()["total"] == len(_active_ids(tables))
@@ -0,0 +1,77 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_chat_retrieval.py
+PURPOSE: Chat context retrieval (app/routes/chat.py) on the seed catalog:
+         recall@k over a labelled question set, the no-match fallback,
+         top_k bounds, and the prompt size saved by top-k.
+"""
+
+import pytest
+
+from app.routes.chat import _build_corpus, _retrieve_context, DEFAULT_CHAT_TOP_K
+from chat_eval import LABELLED_QUESTIONS
+from seed_catalog import load_seed_catalog
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return load_seed_catalog()
+
+
+@pytest.fixture(scope="module")
+def corpus(catalog):
+    return _build_corpus(catalog)
+
+
+def recall_at_k(corpus: dict, catalog: dict, k: int) -> float:
+    """Share of labelled scholarships whose block is in the question's top-k context."""
+    names = [s["name"] for s in catalog["scholarships"]]
+    found = total = 0
+    for question, expected in LABELLED_QUESTIONS:
+        retrieved = {names[pos] for pos, _ in corpus["index"].search(question, k)}
+        found += sum(name in retrieved for name in expected)
+        total += len(expected)
+    return found / total
+
+
+def test_labelled_scholarships_exist_in_seed(catalog):
+    names = {s["name"] for s in catalog["scholarships"]}
+    for _, expected in LABELLED_QUESTIONS:
+        assert set(expected) <= names
+
+
+def test_recall_at_default_top_k(corpus, catalog):
+    assert recall_at_k(corpus, catalog, DEFAULT_CHAT_TOP_K) >= 0.95
+
+
+def test_recall_at_3(corpus, catalog):
+    assert recall_at_k(corpus, catalog, 3) >= 0.9
+
+
+def test_context_holds_only_top_k_blocks(corpus):
+    context = _retrieve_context(corpus, "What documents are needed for e-Grantz?", 2)
+    assert context.count("Scholarship Name:") == 2
+    assert "E-Grantz" in context
+
+
+def test_no_matching_term_falls_back_to_first_k_blocks(corpus):
+    context = _retrieve_context(corpus, "hello there?", 3)
+    assert context == "".join(corpus["blocks"][:3])
+
+
+@pytest.mark.parametrize("top_k", [0, -5])
+def test_top_k_below_one_still_gives_context(corpus, top_k):
+    for question in ("e-Grantz documents", "hello"):
+        assert _retrieve_context(corpus, question, top_k).count("Scholarship Name:") == 1
+
+
+def test_top_k_above_catalog_size_is_whole_catalog_at_most(corpus):
+    context = _retrieve_context(corpus, "hello", 1000)
+    assert context == "".join(corpus["blocks"])
+
+
+def test_top_k_prompt_is_a_fraction_of_the_full_catalog(corpus):
+    # 5 of the 25 seed scholarships: well under half the full-catalog prompt
+    full = sum(len(block) for block in corpus["blocks"])
+    for question, _ in LABELLED_QUESTIONS:
+        assert len(_retrieve_context(corpus, question, DEFAULT_CHAT_TOP_K)) < full * 0.4
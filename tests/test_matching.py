@@ -0,0 +1,183 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_matching.py
+PURPOSE: MatchingEngine (app/services/matching.py) gives exactly the rows
+         of the get_matching_scholarships() SQL function
+         (03_matching_and_rls.sql), checked against a direct port of its
+         WHERE / ORDER BY on seeded random catalogs and profiles.
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.services.matching import MatchingEngine
+from factories import (
+    random_catalog, random_profile, active_catalog,
+    PROFILE_COMMUNITIES, PROFILE_GENDERS, EDUCATION_LEVELS,
+)
+
+TODAY = date(2025, 10, 1)
+
+
+# ── Reference: the SQL function, clause by clause ──────────────────
+
+def sql_get_matching_scholarships(scholarships: list[dict], eligibility: dict,
+                                  profile: dict, today: date) -> list[dict]:
+    """
+    SELECT DISTINCT ... FROM scholarships s JOIN eligibility e ... WHERE
+    ... ORDER BY CASE upcoming deadline ELSE '9999-12-31' END, s.name.
+    NULL comparisons are false, as in SQL.
+    """
+    v_community = profile["community"]
+    v_gender    = profile["gender"]
+    v_education = profile["education_level"]
+    v_income    = profile["income"]
+
+    rows = {}
+    for s in scholarships:
+        for e in eligibility.get(s["id"], []):
+            if not s["is_active"]:
+                continue
+            if not (s["income_limit"] == 0 or (v_income is not None and s["income_limit"] >= v_income)):
+                continue
+            if not (
+                e["community"] == v_community
+                or e["community"] == "Any"
+                or (v_community == "Muslim" and e["community"] == "Minority")
+                or (v_community == "SC/ST" and e["community"] in ("SC", "ST"))
+                or (v_community == "SC" and e["community"] == "SC/OBC")
+                or (v_community == "OBC" and e["community"] == "SC/OBC")
+            ):
+                continue
+            if not (e["gender"] == v_gender or e["gender"] == "Any"):
+                continue
+            if not (
+                e["education_level"] == v_education
+                or e["education_level"] == "Any"
+                or (
+                    e["education_level"] == "PostMatric"
+                    and v_education in ("PostMatric", "Diploma", "Degree", "PG", "PhD",
+                                        "Technical", "Engineering", "Professional")
+                )
+            ):
+                continue
+            deadline = date.fromisoformat(s["deadline"]) if s["deadline"] else None
+            rows[s["id"]] = {
+                "scholarship_id": s["id"],
+                "name":           s["name"],
+                "description":    s["description"],
+                "deadline":       s["deadline"],
+                "income_limit":   s["income_limit"],
+                "amount_min":     s["amount_min"],
+                "amount_max":     s["amount_max"],
+                "portal_url":     s["portal_url"],
+                "days_until_due": (deadline - today).days if deadline else None,
+            }
+
+    def order(row):
+        deadline = date.fromisoformat(row["deadline"]) if row["deadline"] else None
+        upcoming = deadline if deadline is not None and deadline >= today else date(9999, 12, 31)
+        return upcoming, row["name"]
+
+    return sorted(rows.values(), key=order)
+
+
+def engine_for(scholarships: list[dict], eligibility: dict, today: date = TODAY) -> MatchingEngine:
+    return MatchingEngine(*active_catalog(scholarships, eligibility), today)
+
+
+# ── Equivalence on random catalogs ─────────────────────────────────
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_catalogs_match_sql(seed):
+    rng = random.Random(seed)
+    scholarships, eligibility = random_catalog(rng, rng.randint(0, 80), TODAY)
+    engine = engine_for(scholarships, eligibility)
+
+    for _ in range(60):
+        profile = random_profile(rng)
+        assert engine.match(profile) == sql_get_matching_scholarships(
+            scholarships, eligibility, profile, TODAY
+        ), profile
+
+
+def test_every_attribute_combination_matches_sql():
+    rng = random.Random(2025)
+    scholarships, eligibility = random_catalog(rng, 120, TODAY)
+    engine = engine_for(scholarships, eligibility)
+
+    for community in PROFILE_COMMUNITIES:
+        for gender in PROFILE_GENDERS:
+            for education in EDUCATION_LEVELS:
+                for income in (None, 0, 200000, 250001, 10 ** 7):
+                    profile = {"community": community, "gender": gender,
+                               "education_level": education, "income": income}
+                    assert engine.match(profile) == sql_get_matching_scholarships(
+                        scholarships, eligibility, profile, TODAY
+                    ), profile
+
+
+# ── Targeted cases ─────────────────────────────────────────────────
+
+def _scholarship(s_id: str, name: str, deadline: str | None, income_limit: int = 0) -> dict:
+    return {
+        "id": s_id, "name": name, "description": None, "deadline": deadline,
+        "income_limit": income_limit, "amount_min": 0, "amount_max": 0,
+        "portal_url": None, "is_active": True,
+    }
+
+
+def _rule(s_id: str, community: str, gender: str, education: str) -> dict:
+    return {"scholarship_id": s_id, "community": community, "gender": gender, "education_level": education}
+
+
+def test_attributes_must_hold_on_the_same_eligibility_row():
+    scholarships = [_scholarship("s1", "Split rows", "2025-12-01")]
+    # Community, gender and education are each satisfied – but by different rows
+    eligibility = {"s1": [_rule("s1", "Muslim", "Male", "Any"), _rule("s1", "Any", "Female", "PhD")]}
+    profile = {"community": "Muslim", "gender": "Female", "education_level": "Degree", "income": 0}
+
+    assert engine_for(scholarships, eligibility).match(profile) == []
+    assert sql_get_matching_scholarships(scholarships, eligibility, profile, TODAY) == []
+
+
+def test_income_zero_limit_and_missing_income():
+    scholarships = [
+        _scholarship("open",   "No limit",    "2025-12-01", income_limit=0),
+        _scholarship("capped", "Capped",      "2025-12-02", income_limit=100000),
+    ]
+    eligibility = {s["id"]: [_rule(s["id"], "Any", "Any", "Any")] for s in scholarships}
+    engine = engine_for(scholarships, eligibility)
+    base = {"community": "General", "gender": "Other", "education_level": "School"}
+
+    assert [r["scholarship_id"] for r in engine.match({**base, "income": 0})] == ["open", "capped"]
+    assert [r["scholarship_id"] for r in engine.match({**base, "income": 100000})] == ["open", "capped"]
+    assert [r["scholarship_id"] for r in engine.match({**base, "income": 100001})] == ["open"]
+    # NULL income: income_limit >= NULL is not true, only "no limit" matches
+    assert [r["scholarship_id"] for r in engine.match({**base, "income": None})] == ["open"]
+
+
+def test_past_and_missing_deadlines_sort_last_by_name():
+    past = (TODAY - timedelta(days=3)).isoformat()
+    scholarships = [
+        _scholarship("past",    "Alpha past",    past),
+        _scholarship("none",    "Beta none",     None),
+        _scholarship("later",   "Zeta later",    (TODAY + timedelta(days=30)).isoformat()),
+        _scholarship("today",   "Omega today",   TODAY.isoformat()),
+    ]
+    eligibility = {s["id"]: [_rule(s["id"], "Any", "Any", "Any")] for s in scholarships}
+    profile = {"community": "SC", "gender": "Male", "education_level": "PG", "income": 0}
+
+    rows = engine_for(scholarships, eligibility).match(profile)
+    assert [r["scholarship_id"] for r in rows] == ["today", "later", "past", "none"]
+    assert [r["days_until_due"] for r in rows] == [0, 30, -3, None]
+    assert rows == sql_get_matching_scholarships(scholarships, eligibility, profile, TODAY)
+
+
+def test_scholarship_without_eligibility_rows_never_matches():
+    scholarships = [_scholarship("s1", "No rules", "2025-12-01")]
+    profile = {"community": "General", "gender": "Male", "education_level": "Degree", "income": 0}
+
+    assert engine_for(scholarships, {"s1": []}).match(profile) == []
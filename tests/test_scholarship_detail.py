@@ -0,0 +1,67 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_scholarship_detail.py
+PURPOSE: GET /api/scholarships/<id> (app/routes/scholarships.py): active
+         rows from the catalog, others in one embedded query with steps
+         in order, 404 for unknown ids.
+"""
+
+import pytest
+
+from fake_supabase import FakeSupabase, fake_api, AUTH_HEADERS
+
+
+def _scholarship(s_id: str, is_active: bool) -> dict:
+    return {
+        "id": s_id, "name": f"Scholarship {s_id}", "description": "", "deadline": "2099-01-01",
+        "income_limit": 0, "amount_min": 0, "amount_max": 0, "portal_url": "",
+        "is_active": is_active, "created_at": None, "updated_at": None,
+    }
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake = FakeSupabase({
+        "scholarships":       [_scholarship("on", True), _scholarship("off", False)],
+        "eligibility":        [{"id": 1, "scholarship_id": "off", "community": "SC", "gender": "Any",
+                                "education_level": "Degree"}],
+        "documents_required": [{"id": 1, "scholarship_id": "off", "document_name": "Aadhaar Card"}],
+        "application_steps":  [
+            {"id": 1, "scholarship_id": "off", "step_number": 2, "step_text": "Apply"},
+            {"id": 2, "scholarship_id": "off", "step_number": 1, "step_text": "Register"},
+        ],
+    })
+    return fake_api(monkeypatch.setattr, fake), fake
+
+
+def test_inactive_detail_is_one_embedded_query(api):
+    client, fake = api
+    client.get("/api/scholarships/on", headers=AUTH_HEADERS)   # catalog load
+    fake.queries.clear()
+
+    body = client.get("/api/scholarships/off", headers=AUTH_HEADERS).get_json()
+
+    assert [table for table, _ in fake.queries] == ["scholarships"]
+    assert body["scholarship"]["id"] == "off"
+    assert body["eligibility"] == [{"id": 1, "community": "SC", "gender": "Any", "education_level": "Degree"}]
+    assert body["documents_required"] == [{"id": 1, "document_name": "Aadhaar Card"}]
+    assert [s["step_text"] for s in body["application_steps"]] == ["Register", "Apply"]
+
+
+def test_active_detail_is_served_from_the_catalog(api):
+    client, fake = api
+    first = client.get("/api/scholarships/on", headers=AUTH_HEADERS)
+    fake.queries.clear()
+
+    again = client.get("/api/scholarships/on", headers={**AUTH_HEADERS, "If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert again.status_code == 304
+    assert fake.queries == []
+
+
+def test_unknown_id_is_404(api):
+    client, _ = api
+    response = client.get("/api/scholarships/missing", headers=AUTH_HEADERS)
+    assert response.status_code == 404
+    assert response.get_json() == {"error": "Scholarship not found"}
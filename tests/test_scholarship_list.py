@@ -0,0 +1,118 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_scholarship_list.py
+PURPOSE: Eligibility filtering of GET /api/scholarships/
+         (app/routes/scholarships.py): exact, case-insensitive matching on
+         the same eligibility row, served without per-scholarship queries.
+"""
+
+import pytest
+
+from app.routes.scholarships import _index_eligibility, _match_eligibility
+from fake_supabase import FakeSupabase, fake_api, AUTH_HEADERS
+
+ROWS = [
+    {"scholarship_id": "s-sc",     "community": "SC",     "gender": "Female", "education_level": "Degree"},
+    {"scholarship_id": "s-sc-obc", "community": "SC/OBC", "gender": "Any",    "education_level": "Degree"},
+    {"scholarship_id": "s-two",    "community": "ST",     "gender": "Male",   "education_level": "PG"},
+    {"scholarship_id": "s-two",    "community": "Muslim", "gender": "Female", "education_level": "Degree"},
+    {"scholarship_id": "s-blank",  "community": None,     "gender": " Male ", "education_level": ""},
+]
+
+
+@pytest.fixture(scope="module")
+def indexed():
+    return _index_eligibility(ROWS)
+
+
+# ── Index ──────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("filters, expected", [
+    ({"community": "SC"},                            {"s-sc"}),
+    ({"community": "sc"},                            {"s-sc"}),
+    ({"community": "  Sc "},                         {"s-sc"}),
+    ({"community": "SC/OBC"},                        {"s-sc-obc"}),
+    ({"community": "OBC"},                           set()),
+    ({"gender": "female"},                           {"s-sc", "s-two"}),
+    ({"gender": "male"},                             {"s-two", "s-blank"}),
+    ({"community": "SC", "education_level": "PG"},   set()),
+    ({"education_level": "degree"},                  {"s-sc", "s-sc-obc", "s-two"}),
+])
+def test_match_is_exact_and_case_insensitive(indexed, filters, expected):
+    assert _match_eligibility(indexed, filters) == expected
+
+
+def test_all_filters_must_hold_on_the_same_row(indexed):
+    # s-two has an ST row and a Female row, but no ST + Female row
+    assert _match_eligibility(indexed, {"community": "ST", "gender": "Female"}) == set()
+    assert _match_eligibility(indexed, {"community": "Muslim", "gender": "Female"}) == {"s-two"}
+
+
+def test_no_filters_match_nothing(indexed):
+    # The route skips the index when no filter is given
+    assert _match_eligibility(indexed, {}) == set()
+
+
+def test_index_positions_point_at_owners():
+    owners, index = _index_eligibility(ROWS)
+    assert owners == [row["scholarship_id"] for row in ROWS]
+    assert index[("community", "sc/obc")] == {1}
+    assert index[("community", "")] == {4}
+    assert index[("gender", "male")] == {2, 4}
+
+
+# ── Endpoint ───────────────────────────────────────────────────────
+
+def _scholarship(s_id: str, deadline: str | None, **overrides) -> dict:
+    return {
+        "id": s_id, "name": f"Scholarship {s_id}", "description": "", "deadline": deadline,
+        "income_limit": 0, "amount_min": 0, "amount_max": 0, "portal_url": "",
+        "is_active": True, "created_at": None, "updated_at": None, **overrides,
+    }
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake = FakeSupabase({
+        "scholarships": [
+            _scholarship("s-sc",     "2099-01-01"),
+            _scholarship("s-sc-obc", "2099-02-01"),
+            _scholarship("s-two",    "2099-03-01", income_limit=100000),
+            _scholarship("s-blank",  None),
+            _scholarship("s-none",   "2099-04-01"),   # no eligibility rows at all
+            _scholarship("s-off",    "2099-05-01", is_active=False),
+        ],
+        "eligibility": [dict(row, id=n) for n, row in enumerate(ROWS, 1)],
+    })
+    return fake_api(monkeypatch.setattr, fake, SCHOLARSHIP_SEARCH_MODE="substring"), fake
+
+
+def _ids(response) -> list[str]:
+    assert response.status_code == 200, response.get_json()
+    return [s["id"] for s in response.get_json()["scholarships"]]
+
+
+def test_unfiltered_list_keeps_rows_without_eligibility(api):
+    client, _ = api
+    assert _ids(client.get("/api/scholarships/", headers=AUTH_HEADERS)) == [
+        "s-sc", "s-sc-obc", "s-two", "s-none", "s-blank"
+    ]
+
+
+def test_community_filter_is_exact(api):
+    client, _ = api
+    assert _ids(client.get("/api/scholarships/?community=sc", headers=AUTH_HEADERS)) == ["s-sc"]
+
+
+def test_filters_combine_with_income(api):
+    client, _ = api
+    url = "/api/scholarships/?gender=Female&education=Degree&income=200000"
+    assert _ids(client.get(url, headers=AUTH_HEADERS)) == ["s-sc"]
+
+
+def test_filtered_browse_reads_the_catalog_once(api):
+    client, fake = api
+    for url in ("/api/scholarships/?community=SC", "/api/scholarships/?gender=Male", "/api/scholarships/"):
+        client.get(url, headers=AUTH_HEADERS)
+    # One snapshot load; no eligibility query per scholarship
+    assert [table for table, _ in fake.queries] == ["scholarships"]
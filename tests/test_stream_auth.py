@@ -0,0 +1,71 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_stream_auth.py
+PURPOSE: ?access_token= is only honoured on views marked allow_query_token
+         (app/middleware/auth.py), and the alert stream cap leaves threads
+         for other requests (app/services/notification_hub.py).
+"""
+
+import pytest
+from flask import Flask, g, jsonify
+
+from app.middleware import auth
+from app.middleware.auth import login_required, allow_query_token
+from app.services.notification_hub import max_streams_for_worker
+
+SSE = {"Accept": "text/event-stream"}
+
+
+class _User:
+    id = "user-1"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(auth, "verify_access_token", lambda token: _User() if token == "good" else None)
+    app = Flask(__name__)
+    app.config["AUTH_REMOTE_FALLBACK"] = False
+
+    @app.route("/plain")
+    @login_required
+    def plain():
+        return jsonify({"user": g.user.id})
+
+    @app.route("/stream")
+    @login_required
+    @allow_query_token
+    def stream():
+        return jsonify({"user": g.user.id})
+
+    return app.test_client()
+
+
+def test_header_token_works_everywhere(client):
+    headers = {"Authorization": "Bearer good"}
+    assert client.get("/plain", headers=headers).status_code == 200
+    assert client.get("/stream", headers=headers).status_code == 200
+
+
+def test_query_token_accepted_on_marked_stream_view(client):
+    assert client.get("/stream?access_token=good", headers=SSE).status_code == 200
+
+
+def test_query_token_ignored_on_other_views(client):
+    response = client.get("/plain?access_token=good", headers=SSE)
+    assert response.status_code == 401
+    assert response.get_json()["error"] == "Missing authorization token"
+
+
+def test_query_token_needs_event_stream_accept(client):
+    assert client.get("/stream?access_token=good").status_code == 401
+
+
+@pytest.mark.parametrize("configured, threads, reserved, expected", [
+    (50, None, 8, 50),    # dev server / async worker: configured cap
+    (50, 64, 8, 50),      # plenty of threads
+    (50, 32, 8, 24),      # cap lowered to leave 8 threads free
+    (50, 1, 8, 0),        # sync worker: no streams
+    (50, 8, 8, 0),
+])
+def test_stream_cap_from_worker_threads(configured, threads, reserved, expected):
+    assert max_streams_for_worker(configured, threads, reserved) == expected
@@ -0,0 +1,133 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/test_suggest.py
+PURPOSE: Typeahead prefix index (app/services/suggest.py): name, initials
+         and alias matching on the seed catalog, ranking and limits, and
+         one rebuild per catalog version.
+"""
+
+import pytest
+
+from app.services import suggest
+from app.services.catalog import ScholarshipRecord
+from app.services.suggest import SuggestIndex, normalize
+from seed_catalog import load_seed_catalog
+
+
+def make_records(rows: list[dict]) -> list[ScholarshipRecord]:
+    """Catalog records in listing order, as get_catalog() holds them."""
+    return sorted((ScholarshipRecord(row, [], [], [], "") for row in rows), key=lambda r: r.sort_key)
+
+
+@pytest.fixture(scope="module")
+def index():
+    return SuggestIndex(make_records(load_seed_catalog()["scholarships"]))
+
+
+def names(suggestions: list[dict]) -> list[str]:
+    return [s["name"] for s in suggestions]
+
+
+# ── Matching ───────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("query", ["APJ", "apj", "manf", "rgnf"])
+def test_initials(index, query):
+    expected = {
+        "apj":  ["APJ Abdul Kalam Scholarship"],
+        "manf": ["Maulana Azad National Fellowship"],
+        "rgnf": ["Rajiv Gandhi National Fellowship (SC/ST)"],
+    }[query.lower()]
+    assert names(index.suggest(query)) == expected
+
+
+def test_name_prefix_from_the_first_word(index):
+    assert names(index.suggest("post m")) == [
+        "Post Matric Scholarship for Minorities",
+        "Post Matric Scholarship for SC/ST Students",
+        "Post Matric Scholarship for OBC Students",
+    ]
+
+
+def test_name_prefix_from_a_later_word(index):
+    found = names(index.suggest("matric"))
+    assert len(found) == 6
+    assert all("Matric" in name for name in found)
+
+
+@pytest.mark.parametrize("query", ["e-grants", "E Grantz", "egrantz", "EGRA"])
+def test_spelling_variants_share_a_key(index, query):
+    assert names(index.suggest(query)) == ["E-Grantz Scholarship (Kerala)", "E-Grantz OBC Scholarship (Kerala)"]
+
+
+def test_name_and_portal_aliases(index):
+    assert names(index.suggest("jrf")) == ["UGC Junior Research Fellowship (JRF)", "CSIR Junior Research Fellowship"]
+    assert names(index.suggest("mcm")) == ["Merit-cum-Means Scholarship (Minority)"]
+    # "nsp": every scholarship on scholarships.gov.in
+    found = index.suggest("nsp", 10)
+    assert len(found) == 10
+    assert {s["id"] for s in found} <= {
+        s["id"] for s in load_seed_catalog()["scholarships"] if "scholarships.gov.in" in s["portal_url"]
+    }
+
+
+@pytest.mark.parametrize("query", ["", "   ", "-", "xyz", "apjx"])
+def test_no_suggestions(index, query):
+    assert index.suggest(query) == []
+
+
+def test_normalize():
+    assert normalize("E-Grantz ") == normalize("e grantz") == "egrantz"
+    assert normalize(None) == ""
+
+
+# ── Ranking and limits ─────────────────────────────────────────────
+
+def _row(s_id: str, name: str, deadline: str | None, portal_url: str = "") -> dict:
+    return {"id": s_id, "name": name, "deadline": deadline, "portal_url": portal_url}
+
+
+def test_name_start_then_alias_then_later_word_then_deadline():
+    index = SuggestIndex(make_records([
+        _row("word",       "State Merit Award for Kannur",  "2025-01-01"),
+        _row("alias",      "Higher Studies Grant",          "2025-02-01", "https://kshec.kerala.gov.in"),
+        _row("start-old",  "KSHEC Merit Scholarship",       "2025-03-01"),
+        _row("start-new",  "KSHEC Innovation Scholarship",  "2025-04-01"),
+        _row("start-none", "KSHEC Travel Grant",            None),
+    ]))
+    assert [s["id"] for s in index.suggest("k")] == ["start-old", "start-new", "start-none", "alias", "word"]
+    assert [s["id"] for s in index.suggest("kshec")] == ["start-old", "start-new", "start-none", "alias"]
+
+
+def test_a_scholarship_appears_once_at_its_best_rank():
+    index = SuggestIndex(make_records([
+        _row("a", "Merit Merit Award", "2025-01-01"),
+        _row("b", "Award for Merit",   "2024-01-01"),
+    ]))
+    assert [s["id"] for s in index.suggest("merit")] == ["a", "b"]
+
+
+def test_limit_and_max_results():
+    rows  = [_row(f"s{n:02d}", f"Scholarship {n:02d}", f"2025-01-{n + 1:02d}") for n in range(15)]
+    index = SuggestIndex(make_records(rows), max_results=10)
+    assert [s["id"] for s in index.suggest("scholarship", 3)] == ["s00", "s01", "s02"]
+    assert len(index.suggest("scholarship", 50)) == 10
+    assert index.suggest("s")[0] == {"id": "s00", "name": "Scholarship 00"}
+
+
+# ── Rebuild per catalog version ────────────────────────────────────
+
+def test_index_is_rebuilt_only_when_the_catalog_version_changes(monkeypatch):
+    snapshot = {"version": 1, "records": make_records([_row("old", "Old Scholarship", None)])}
+    monkeypatch.setattr(suggest, "get_catalog", lambda: snapshot)
+    monkeypatch.setattr(suggest, "_index", None)
+    monkeypatch.setattr(suggest, "_index_version", None)
+
+    first = suggest.get_suggest_index()
+    assert suggest.get_suggest_index() is first
+    assert names(first.suggest("old")) == ["Old Scholarship"]
+
+    snapshot = {"version": 2, "records": make_records([_row("new", "New Scholarship", None)])}
+    second = suggest.get_suggest_index()
+    assert second is not first
+    assert second.suggest("old") == []
+    assert names(second.suggest("new")) == ["New Scholarship"]
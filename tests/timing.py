@@ -0,0 +1,32 @@
+"""
+KeralaSeva AI – Scholarship Navigator
+FILE: tests/timing.py
+PURPOSE: Latency sampling for the bench_*.py scripts: run a call many
+         times and report p50 / p95.
+"""
+
+import time
+from typing import Callable
+
+
+def sample(call: Callable, runs: int) -> list[float]:
+    """Seconds taken by each of runs calls."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def describe(samples: list[float]) -> str:
+    """"p50 1.23 ms, p95 4.56 ms" – microseconds below 0.1 ms."""
+    p50, p95 = percentile(samples, 50), percentile(samples, 95)
+    if p95 < 1e-4:
+        return f"p50 {p50 * 1e6:.2f} µs, p95 {p95 * 1e6:.2f} µs"
+    return f"p50 {p50 * 1000:.2f} ms, p95 {p95 * 1000:.2f} ms"